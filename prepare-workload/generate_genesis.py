@@ -9,6 +9,8 @@ Takes a pre-generated genesis ledger (with funded accounts but empty amendments)
 and injects all supported amendment hashes derived from rippled's features.macro.
 
 Amendment hashes are SHA-512Half of the amendment name — no xrpld binary needed.
+They are cached per features.macro content hash, and the ledger is written compact
+(``--indent`` for a human-readable copy).
 
 Usage:
     uv run prepare-workload/generate_genesis.py \
@@ -21,11 +23,14 @@ Usage:
 import argparse
 import hashlib
 import json
+import os
 import re
 import shutil
 import sys
 from pathlib import Path
 
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "prepare-workload"
+
 
 def sha512half(name: str) -> str:
     """Compute SHA-512Half of a string — the algorithm xrpld uses for amendment IDs."""
@@ -51,6 +56,23 @@ def parse_features_macro(macro_path: Path) -> list[str]:
     return sorted(amendments)
 
 
+def amendment_hashes_for(macro_path: Path) -> list[str]:
+    """Sorted amendment hashes for a features.macro, cached by the file's content hash."""
+    content = macro_path.read_bytes()
+    cache_file = CACHE_DIR / f"amendments-{hashlib.sha256(content).hexdigest()[:16]}.json"
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+    hashes = sorted(sha512half(name) for name in parse_features_macro(macro_path))
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(hashes, separators=(",", ":")))
+    except OSError:
+        pass  # a read-only cache only costs the recompute
+    return hashes
+
+
 def main():
     parser = argparse.ArgumentParser(description="Inject amendments into a pre-generated genesis ledger")
     parser.add_argument(
@@ -77,6 +99,12 @@ def main():
         default=Path("testnet"),
         help="Output directory for prepared files",
     )
+    parser.add_argument(
+        "--indent",
+        type=int,
+        default=None,
+        help="Pretty-print the output ledger with this indent (default: compact)",
+    )
     args = parser.parse_args()
 
     for path, name in [
@@ -88,8 +116,7 @@ def main():
             sys.exit(f"{name} not found: {path}")
 
     # Parse amendment names and compute hashes
-    amendment_names = parse_features_macro(args.features_macro)
-    amendment_hashes = sorted(sha512half(name) for name in amendment_names)
+    amendment_hashes = amendment_hashes_for(args.features_macro)
     print(f"Computed {len(amendment_hashes)} amendment hashes from {args.features_macro.name}")
 
     # Load and patch the genesis ledger
@@ -105,7 +132,8 @@ def main():
     args.output_dir.mkdir(parents=True, exist_ok=True)
 
     ledger_out = args.output_dir / "genesis_ledger.json"
-    ledger_out.write_text(json.dumps(ledger, indent=2))
+    separators = None if args.indent is not None else (",", ":")
+    ledger_out.write_text(json.dumps(ledger, indent=args.indent, separators=separators))
 
     accounts_out = args.output_dir / "accounts.json"
     shutil.copy(args.accounts, accounts_out)
@@ -0,0 +1,454 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.13"
+# dependencies = [
+#     "xrpl-py",
+# ]
+# ///
+"""Generate a synthetic genesis ledger with a large pre-funded account population.
+
+Starts from the shipped genesis ledger (FeeSettings, Amendments, LedgerHashes, the genesis
+account and its ~100 funded accounts) and appends N synthetic AccountRoots funded out of the
+genesis account's balance. It can also pre-create state that would otherwise cost a setup phase
+of transactions:
+
+- trust lines from every holder to ``--trust-lines`` of the ``--issuers`` (holder-side reserve
+  and NoRipple, issuers get DefaultRipple), each holding ``--iou-balance``;
+- ``--mpt-issuances`` MPTokenIssuances per issuer;
+- ``--offers`` IOU->XRP offers per holder, spread over a few price levels;
+
+with every object linked into its owner directory (and book directory) exactly where rippled
+would put it, so the ledger loads and the objects can be modified and deleted normally.
+
+Keys come from ``--seed`` (deterministic: the same seed gives the same population) and are
+derived in a process pool -- derivation is the only expensive part. Ledger and accounts are
+streamed to disk one entry per line, never held in memory whole; ``--accounts-format ndjson``
+writes the account list as one ``{"address", "seed"}`` object per line.
+
+Usage:
+    uv run prepare-workload/generate_synthetic_genesis.py \
+        --accounts-count 100000 --issuers 8 --trust-lines 2 --offers 1 \
+        --features-macro /path/to/features.macro --output-dir testnet
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from xrpl import CryptoAlgorithm
+from xrpl.core import keypairs
+from xrpl.core.addresscodec import decode_classic_address
+
+from generate_genesis import amendment_hashes_for
+
+ACCOUNT_ONE = "rrrrrrrrrrrrrrrrrrrrBZbvji"  # issuer field of a RippleState Balance
+ZERO_HASH = "0" * 64
+DIR_PAGE_SIZE = 32  # rippled's dirNodeMaxEntries
+CHUNK = 1000  # accounts per pool task
+
+# Ledger entry namespace prefixes (rippled's LedgerNameSpace).
+NS_ACCOUNT = b"\x00a"
+NS_OWNER_DIR = b"\x00O"
+NS_DIR_NODE = b"\x00d"
+NS_TRUST_LINE = b"\x00r"
+NS_OFFER = b"\x00o"
+NS_BOOK_DIR = b"\x00B"
+NS_MPT_ISSUANCE = b"\x00~"
+
+LSF_DEFAULT_RIPPLE = 0x00800000
+LSF_LOW_RESERVE = 0x00010000
+LSF_HIGH_RESERVE = 0x00020000
+LSF_LOW_NO_RIPPLE = 0x00100000
+LSF_HIGH_NO_RIPPLE = 0x00200000
+LSF_MPT_CAN_TRADE = 0x00000010
+LSF_MPT_CAN_TRANSFER = 0x00000020
+
+CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CNY", "AUD", "CAD", "CHF"]
+PRICE_LEVELS = [900_000, 1_000_000, 1_100_000, 1_250_000]  # drops per IOU unit
+
+
+def sha512half(data: bytes) -> bytes:
+    return hashlib.sha512(data).digest()[:32]
+
+
+def currency_code(i: int) -> str:
+    if i < len(CURRENCIES):
+        return CURRENCIES[i]
+    i -= len(CURRENCIES)
+    return "X" + chr(65 + i // 26 % 26) + chr(65 + i % 26)
+
+
+def currency_bytes(code: str) -> bytes:
+    return bytes(12) + code.encode("ascii") + bytes(5)
+
+
+def page_key(root: bytes, page: int) -> bytes:
+    return root if page == 0 else sha512half(NS_DIR_NODE + root + page.to_bytes(8, "big"))
+
+
+def book_base(pays_cur: bytes, gets_cur: bytes, pays_iss: bytes, gets_iss: bytes) -> bytes:
+    return sha512half(NS_BOOK_DIR + pays_cur + gets_cur + pays_iss + gets_iss)[:24]
+
+
+def _canonical(mantissa: int, exponent: int) -> tuple[int, int]:
+    while mantissa < 10**15:
+        mantissa *= 10
+        exponent -= 1
+    while mantissa >= 10**16:
+        mantissa //= 10
+        exponent += 1
+    return mantissa, exponent
+
+
+def offer_quality(pays_drops: int, gets_value: int) -> int:
+    """Offer quality as rippled's getRate(TakerGets, TakerPays) packs it: in/out, normalized."""
+    num, num_exp = _canonical(pays_drops, 0)
+    den, den_exp = _canonical(gets_value, 0)
+    mantissa, exponent = _canonical(num * 10**17 // den + 5, num_exp - den_exp - 17)
+    return ((exponent + 100) << 56) | mantissa
+
+
+def derive(task: tuple[str, int, int, str]) -> list[tuple[str, str]]:
+    """Pool worker: (address, family seed) for accounts ``start .. start+count``."""
+    seed, start, count, algo = task
+    algorithm = CryptoAlgorithm[algo]
+    out = []
+    for i in range(start, start + count):
+        entropy = hashlib.sha512(f"{seed}:account:{i}".encode()).hexdigest()[:32]
+        family_seed = keypairs.generate_seed(entropy=entropy, algorithm=algorithm)
+        public_key, _ = keypairs.derive_keypair(family_seed, algorithm=algorithm)
+        out.append((keypairs.derive_classic_address(public_key), family_seed))
+    return out
+
+
+@dataclass
+class Directory:
+    """An owner or book directory being filled in insertion order, paged like rippled's."""
+
+    root: bytes
+    fields: dict
+    entries: list[bytes] = field(default_factory=list)
+
+    def add(self, key: bytes) -> str:
+        """Append ``key``; returns the page it lands on, as the hex OwnerNode/BookNode value."""
+        self.entries.append(key)
+        return format((len(self.entries) - 1) // DIR_PAGE_SIZE, "x")
+
+    def pages(self, sort: bool) -> list[dict]:
+        n = max(1, -(-len(self.entries) // DIR_PAGE_SIZE))
+        out = []
+        for page in range(n):
+            chunk = self.entries[page * DIR_PAGE_SIZE : (page + 1) * DIR_PAGE_SIZE]
+            sle = {
+                "Flags": 0,
+                "Indexes": [k.hex().upper() for k in (sorted(chunk) if sort else chunk)],
+                "LedgerEntryType": "DirectoryNode",
+                "RootIndex": self.root.hex().upper(),
+                **self.fields,
+                "index": page_key(self.root, page).hex().upper(),
+            }
+            if page == 0 and n > 1:
+                sle["IndexPrevious"] = format(n - 1, "x")
+            if page > 1:
+                sle["IndexPrevious"] = format(page - 1, "x")
+            if page + 1 < n:
+                sle["IndexNext"] = format(page + 1, "x")
+            out.append(sle)
+        return out
+
+
+def owner_directory(account_id: bytes, address: str) -> Directory:
+    return Directory(sha512half(NS_OWNER_DIR + account_id), {"Owner": address})
+
+
+class LedgerWriter:
+    """Streams ``{"ledger": {..., "accountState": [...]}}`` one SLE per line."""
+
+    def __init__(self, path: Path, header: dict) -> None:
+        """Open ``path`` and write everything before the first SLE."""
+        self.fh = path.open("w")
+        head = json.dumps({"ledger": header}, separators=(",", ":"))
+        self.fh.write(head[:-2] + ',"accountState":[\n')
+        self.count = 0
+
+    def write(self, sle: dict) -> None:
+        self.fh.write(("," if self.count else "") + json.dumps(sle, separators=(",", ":")) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self.fh.write("]}}\n")
+        self.fh.close()
+
+
+class AccountsWriter:
+    """Streams the workload's account list, as a JSON array or as NDJSON."""
+
+    def __init__(self, path: Path, fmt: str) -> None:
+        """Open ``path``; ``fmt`` is ``json`` or ``ndjson``."""
+        self.fh = path.open("w")
+        self.ndjson = fmt == "ndjson"
+        self.count = 0
+        if not self.ndjson:
+            self.fh.write("[\n")
+
+    def write(self, address: str, seed: str) -> None:
+        line = json.dumps({"address": address, "seed": seed}, separators=(",", ":"))
+        sep = "" if self.ndjson or not self.count else ","
+        self.fh.write(sep + line + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        if not self.ndjson:
+            self.fh.write("]\n")
+        self.fh.close()
+
+
+def account_root(address: str, balance: int, sequence: int, owner_count: int, flags: int, lgr_seq: int) -> dict:
+    return {
+        "Account": address,
+        "Balance": str(balance),
+        "Flags": flags,
+        "LedgerEntryType": "AccountRoot",
+        "OwnerCount": owner_count,
+        "PreviousTxnID": ZERO_HASH,
+        "PreviousTxnLgrSeq": lgr_seq,
+        "Sequence": sequence,
+        "index": sha512half(NS_ACCOUNT + decode_classic_address(address)).hex().upper(),
+    }
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Generate a synthetic genesis ledger with a large funded population")
+    p.add_argument("--accounts-count", type=int, required=True, help="Synthetic accounts to create")
+    p.add_argument("--balance", type=int, default=100_000_000_000, help="Drops per synthetic account")
+    p.add_argument("--issuers", type=int, default=0, help="Synthetic accounts that act as IOU/MPT issuers")
+    p.add_argument("--trust-lines", type=int, default=0, help="Trust lines per holder (to distinct issuers)")
+    p.add_argument("--iou-balance", type=int, default=1000, help="IOU units each trust line holds")
+    p.add_argument("--mpt-issuances", type=int, default=0, help="MPTokenIssuances per issuer")
+    p.add_argument("--offers", type=int, default=0, help="IOU->XRP offers per holder (needs --trust-lines)")
+    p.add_argument("--seed", default="synthetic-genesis", help="Key derivation seed (same seed, same accounts)")
+    p.add_argument("--algorithm", default="SECP256K1", choices=[a.name for a in CryptoAlgorithm])
+    p.add_argument("--procs", type=int, default=None, help="Key derivation processes (default: CPU count)")
+    p.add_argument("--genesis", type=Path, default=Path("genesis/genesis_ledger.json"), help="Base genesis ledger")
+    p.add_argument("--accounts", type=Path, default=Path("genesis/accounts.json"), help="Base accounts JSON")
+    p.add_argument("--features-macro", type=Path, help="Inject amendments from rippled's features.macro")
+    p.add_argument("--accounts-format", choices=["json", "ndjson"], default="json")
+    p.add_argument("--output-dir", type=Path, default=Path("testnet"), help="Output directory")
+    args = p.parse_args()
+    if args.issuers > args.accounts_count:
+        p.error("--issuers cannot exceed --accounts-count")
+    if args.trust_lines > args.issuers:
+        p.error("--trust-lines cannot exceed --issuers")
+    if args.offers and not args.trust_lines:
+        p.error("--offers needs --trust-lines (holders sell the IOUs they hold)")
+    if args.issuers > CHUNK:
+        p.error(f"--issuers cannot exceed {CHUNK}")
+    return args
+
+
+class Population:
+    """Writes the synthetic accounts' SLEs, tracking the directories that outlive one account."""
+
+    def __init__(self, args, ledger_out: LedgerWriter, lgr_seq: int) -> None:
+        """Accounts are created in ledger ``lgr_seq``, so their sequences start there."""
+        self.args = args
+        self.out = ledger_out
+        self.lgr_seq = lgr_seq
+        self.rng = random.Random(args.seed)
+        self.issuers: list[tuple[str, bytes, str]] = []  # (address, account id, currency)
+        self.issuer_dirs: list[Directory] = []
+        self.books: dict[tuple[int, int], Directory] = {}  # (issuer, quality) -> book directory
+        self.counts: dict[str, int] = defaultdict(int)
+
+    def add(self, index: int, address: str) -> None:
+        account_id = decode_classic_address(address)
+        if index < self.args.issuers:
+            self.issuer(index, address, account_id)
+        else:
+            self.holder(index, address, account_id)
+
+    def issuer(self, index: int, address: str, account_id: bytes) -> None:
+        directory = owner_directory(account_id, address)
+        self.issuers.append((address, account_id, currency_code(index)))
+        self.issuer_dirs.append(directory)
+        sequence = self.lgr_seq  # accounts created in this ledger start at its index
+        for _ in range(self.args.mpt_issuances):
+            key = sha512half(NS_MPT_ISSUANCE + sequence.to_bytes(4, "big") + account_id)
+            self.out.write(
+                {
+                    "Flags": LSF_MPT_CAN_TRADE | LSF_MPT_CAN_TRANSFER,
+                    "Issuer": address,
+                    "LedgerEntryType": "MPTokenIssuance",
+                    "OutstandingAmount": "0",
+                    "OwnerNode": directory.add(key),
+                    "PreviousTxnID": ZERO_HASH,
+                    "PreviousTxnLgrSeq": self.lgr_seq,
+                    "Sequence": sequence,
+                    "index": key.hex().upper(),
+                }
+            )
+            sequence += 1
+            self.counts["mpts"] += 1
+        owned = self.args.mpt_issuances  # trust lines reserve on the holder side only
+        self.out.write(account_root(address, self.args.balance, sequence, owned, LSF_DEFAULT_RIPPLE, self.lgr_seq))
+
+    def trust_line(self, directory: Directory, address: str, account_id: bytes, which: int) -> None:
+        issuer, issuer_id, code = self.issuers[which]
+        holder_low = account_id < issuer_id
+        low_id, high_id = (account_id, issuer_id) if holder_low else (issuer_id, account_id)
+        key = sha512half(NS_TRUST_LINE + low_id + high_id + currency_bytes(code))
+        holder_node, issuer_node = directory.add(key), self.issuer_dirs[which].add(key)
+        limit = str(self.args.iou_balance * 10)
+        if holder_low:
+            flags, value = LSF_LOW_RESERVE | LSF_LOW_NO_RIPPLE, str(self.args.iou_balance)
+            low = (address, limit, holder_node)
+            high = (issuer, "0", issuer_node)
+        else:
+            flags, value = LSF_HIGH_RESERVE | LSF_HIGH_NO_RIPPLE, str(-self.args.iou_balance)
+            low = (issuer, "0", issuer_node)
+            high = (address, limit, holder_node)
+        self.out.write(
+            {
+                "Balance": {"currency": code, "issuer": ACCOUNT_ONE, "value": value},
+                "Flags": flags,
+                "HighLimit": {"currency": code, "issuer": high[0], "value": high[1]},
+                "HighNode": high[2],
+                "LedgerEntryType": "RippleState",
+                "LowLimit": {"currency": code, "issuer": low[0], "value": low[1]},
+                "LowNode": low[2],
+                "PreviousTxnID": ZERO_HASH,
+                "PreviousTxnLgrSeq": self.lgr_seq,
+                "index": key.hex().upper(),
+            }
+        )
+        self.counts["lines"] += 1
+
+    def book(self, which: int, quality: int) -> Directory:
+        if (which, quality) not in self.books:
+            _, issuer_id, code = self.issuers[which]
+            cur = currency_bytes(code)
+            xrp = bytes(20)
+            fields = {
+                "ExchangeRate": format(quality, "x"),
+                "TakerGetsCurrency": cur.hex().upper(),
+                "TakerGetsIssuer": issuer_id.hex().upper(),
+                "TakerPaysCurrency": xrp.hex().upper(),
+                "TakerPaysIssuer": xrp.hex().upper(),
+            }
+            root = book_base(xrp, cur, xrp, issuer_id) + quality.to_bytes(8, "big")
+            self.books[(which, quality)] = Directory(root, fields)
+        return self.books[(which, quality)]
+
+    def offer(self, directory: Directory, address: str, account_id: bytes, which: int, sequence: int) -> None:
+        issuer, _, code = self.issuers[which]
+        gets = max(1, self.args.iou_balance // (self.args.offers * 10))
+        pays = gets * self.rng.choice(PRICE_LEVELS)
+        book = self.book(which, offer_quality(pays, gets))
+        key = sha512half(NS_OFFER + account_id + sequence.to_bytes(4, "big"))
+        self.out.write(
+            {
+                "Account": address,
+                "BookDirectory": book.root.hex().upper(),
+                "BookNode": book.add(key),
+                "Flags": 0,
+                "LedgerEntryType": "Offer",
+                "OwnerNode": directory.add(key),
+                "PreviousTxnID": ZERO_HASH,
+                "PreviousTxnLgrSeq": self.lgr_seq,
+                "Sequence": sequence,
+                "TakerGets": {"currency": code, "issuer": issuer, "value": str(gets)},
+                "TakerPays": str(pays),
+                "index": key.hex().upper(),
+            }
+        )
+        self.counts["offers"] += 1
+
+    def holder(self, index: int, address: str, account_id: bytes) -> None:
+        directory = owner_directory(account_id, address)
+        first = index % len(self.issuers) if self.issuers else 0
+        for j in range(self.args.trust_lines):
+            self.trust_line(directory, address, account_id, (first + j) % len(self.issuers))
+        sequence = self.lgr_seq
+        for _ in range(self.args.offers):
+            self.offer(directory, address, account_id, first, sequence)  # sells its first line's IOU
+            sequence += 1
+        owned = len(directory.entries)
+        self.out.write(account_root(address, self.args.balance, sequence, owned, 0, self.lgr_seq))
+        if owned:
+            for sle in directory.pages(sort=True):
+                self.out.write(sle)
+
+    def finish(self) -> None:
+        """Write the directories that filled up across the whole population."""
+        for directory in self.issuer_dirs:
+            if directory.entries:
+                for sle in directory.pages(sort=True):
+                    self.out.write(sle)
+        for directory in self.books.values():
+            for sle in directory.pages(sort=False):
+                self.out.write(sle)
+
+
+def main():
+    args = parse_args()
+    for path in (args.genesis, args.accounts, args.features_macro):
+        if path is not None and not path.exists():
+            sys.exit(f"not found: {path}")
+
+    ledger = json.loads(args.genesis.read_text())["ledger"]
+    base_state = ledger.pop("accountState")
+    if args.features_macro is not None:
+        for sle in base_state:
+            if sle.get("LedgerEntryType") == "Amendments":
+                sle["Amendments"] = amendment_hashes_for(args.features_macro)
+    roots = [s for s in base_state if s.get("LedgerEntryType") == "AccountRoot"]
+    genesis_root = max(roots, key=lambda s: int(s["Balance"]))
+    funding = args.balance * args.accounts_count
+    if int(genesis_root["Balance"]) - funding < 10**12:
+        sys.exit(f"genesis account cannot fund {args.accounts_count} x {args.balance} drops")
+    genesis_root["Balance"] = str(int(genesis_root["Balance"]) - funding)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    ledger_out = LedgerWriter(args.output_dir / "genesis_ledger.json", ledger)
+    accounts_name = "accounts.ndjson" if args.accounts_format == "ndjson" else "accounts.json"
+    accounts_out = AccountsWriter(args.output_dir / accounts_name, args.accounts_format)
+    for sle in base_state:
+        ledger_out.write(sle)
+    for entry in json.loads(args.accounts.read_text()):
+        accounts_out.write(entry["address"], entry["seed"])
+
+    population = Population(args, ledger_out, int(ledger["ledger_index"]))
+    tasks = [
+        (args.seed, start, min(CHUNK, args.accounts_count - start), args.algorithm)
+        for start in range(0, args.accounts_count, CHUNK)
+    ]
+    index = 0
+    with ProcessPoolExecutor(args.procs) as pool:
+        for chunk in pool.map(derive, tasks):
+            for address, family_seed in chunk:
+                accounts_out.write(address, family_seed)
+                population.add(index, address)
+                index += 1
+            print(f"\r{index}/{args.accounts_count} accounts", end="", file=sys.stderr)
+    print(file=sys.stderr)
+    population.finish()
+    ledger_out.close()
+    accounts_out.close()
+
+    counts = population.counts
+    print(
+        f"Output: {args.output_dir / 'genesis_ledger.json'} ({ledger_out.count} SLEs: "
+        f"{args.accounts_count} synthetic accounts, {counts['lines']} trust lines, "
+        f"{counts['offers']} offers, {counts['mpts']} MPT issuances)"
+    )
+    print(f"Output: {args.output_dir / accounts_name} ({accounts_out.count} accounts)")
+
+
+if __name__ == "__main__":
+    main()
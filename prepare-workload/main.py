@@ -21,9 +21,10 @@ from prepare_workload.generate_unl import generate_unl_data
 from prepare_workload.settings import get_settings
 
 
-def generate_fuzzer_seed():
-    """Generate a seed for fuzzer node identity."""
-    return xrpl.core.keypairs.generate_seed(algorithm=xrpl.CryptoAlgorithm.SECP256K1)
+def generate_fuzzer_seed(keyset_seed: str | None = None, role: str = ""):
+    """Generate a seed for fuzzer node identity (deterministic when ``keyset_seed`` is set)."""
+    entropy = gl._entropy(keyset_seed, role, "node") if keyset_seed is not None else None
+    return xrpl.core.keypairs.generate_seed(entropy=entropy, algorithm=xrpl.CryptoAlgorithm.SECP256K1)
 
 
 def write_fuzzer_config(settings, num_validators, validator_public_keys, isolated_validator_keys):
@@ -32,8 +33,9 @@ def write_fuzzer_config(settings, num_validators, validator_public_keys, isolate
     fuzzer_config_dir.mkdir(parents=True, exist_ok=True)
 
     # Generate seeds for fuzzer
-    node_seed = generate_fuzzer_seed()
-    peer_seeds = [generate_fuzzer_seed() for _ in range(num_validators)]
+    keyset_seed = settings.network.keyset_seed or None
+    node_seed = generate_fuzzer_seed(keyset_seed, "fuzzer")
+    peer_seeds = [generate_fuzzer_seed(keyset_seed, f"fuzzer-peer{i}") for i in range(num_validators)]
 
     # Write fuzzer.cfg
     fuzzer_config_template = settings.template_dir_path / "fuzzer.cfg.mako"
@@ -128,6 +130,14 @@ def write_compose(node_config, settings):
     compose_file.write_text(compose_data)
 
 
+def write_nodes(node_config, settings):
+    nodes = {
+        "validators": sorted(v["name"] for v in node_config["validators"]),
+        "peers": sorted(p["name"] for p in node_config["peers"]),
+    }
+    (settings.network_dir_path / "nodes.json").write_text(json.dumps(nodes, separators=(",", ":")))
+
+
 def parse_args():
     parser = argparse.ArgumentParser(prog="PROG")
     parser.add_argument(
@@ -199,16 +209,22 @@ def main():
     node_configs = nc.get_node_configs(s)
     all_configs = [*node_configs["validators"], *node_configs["peers"]]
 
-    # If we're using a UNL we need a publisher
+    # Derive every keyset up front: one pool pass, cached when the topology is seeded.
+    # The publisher (if we're using a UNL) and the fuzzer's isolated validator ride along.
+    keyset_seed = s.network.keyset_seed or None
+    roles = [c["name"] for c in all_configs if c["is_validator"]]
+    roles += ["publisher"] if s.network.use_unl else []
+    roles += ["isolated"] if s.fuzzer.enabled else []
+    keysets = gl.gen_validators(roles, seed=keyset_seed)
     if s.network.use_unl:
-        publisher = gl.gen_validator()
+        publisher = keysets["publisher"]
 
     # Generate all the configs for the nodes in the network
     validator_public_keys = []
     validators = []
     for config in all_configs:
         if config["is_validator"]:
-            config["keys"] = gl.gen_validator()
+            config["keys"] = keysets[config["name"]]
             validators.append(config["keys"])
             validator_public_keys.append(config["keys"]["node_public_key"])
 
@@ -226,6 +242,9 @@ def main():
     # Write the compose file
     write_compose(node_configs, s)
 
+    # Write the node list the workload fans submits out over
+    write_nodes(node_configs, s)
+
     # Write the UNL
     if s.network.use_unl:
         unl_data = generate_unl_data(validators, publisher, sequence=1)
@@ -240,7 +259,7 @@ def main():
 
         # Generate validator identity for the isolated peer so it
         # participates in consensus like a real validator.
-        isolated_validator_keys = gl.gen_validator()
+        isolated_validator_keys = keysets["isolated"]
         isolated_validator_public_key = isolated_validator_keys["node_public_key"]
 
         # The isolated validator must be in every node's [validators] list
@@ -1,7 +1,10 @@
 import argparse
 import base64
 import binascii
+import hashlib
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -18,14 +21,30 @@ MAN_PREFIX = bytes.fromhex("4d414e00")  # b"MAN\0" ?
 EXPIRES = 366  # days
 ALGO = xrpl.CryptoAlgorithm.SECP256K1
 
+# Below this many keysets/manifests the pool's startup costs more than it saves.
+POOL_THRESHOLD = 8
+KEYSET_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "prepare-workload"
+
 
 def expires(days: int = EXPIRES):
     return xrpl.utils.datetime_to_ripple_time(datetime.now() + timedelta(days=days))
 
 
-def gen_validator(algo: xrpl.CryptoAlgorithm = ALGO):
-    master_seed = xrpl.core.keypairs.generate_seed(algorithm=algo)
-    signing_seed = xrpl.core.keypairs.generate_seed(algorithm=algo)
+def _entropy(seed: str, role: str, key: str) -> str:
+    """16 bytes of seed entropy for one key of ``role``, derived from the topology seed."""
+    return hashlib.sha512(f"{seed}:{role}:{key}".encode()).hexdigest()[:32]
+
+
+def gen_validator(algo: xrpl.CryptoAlgorithm = ALGO, seed: str | None = None, role: str = ""):
+    """Generate a validator keyset.
+
+    With ``seed`` the keyset is a pure function of (seed, role), so a topology can be
+    regenerated bit-for-bit; without it the keys are random.
+    """
+    master_entropy = _entropy(seed, role, "master") if seed is not None else None
+    signing_entropy = _entropy(seed, role, "signing") if seed is not None else None
+    master_seed = xrpl.core.keypairs.generate_seed(entropy=master_entropy, algorithm=algo)
+    signing_seed = xrpl.core.keypairs.generate_seed(entropy=signing_entropy, algorithm=algo)
     master_pubkey, master_privkey = xrpl.core.keypairs.derive_keypair(master_seed, validator=True, algorithm=algo)
     signing_pubkey, signing_privkey = xrpl.core.keypairs.derive_keypair(signing_seed, validator=True, algorithm=algo)
 
@@ -40,6 +59,41 @@ def gen_validator(algo: xrpl.CryptoAlgorithm = ALGO):
     }
 
 
+def _gen_validator_role(seed: str | None, role: str) -> dict:
+    return gen_validator(seed=seed, role=role)
+
+
+def _keyset_cache_file(seed: str) -> Path:
+    digest = hashlib.sha256(f"{ALGO.value}:{seed}".encode()).hexdigest()[:16]
+    return KEYSET_CACHE_DIR / f"keysets-{digest}.json"
+
+
+def gen_validators(roles: list[str], seed: str | None = None, processes: int | None = None) -> dict[str, dict]:
+    """Generate one keyset per role name, in a process pool when there are many.
+
+    Seeded keysets are deterministic, so they are also cached on disk (keyed by the seed)
+    and only roles missing from the cache are derived. Random keysets are never cached.
+    """
+    cache_file = _keyset_cache_file(seed) if seed is not None else None
+    cached: dict[str, dict] = {}
+    if cache_file is not None and cache_file.is_file():
+        try:
+            cached = json.loads(cache_file.read_text())
+        except ValueError:
+            cached = {}
+    todo = [r for r in roles if r not in cached]
+    if len(todo) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(processes) as pool:
+            fresh = list(pool.map(_gen_validator_role, [seed] * len(todo), todo))
+    else:
+        fresh = [_gen_validator_role(seed, r) for r in todo]
+    cached.update(zip(todo, fresh, strict=True))
+    if cache_file is not None and todo:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cached, separators=(",", ":")))
+    return {r: cached[r] for r in roles}
+
+
 def generate_validator_manifest(creds, sequence: int, domain: str | None = None):
     return gen_manifest(creds, sequence, domain, publisher=False)
 
@@ -101,9 +155,17 @@ def sign_unl_blob(publisher_creds, publisher_manifest_b64, validators, sequence,
     }
 
 
+def gen_manifests(validators: list[dict], sequence: int, processes: int | None = None) -> list[dict]:
+    """Validator manifests for ``validators``, signed in a process pool when there are many."""
+    if len(validators) < POOL_THRESHOLD:
+        return [generate_validator_manifest(v, sequence) for v in validators]
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(generate_validator_manifest, validators, [sequence] * len(validators)))
+
+
 def generate_unl_data(validators, publisher, sequence: int | None = None):
     sequence = sequence or 1
-    validators_entries = [generate_validator_manifest(v, sequence) for v in validators]
+    validators_entries = gen_manifests(validators, sequence)
     publisher_manifest_b64 = generate_publisher_manifest(publisher, sequence)
     return sign_unl_blob(
         publisher,
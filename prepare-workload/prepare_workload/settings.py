@@ -91,6 +91,9 @@ def get_settings(**overrides):
             "validator_list_sites": "http://unl",
             "validator_name": "val",
             "peer_name": "xrpld",
+            # Non-empty: derive every key from this seed, so the topology is reproducible
+            # (and its keysets are cached). Empty: fresh random keys each run.
+            "keyset_seed": "",
         },
         # Specific node instance configs
         "node_config": {
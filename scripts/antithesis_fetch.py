@@ -39,17 +39,31 @@ Key API facts this relies on (verified against the live API):
   ``event=died``, ``name``, ``container_exit_code``; faults ``source.name=fault_injector`` with
   ``fault{name,type,affected_nodes,details}``; container stdout has ``source.container`` +
   ``output_text``. Exit codes 0/137/143 are fault-injector stops/kills, not crashes.
+- Branch streams are fetched by ONE ``curl --parallel`` process (connection reuse, bodies written
+  straight to disk); each stream is handed to a process-pool parser the moment curl reports it
+  landed, so scanning overlaps fetching. ``--parallel``/``--procs`` bound both sides.
+- Every fetched stream is parsed ONCE into ``<cache-dir>/index.sqlite`` (stdlib sqlite3), one row
+  per line keyed by run, stream, vtime, container and assert id. ``sweep``, ``crashes`` and
+  ``query`` run as indexed queries against it instead of re-reading the NDJSON.
+- ``<cache-dir>/<run>/manifest.json`` makes reruns incremental: it records each landed stream
+  (moment + sha256), the properties of a *completed* run (keyed by ``completed_at``), and
+  per-``assert_substr`` sweep hits keyed by stream hash. A rerun only fetches and scans what
+  is new. Cached properties that have gone stale (a ``/logs`` 400) trigger one fresh fetch;
+  ``--refresh`` forces it.
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, NoReturn
 
@@ -89,7 +103,7 @@ def base_url() -> str:
 
 class Api:
     """Thin curl-backed client. The token is fed via a curl config on stdin so it never lands in
-    argv / process listings."""
+    argv / process listings. Bulk stream fetches go through :meth:`download`."""
 
     def __init__(self) -> None:
         self.base = base_url()
@@ -109,6 +123,43 @@ class Api:
         body, code = out[:nl], out[nl + 1 :].decode().strip()
         return int(code or 0), body
 
+    def download(self, jobs: list[tuple[str, Path]], parallel: int) -> Iterator[tuple[Path, int]]:
+        """Fetch ``(path, dest)`` pairs through one ``curl --parallel`` process, streaming each
+        body to ``dest``. Yields ``(dest, http_code)`` as each transfer completes (code 0 for a
+        transport failure); only a 200 with a non-empty body is kept on disk."""
+        if not jobs:
+            return
+        cfg = [f'header = "Authorization: Bearer {self.token}"']
+        part: dict[str, Path] = {}
+        for path, dest in jobs:
+            tmp = dest.with_name(dest.name + ".part")
+            part[str(tmp)] = dest
+            quoted = str(tmp).replace("\\", "\\\\").replace('"', '\\"')
+            cfg += [f'url = "{self.base}{path}"', f'output = "{quoted}"']
+        argv = ["curl", "-sS", "--no-progress-meter", "--parallel"]
+        argv += ["--parallel-max", str(max(1, parallel)), "-K", "-"]
+        argv += ["-w", "%{http_code} %{filename_effective}\n"]
+        proc = subprocess.Popen(argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        assert proc.stdin is not None and proc.stdout is not None
+        proc.stdin.write("\n".join(cfg) + "\n")
+        proc.stdin.close()
+        for line in proc.stdout:
+            code, _, name = line.rstrip("\n").partition(" ")
+            dest = part.pop(name, None)
+            if dest is None:
+                continue
+            tmp = Path(name)
+            ok = code == "200" and tmp.is_file() and tmp.stat().st_size > 0
+            if ok:
+                tmp.replace(dest)
+            else:
+                tmp.unlink(missing_ok=True)
+            yield dest, int(code) if code.isdigit() else 0
+        proc.wait()
+        for name, dest in part.items():  # never reported: curl bailed out before starting them
+            Path(name).unlink(missing_ok=True)
+            yield dest, 0
+
     def get_json(self, path: str) -> Any:
         code, body = self.get(path)
         if code != 200:
@@ -334,6 +385,304 @@ def cmd_fetch(api: Api, args: argparse.Namespace) -> None:
     print(f"  run.json  properties.json  failing.txt  {events_note}")
 
 
+# ── stream index ──────────────────────────────────────────────────────────────
+
+_INDEX_FILE = "index.sqlite"
+_INSERT_CHUNK = 5000  # rows per executemany; bounds memory while ingesting a large stream
+# top-level keys of a log line that are framing, not an SDK event name
+_FRAME_KEYS = {"moment", "source", "output_text", "antithesis_assert", "fault", "event"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS streams (
+    run_id TEXT, stream TEXT, input_hash TEXT, size INTEGER, mtime REAL, nlines INTEGER,
+    PRIMARY KEY (run_id, stream)
+);
+CREATE TABLE IF NOT EXISTS lines (
+    run_id TEXT, stream TEXT, seq INTEGER, vtime REAL, kind TEXT,
+    source TEXT, container TEXT, name TEXT, code INTEGER,
+    assert_id TEXT, condition INTEGER, text TEXT
+);
+"""
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS lines_pos ON lines (run_id, stream, seq);
+CREATE INDEX IF NOT EXISTS lines_assert ON lines (run_id, assert_id, condition);
+CREATE INDEX IF NOT EXISTS lines_kind ON lines (run_id, kind, vtime);
+CREATE INDEX IF NOT EXISTS lines_container ON lines (run_id, container, vtime);
+"""
+
+
+def open_index(cache_root: Path) -> sqlite3.Connection:
+    cache_root.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_root / _INDEX_FILE)
+    conn.executescript(_SCHEMA + _INDEXES)
+    return conn
+
+
+def _indexed(conn: sqlite3.Connection, rid: str, path: Path) -> bool:
+    """True if ``path`` is already indexed exactly as it is on disk."""
+    st = path.stat()
+    row = conn.execute(
+        "SELECT size, mtime FROM streams WHERE run_id=? AND stream=?", (rid, path.stem)
+    ).fetchone()
+    return row == (st.st_size, st.st_mtime)
+
+
+def _parse_line(line: str) -> tuple | None:
+    """One stream line -> (vtime, kind, source, container, name, code, assert_id, condition,
+    text), or None for lines without a moment. ``text`` is ``output_text`` for container
+    stdout (what every consumer reads) and the raw JSON line for everything else."""
+    try:
+        d = json.loads(line)
+        vt = float((d.get("moment") or {}).get("vtime", ""))
+    except (ValueError, AttributeError):
+        return None
+    src = d.get("source") or {}
+    source, container = src.get("name", ""), src.get("container") or None
+    name: str | None = None
+    code = assert_id = condition = None
+    text = line.rstrip("\n")
+    if source == "processes_terminated_with_signal":
+        kind = "signal"
+        try:
+            info = json.loads(d.get("output_text") or "{}")
+        except ValueError:
+            info = {}
+        name, code = info.get("executable", "?"), info.get("signal")
+    elif source == "containers_meta" and d.get("event") == "died":
+        kind, name, code = "death", d.get("name", "?"), d.get("container_exit_code")
+    elif source == "fault_injector" and "fault" in d:
+        kind = "fault"
+    elif "antithesis_assert" in d:
+        kind = "assert"
+        a = d["antithesis_assert"] or {}
+        assert_id, cond = a.get("id"), a.get("condition")
+        condition = None if cond is None else int(bool(cond))
+    elif container and "output_text" in d:
+        kind, text = "stdout", d["output_text"]
+    else:
+        kind = "event"
+        name = next((k for k in d if k not in _FRAME_KEYS), None)
+    return (vt, kind, source, container, name, code, assert_id, condition, text)
+
+
+def _parse_stream(path: Path) -> Iterator[tuple]:
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        for seq, line in enumerate(fh):
+            row = _parse_line(line)
+            if row is not None:
+                yield (seq, *row)
+
+
+def ingest(conn: sqlite3.Connection, rid: str, path: Path, input_hash: str) -> None:
+    """Index ``path`` under (rid, path.stem) unless an identical copy is already indexed."""
+    if _indexed(conn, rid, path):
+        return
+    st = path.stat()
+    stream = path.stem
+    with conn:
+        conn.execute("DELETE FROM lines WHERE run_id=? AND stream=?", (rid, stream))
+        n = 0
+        chunk: list[tuple] = []
+        for parsed in _parse_stream(path):
+            chunk.append((rid, stream, *parsed))
+            if len(chunk) >= _INSERT_CHUNK:
+                conn.executemany(f"INSERT INTO lines VALUES ({','.join('?' * 12)})", chunk)
+                n += len(chunk)
+                chunk.clear()
+        conn.executemany(f"INSERT INTO lines VALUES ({','.join('?' * 12)})", chunk)
+        n += len(chunk)
+        conn.execute(
+            "INSERT OR REPLACE INTO streams VALUES (?, ?, ?, ?, ?, ?)",
+            (rid, stream, input_hash, st.st_size, st.st_mtime, n),
+        )
+
+
+def _ingest_shard(rid: str, path: str, input_hash: str) -> str:
+    """Process-pool worker: parse one stream into its own throwaway DB (tables, no indexes),
+    so parsing runs in parallel and the shared index only sees one bulk copy per stream."""
+    shard = Path(path + ".shard.sqlite")
+    shard.unlink(missing_ok=True)
+    conn = sqlite3.connect(shard)
+    conn.executescript(_SCHEMA)
+    ingest(conn, rid, Path(path), input_hash)
+    conn.close()
+    return str(shard)
+
+
+def _merge_shard(conn: sqlite3.Connection, shard: Path) -> None:
+    conn.execute("ATTACH DATABASE ? AS shard", (str(shard),))
+    with conn:
+        for rid, stream in conn.execute("SELECT run_id, stream FROM shard.streams").fetchall():
+            conn.execute("DELETE FROM lines WHERE run_id=? AND stream=?", (rid, stream))
+        conn.execute("INSERT INTO lines SELECT * FROM shard.lines")
+        conn.execute("INSERT OR REPLACE INTO streams SELECT * FROM shard.streams")
+    conn.execute("DETACH DATABASE shard")
+    shard.unlink()
+
+
+def fetch_indexed(
+    api: Api,
+    conn: sqlite3.Connection,
+    rid: str,
+    manifest: Manifest,
+    jobs: list[tuple[str, str, Path]],
+    parallel: int,
+    procs: int | None,
+) -> Iterator[tuple[str, Path | None]]:
+    """Fetch + index ``(input_hash, vtime, dest)`` streams, pipelined: each one is parsed
+    in the process pool as soon as it lands, and ``(input_hash, dest)`` is yielded once its
+    rows are in the index (``dest`` None if the fetch failed). Streams the manifest already
+    has skip the fetch; already-indexed ones skip the parse. Yield order is completion order."""
+    pending: dict[Future[str], tuple[str, Path]] = {}
+    with ProcessPoolExecutor(procs) as pool:
+
+        def parse(ih: str, dest: Path) -> bool:
+            """Queue ``dest`` for parsing; False if it is already indexed."""
+            if _indexed(conn, rid, dest):
+                return False
+            pending[pool.submit(_ingest_shard, rid, str(dest), ih)] = (ih, dest)
+            return True
+
+        def merged(fut: Future[str]) -> tuple[str, Path]:
+            _merge_shard(conn, Path(fut.result()))
+            return pending.pop(fut)
+
+        fetch: dict[Path, tuple[str, str]] = {}
+        for ih, vt, dest in jobs:
+            if manifest.have(dest, vt):
+                if not parse(ih, dest):
+                    yield ih, dest
+            else:
+                fetch[dest] = (ih, vt)
+        if fetch:
+            print(f"fetching {len(fetch)} stream(s), {parallel} at a time", file=sys.stderr)
+        urls = [
+            (f"/api/v0/runs/{rid}/logs?input_hash={ih}&vtime={vt}", dest)
+            for dest, (ih, vt) in fetch.items()
+        ]
+        for dest, code in api.download(urls, parallel):
+            ih, vt = fetch[dest]
+            if code != 200:
+                print(f"warn: /logs ih={ih} -> HTTP {code}, skipping", file=sys.stderr)
+                yield ih, None
+                continue
+            manifest.landed(dest, ih, vt)
+            if not parse(ih, dest):
+                yield ih, dest
+            for fut in [f for f in pending if f.done()]:
+                yield merged(fut)
+        for fut in as_completed(list(pending)):
+            yield merged(fut)
+
+
+# ── resume manifest ───────────────────────────────────────────────────────────
+
+_MANIFEST_FILE = "manifest.json"
+
+
+def _sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(1 << 20):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class Manifest:
+    """Per-run record of completed work under ``<cache-dir>/<run>/``. Stream keys are paths
+    relative to that directory. Written atomically; an unreadable manifest starts empty."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.path = root / _MANIFEST_FILE
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        self.properties: dict[str, Any] = data.get("properties") or {}
+        self.streams: dict[str, dict[str, Any]] = data.get("streams") or {}
+        self.sweeps: dict[str, dict[str, dict[str, Any]]] = data.get("sweeps") or {}
+
+    def key(self, dest: Path) -> str:
+        return dest.relative_to(self.root).as_posix()
+
+    def have(self, dest: Path, vtime: str) -> bool:
+        """``dest`` is on disk for this moment. A pre-manifest cache file is adopted as-is;
+        a recorded stream for another vtime (fresher moment, same branch) is refetched."""
+        if not (dest.is_file() and dest.stat().st_size):
+            return False
+        entry = self.streams.get(self.key(dest))
+        if entry is None:
+            self.streams[self.key(dest)] = {"vtime": vtime, "size": dest.stat().st_size}
+            return True
+        return entry.get("vtime") == vtime and entry.get("size") == dest.stat().st_size
+
+    def landed(self, dest: Path, ih: str, vtime: str) -> None:
+        self.streams[self.key(dest)] = {
+            "input_hash": ih,
+            "vtime": vtime,
+            "size": dest.stat().st_size,
+            "sha256": _sha256(dest),
+        }
+        for hits in self.sweeps.values():
+            hits.pop(self.key(dest), None)
+
+    def sha(self, dest: Path) -> str:
+        entry = self.streams.setdefault(self.key(dest), {})
+        if "sha256" not in entry:
+            entry["sha256"] = _sha256(dest)
+        return entry["sha256"]
+
+    def sweep_hits(self, substr: str, dest: Path) -> list[dict[str, Any]] | None:
+        entry = self.sweeps.get(substr, {}).get(self.key(dest))
+        if entry is None or entry.get("sha256") != self.sha(dest):
+            return None
+        return entry["hits"]
+
+    def put_sweep_hits(self, substr: str, dest: Path, hits: list[dict[str, Any]]) -> None:
+        self.sweeps.setdefault(substr, {})[self.key(dest)] = {
+            "sha256": self.sha(dest),
+            "hits": hits,
+        }
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        data = {"properties": self.properties, "streams": self.streams, "sweeps": self.sweeps}
+        tmp.write_text(json.dumps(data, indent=1))
+        tmp.replace(self.path)
+
+
+def run_properties(
+    api: Api, run: dict, manifest: Manifest, refresh: bool
+) -> tuple[list[dict], bool]:
+    """The run's properties and whether they came from the manifest. Reused only for a run
+    that has completed (its properties no longer change) and only while the cached file's
+    hash still matches; ``refresh`` or an in-progress run always refetches."""
+    rid = run["run_id"]
+    completed = run.get("completed_at") or api.get_json(f"/api/v0/runs/{rid}").get("completed_at")
+    cached = manifest.root / "properties.json"
+    rec = manifest.properties
+    if (
+        not refresh
+        and completed
+        and rec.get("completed_at") == completed
+        and cached.is_file()
+        and _sha256(cached) == rec.get("sha256")
+    ):
+        return json.loads(cached.read_text()), True
+    props = api.paginate(f"/api/v0/runs/{rid}/properties", limit=100)
+    if completed:
+        manifest.root.mkdir(parents=True, exist_ok=True)
+        cached.write_text(json.dumps(props))
+        manifest.properties = {
+            "completed_at": completed,
+            "sha256": _sha256(cached),
+            "count": len(props),
+        }
+    return props, False
+
+
 # ── crash dossier ─────────────────────────────────────────────────────────────
 
 # fault-injector stop/kill and clean exit -- expected under fault injection
@@ -367,48 +716,26 @@ def _crash_counterexamples(props: list[dict]) -> list[tuple[str, dict]]:
     return out
 
 
-def _fetch_stream(api: Api, rid: str, moment: dict, cache_dir: Path) -> Path | None:
-    ih, vt = moment["input_hash"], moment["vtime"]
-    path = cache_dir / f"logs_{ih}_{vt}.ndjson"
-    if path.is_file() and path.stat().st_size:
-        return path
-    code, body = api.get(f"/api/v0/runs/{rid}/logs?input_hash={ih}&vtime={vt}")
-    if code != 200:
-        print(f"warn: /logs ih={ih} vt={vt} -> HTTP {code}, skipping", file=sys.stderr)
-        return None
-    path.write_bytes(body)
-    return path
-
-
-def _scan_stream(path: Path) -> dict[str, Any]:
+def _scan_stream(conn: sqlite3.Connection, rid: str, stream: str) -> dict[str, Any]:
     signals: list[tuple[float, str, int | None]] = []  # (vtime, thread, signal)
     deaths: list[tuple[float, str, int | None]] = []  # (vtime, container, exit)
     faults: list[tuple[float, dict]] = []
     stdout: dict[str, list[tuple[float, str]]] = {}  # container -> [(vtime, line)]
-    with open(path, errors="replace") as fh:
-        for line in fh:
-            try:
-                d = json.loads(line)
-            except ValueError:
-                continue
-            src = d.get("source") or {}
-            try:
-                vt = float((d.get("moment") or {}).get("vtime", ""))
-            except ValueError:
-                continue
-            name = src.get("name", "")
-            if name == "processes_terminated_with_signal":
-                try:
-                    info = json.loads(d.get("output_text") or "{}")
-                except ValueError:
-                    info = {}
-                signals.append((vt, info.get("executable", "?"), info.get("signal")))
-            elif name == "containers_meta" and d.get("event") == "died":
-                deaths.append((vt, d.get("name", "?"), d.get("container_exit_code")))
-            elif name == "fault_injector" and "fault" in d:
-                faults.append((vt, d["fault"]))
-            elif src.get("container") and "output_text" in d:
-                stdout.setdefault(name, []).append((vt, d["output_text"]))
+    rows = conn.execute(
+        "SELECT vtime, kind, source, name, code, text FROM lines "
+        "WHERE run_id=? AND stream=? AND kind IN ('signal', 'death', 'fault', 'stdout') "
+        "ORDER BY seq",
+        (rid, stream),
+    )
+    for vt, kind, source, name, code, text in rows:
+        if kind == "signal":
+            signals.append((vt, name, code))
+        elif kind == "death":
+            deaths.append((vt, name, code))
+        elif kind == "fault":
+            faults.append((vt, json.loads(text)["fault"]))
+        else:
+            stdout.setdefault(source, []).append((vt, text))
     return {"signals": signals, "deaths": deaths, "faults": faults, "stdout": stdout}
 
 
@@ -496,11 +823,35 @@ def _signature(rec: dict[str, Any]) -> tuple:
     return (rec["container"], rec["signal"], _HEX_RE.sub("…", head.strip()))
 
 
+def _crash_scans(
+    api: Api, args: argparse.Namespace, rid: str, manifest: Manifest, cexs: list[tuple[str, dict]]
+) -> tuple[dict[Path, dict[str, Any]], int]:
+    """Fetch + scan every counterexample's stream; returns the scans and the failed count."""
+    jobs: dict[Path, tuple[str, str, Path]] = {}
+    for _, ex in cexs:
+        ih, vt = ex["moment"]["input_hash"], ex["moment"]["vtime"]
+        dest = manifest.root / f"logs_{ih}_{vt}.ndjson"
+        jobs[dest] = (ih, vt, dest)
+    conn = open_index(Path(args.cache_dir).expanduser())
+    scans: dict[Path, dict[str, Any]] = {}
+    failed = 0
+    for _, path in fetch_indexed(
+        api, conn, rid, manifest, list(jobs.values()), args.parallel, args.procs
+    ):
+        if path is None:
+            failed += 1
+        else:
+            scans[path] = _scan_stream(conn, rid, path.stem)
+    manifest.save()
+    return scans, failed
+
+
 def cmd_crashes(api: Api, args: argparse.Namespace) -> None:
     r = resolve(api, args.selector)
     rid = r["run_id"]
     f = _desc_fields(r.get("description", ""))
-    props = api.paginate(f"/api/v0/runs/{rid}/properties", limit=100)
+    manifest = Manifest(Path(args.cache_dir).expanduser() / rid)
+    props, cached = run_properties(api, r, manifest, args.refresh)
     cexs = _crash_counterexamples(props)
     counts = {p["name"]: p.get("counterexample_count", 0) for p in props}
 
@@ -516,19 +867,19 @@ def cmd_crashes(api: Api, args: argparse.Namespace) -> None:
     for n in names:
         print(f"  {n}  (cex={counts.get(n, '?')}, 1 inspectable -- API embeds one per property)")
 
-    cache = Path(args.cache_dir).expanduser() / rid
-    cache.mkdir(parents=True, exist_ok=True)
-    with ThreadPoolExecutor(4) as pool:
-        paths = list(pool.map(lambda be: _fetch_stream(api, rid, be[1]["moment"], cache), cexs))
-
-    scans: dict[Path, dict[str, Any]] = {}
+    manifest.root.mkdir(parents=True, exist_ok=True)
+    scans, failed = _crash_scans(api, args, rid, manifest, cexs)
+    if failed and cached:
+        print("cached properties look stale, refetching", file=sys.stderr)
+        props, _ = run_properties(api, r, manifest, refresh=True)
+        cexs = _crash_counterexamples(props)
+        scans, _ = _crash_scans(api, args, rid, manifest, cexs)
     records: list[dict[str, Any]] = []
-    for (bucket, ex), path in zip(cexs, paths, strict=True):
-        if path is None:
-            continue
-        if path not in scans:
-            scans[path] = _scan_stream(path)
-        records.append(_build_record(bucket, ex, scans[path], args.tail, args.fault_window))
+    for bucket, ex in cexs:
+        m = ex["moment"]
+        scan = scans.get(manifest.root / f"logs_{m['input_hash']}_{m['vtime']}.ndjson")
+        if scan is not None:
+            records.append(_build_record(bucket, ex, scan, args.tail, args.fault_window))
 
     merged: dict[tuple, dict[str, Any]] = {}
     for rec in records:
@@ -564,7 +915,7 @@ def cmd_crashes(api: Api, args: argparse.Namespace) -> None:
         print(f"   {rec['container']} tail ({len(rec['tail'])} lines):")
         for vt, t in rec["tail"]:
             print(f"     vt {vt:9.2f}  {t.rstrip()[:160]}")
-    print(f"\nstreams cached in {cache}/")
+    print(f"\nstreams cached in {manifest.root}/")
 
 
 def _logs_code(api: Api, rid: str, ih: str, vt: float) -> int:
@@ -635,73 +986,92 @@ def _all_moments(props: list[dict]) -> dict[str, str]:
     return keep
 
 
+def _sweep_stream(
+    conn: sqlite3.Connection, rid: str, stream: str, ih: str, assert_substr: str
+) -> list[dict[str, Any]]:
+    """Failing firings of ``assert_substr`` in one indexed stream, each with the WRN/FTL/ERR
+    lines and first submitted-tx body in a -40/+60 line window around it."""
+    hits: list[dict[str, Any]] = []
+    fired = conn.execute(
+        "SELECT seq, vtime, container, assert_id, text FROM lines "
+        "WHERE run_id=? AND stream=? AND kind='assert' AND condition=0 AND instr(text, ?) > 0 "
+        "ORDER BY seq",
+        (rid, stream, assert_substr),
+    ).fetchall()
+    for seq, _vt, container, assert_id, text in fired:
+        ctx: dict[str, Any] = {
+            "input_hash": ih,
+            "vtime": (json.loads(text).get("moment") or {}).get("vtime", ""),
+            "container": container or "",
+            "assert_id": assert_id or "",
+        }
+        wrn, submitted = [], None
+        window = conn.execute(
+            "SELECT kind, name, text FROM lines "
+            "WHERE run_id=? AND stream=? AND seq BETWEEN ? AND ? ORDER BY seq",
+            (rid, stream, seq - 40, seq + 59),
+        )
+        for kind, name, t in window:
+            if kind == "stdout" and (":WRN" in t or ":FTL" in t or ":ERR" in t):
+                wrn.append(t[:180])
+            elif (
+                kind == "event"
+                and submitted is None
+                and (name or "").startswith("workload::submitted")
+            ):
+                submitted = json.loads(t).get(name)
+        if wrn:
+            ctx["log"] = wrn[-6:]
+        if submitted:
+            ctx["submitted"] = submitted
+        hits.append(ctx)
+    return hits
+
+
+def _sweep_branches(
+    api: Api, args: argparse.Namespace, rid: str, manifest: Manifest, moments: dict[str, str]
+) -> tuple[dict[str, list[dict[str, Any]]], int]:
+    """input_hash -> hits for every branch, reusing the manifest's hits for any stream this
+    ``assert_substr`` was already swept on; also returns the failed-fetch count."""
+    jobs = [(ih, vt, manifest.root / "sweep" / f"{ih}.ndjson") for ih, vt in moments.items()]
+    conn = open_index(Path(args.cache_dir).expanduser())
+    per_branch: dict[str, list[dict[str, Any]]] = {}
+    failed = reused = 0
+    for ih, path in fetch_indexed(api, conn, rid, manifest, jobs, args.parallel, args.procs):
+        if path is None:
+            failed += 1
+            continue
+        hits = manifest.sweep_hits(args.assert_substr, path)
+        if hits is None:
+            hits = _sweep_stream(conn, rid, path.stem, ih, args.assert_substr)
+            manifest.put_sweep_hits(args.assert_substr, path, hits)
+        else:
+            reused += 1
+        per_branch[ih] = hits
+    manifest.save()
+    if reused:
+        print(f"{reused} branch scan(s) reused from the manifest", file=sys.stderr)
+    return per_branch, failed
+
+
 def cmd_sweep(api: Api, args: argparse.Namespace) -> None:
     """Hunt EVERY branch for an assert firing (condition:false), not just the one
     counterexample the API embeds. Enumerates all property moments, fetches each
     branch stream, and reports hits with nearby WRN lines + the submitted-tx body."""
     r = resolve(api, args.selector)
     rid = r["run_id"]
-    props = api.paginate(f"/api/v0/runs/{rid}/properties", limit=100)
+    manifest = Manifest(Path(args.cache_dir).expanduser() / rid)
+    props, cached = run_properties(api, r, manifest, args.refresh)
     moments = _all_moments(props)
     print(f"{len(moments)} distinct branches to scan for {args.assert_substr!r}", file=sys.stderr)
-    cache = Path(args.cache_dir).expanduser() / rid / "sweep"
-    cache.mkdir(parents=True, exist_ok=True)
-
-    def fetch(item: tuple[str, str]) -> tuple[str, Path | None]:
-        ih, vt = item
-        dest = cache / f"{ih}.ndjson"
-        if not dest.exists():
-            code, body = api.get(f"/api/v0/runs/{rid}/logs?input_hash={ih}&vtime={vt}")
-            if code != 200:
-                return ih, None
-            dest.write_bytes(body)
-        return ih, dest
-
-    with ThreadPoolExecutor(4) as pool:
-        fetched = list(pool.map(fetch, moments.items()))
-
-    hits: list[dict[str, Any]] = []
-    for ih, path in fetched:
-        if path is None:
-            continue
-        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-        for i, line in enumerate(lines):
-            if args.assert_substr not in line or '"condition":false' not in line.replace(" ", ""):
-                continue
-            try:
-                d = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            a = d.get("antithesis_assert") or {}
-            if a.get("condition") is not False:
-                continue
-            ctx: dict[str, Any] = {
-                "input_hash": ih,
-                "vtime": (d.get("moment") or {}).get("vtime", ""),
-                "container": (d.get("source") or {}).get("container", ""),
-                "assert_id": a.get("id", ""),
-            }
-            wrn, submitted = [], None
-            for j in range(max(0, i - 40), min(len(lines), i + 60)):
-                t = lines[j]
-                if ":WRN" in t or ":FTL" in t or ":ERR" in t:
-                    try:
-                        wrn.append(json.loads(t).get("output_text", "")[:180])
-                    except json.JSONDecodeError:
-                        pass
-                elif "workload::submitted :" in t and submitted is None:
-                    try:
-                        ev = json.loads(t)
-                        submitted = next(
-                            (v for k, v in ev.items() if k.startswith("workload::submitted")), None
-                        )
-                    except json.JSONDecodeError:
-                        pass
-            if wrn:
-                ctx["log"] = wrn[-6:]
-            if submitted:
-                ctx["submitted"] = submitted
-            hits.append(ctx)
+    (manifest.root / "sweep").mkdir(parents=True, exist_ok=True)
+    per_branch, failed = _sweep_branches(api, args, rid, manifest, moments)
+    if failed and cached:
+        print("cached properties look stale, refetching", file=sys.stderr)
+        props, _ = run_properties(api, r, manifest, refresh=True)
+        moments = _all_moments(props)
+        per_branch, _ = _sweep_branches(api, args, rid, manifest, moments)
+    hits = [h for ih in moments for h in per_branch.get(ih, [])]
 
     print(f"{len(hits)} assert firing(s) across {len(moments)} branches")
     if args.json:
@@ -715,6 +1085,52 @@ def cmd_sweep(api: Api, args: argparse.Namespace) -> None:
             print(f"   submitted: {json.dumps(h['submitted'])[:400]}")
 
 
+def cmd_query(api: Api, args: argparse.Namespace) -> None:
+    """Indexed query over every stream already ingested for a run (no fetching)."""
+    rid = resolve(api, args.selector)["run_id"]
+    conn = open_index(Path(args.cache_dir).expanduser())
+    where, params = ["run_id=?"], [rid]
+    for col, val in (("kind", args.kind), ("container", args.container)):
+        if val:
+            where.append(f"{col}=?")
+            params.append(val)
+    if args.assert_id:
+        where.append("kind='assert' AND instr(assert_id, ?) > 0")
+        params.append(args.assert_id)
+    if args.failing:
+        where.append("condition=0")
+    if args.event:
+        where.append("kind='event' AND instr(name, ?) > 0")
+        params.append(args.event)
+    if args.since is not None:
+        where.append("vtime >= ?")
+        params.append(args.since)
+    if args.until is not None:
+        where.append("vtime <= ?")
+        params.append(args.until)
+    rows = conn.execute(
+        "SELECT stream, vtime, kind, coalesce(container, source), text FROM lines "
+        f"WHERE {' AND '.join(where)} ORDER BY stream, seq LIMIT ?",
+        (*params, args.limit),
+    ).fetchall()
+    if args.json:
+        keys = ("stream", "vtime", "kind", "container", "text")
+        print(json.dumps([dict(zip(keys, r, strict=True)) for r in rows], indent=2))
+        return
+    for stream, vt, kind, container, text in rows:
+        print(f"{stream[:16]}  vt {vt:9.2f}  {kind:6}  {container or '-':12}  {text[:200]}")
+
+
+def _add_pipeline_args(p: argparse.ArgumentParser) -> None:
+    p.add_argument(
+        "--parallel", type=int, default=8, help="concurrent stream downloads (default 8)"
+    )
+    p.add_argument("--procs", type=int, help="parser processes (default: CPU count)")
+    p.add_argument(
+        "--refresh", action="store_true", help="refetch properties even if the manifest has them"
+    )
+
+
 def main() -> None:
     ap = argparse.ArgumentParser(description="Fetch Antithesis run results via the REST API.")
     sub = ap.add_subparsers(dest="cmd", required=True)
@@ -771,6 +1187,7 @@ def main() -> None:
     p.add_argument("selector")
     p.add_argument("assert_substr", help="substring of the assert id/message to hunt")
     p.add_argument("--cache-dir", default="~/.cache/antithesis-fetch", help="log stream cache")
+    _add_pipeline_args(p)
     p.add_argument("--json", action="store_true", help="machine-readable output")
     p.set_defaults(fn=cmd_sweep)
 
@@ -781,9 +1198,24 @@ def main() -> None:
         "--fault-window", type=float, default=40.0, help="vtime window for faults (default 40)"
     )
     p.add_argument("--cache-dir", default="~/.cache/antithesis-fetch", help="log stream cache")
+    _add_pipeline_args(p)
     p.add_argument("--json", action="store_true", help="machine-readable output")
     p.set_defaults(fn=cmd_crashes)
 
+    p = sub.add_parser("query", help="indexed query over streams already cached for a run")
+    p.add_argument("selector")
+    p.add_argument("--kind", choices=["assert", "event", "stdout", "fault", "signal", "death"])
+    p.add_argument("--container", help="exact container name")
+    p.add_argument("--assert-id", help="substring of the assert id")
+    p.add_argument("--failing", action="store_true", help="only condition:false asserts")
+    p.add_argument("--event", help="substring of the SDK event name")
+    p.add_argument("--since", type=float, help="min vtime")
+    p.add_argument("--until", type=float, help="max vtime")
+    p.add_argument("--limit", type=int, default=200)
+    p.add_argument("--cache-dir", default="~/.cache/antithesis-fetch", help="log stream cache")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(fn=cmd_query)
+
     args = ap.parse_args()
     args.fn(Api(), args)
 
@@ -0,0 +1,3 @@
+#!/usr/bin/env bash
+
+curl --silent http://workload:8000/payment/path/random
@@ -0,0 +1,226 @@
+"""Local mirror of AMM pool state, fed by validated tx metadata, plus constant-product quotes.
+
+``models.AMM`` only says a pool exists. The WS listener also hands each validated tx's meta
+to ``AMMMirror.apply``, which tracks per pool:
+
+- the ``AMM`` entry: LPTokenBalance, TradingFee, VoteSlots, AuctionSlot
+- its reserves: the AMM pseudo-account's XRP balance, its trust lines to each IOU issuer
+  and its MPToken holdings, keyed like ``workload.balances`` keys assets
+
+The quote functions port rippled's ``AMMHelpers`` equations for the weighted (W = 0.5)
+constant product, trading fee included, so handlers can ask for the exact deposit that
+mints ``t`` LP tokens, the LP tokens a single-asset withdrawal burns, or the EPrice at which
+a limit order just clears, and aim at those boundaries instead of at fixed ranges the pool
+may not be able to honour. rippled rounds each step in the pool's favour, so an exact quote
+lands within a unit of the boundary. ``scripts/check-amm-quotes`` checks that each quote
+and its inverse round-trip.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from workload.balances import XRP, AssetKey, _decimal, ledger_asset_key
+
+_FEE_UNIT = Decimal(100_000)  # TradingFee is in 1/100,000ths
+_HALF = Decimal("0.5")
+
+
+@dataclass
+class AuctionSlot:
+    account: str = ""
+    expiration: int = 0
+    price: Decimal = Decimal(0)
+    discounted_fee: int = 0
+    auth_accounts: list[str] = field(default_factory=list)
+
+
+@dataclass
+class AMMPool:
+    account: str  # AMM pseudo-account: holds the reserves, issues the LP token
+    assets: tuple[AssetKey, AssetKey]
+    lp_currency: str = ""
+    lp_supply: Decimal = Decimal(0)
+    trading_fee: int = 0
+    reserves: dict[AssetKey, Decimal] = field(default_factory=dict)
+    vote_slots: list[tuple[str, int, int]] = field(default_factory=list)  # account, fee, weight
+    auction_slot: AuctionSlot = field(default_factory=AuctionSlot)
+
+    @property
+    def fee(self) -> Decimal:
+        return Decimal(self.trading_fee) / _FEE_UNIT
+
+    def reserve(self, key: AssetKey) -> Decimal:
+        return self.reserves.get(key, Decimal(0))
+
+    def other(self, key: AssetKey) -> AssetKey:
+        return self.assets[1] if key == self.assets[0] else self.assets[0]
+
+    def funded(self) -> bool:
+        """Both reserves and the LP supply known and nonzero: the quotes are meaningful."""
+        return self.lp_supply > 0 and all(self.reserve(k) > 0 for k in self.assets)
+
+
+# ── Quotes ───────────────────────────────────────────────────────────
+
+
+def _fee_mults(pool: AMMPool) -> tuple[Decimal, Decimal]:
+    """rippled's f1 = 1 - tfee and f2 = (1 - tfee/2) / f1 for single-asset deposits."""
+    f1 = 1 - pool.fee
+    return f1, (1 - _HALF * pool.fee) / f1
+
+
+def lp_out_single(pool: AMMPool, key: AssetKey, amount: Decimal) -> Decimal:
+    """LP tokens a single-asset deposit of ``amount`` mints (``lpTokensOut``)."""
+    f1, f2 = _fee_mults(pool)
+    r = amount / pool.reserve(key)
+    c = (f2 * f2 + r / f1).sqrt() - f2
+    return pool.lp_supply * (r - c) / (1 + c)
+
+
+def deposit_for_lp_single(pool: AMMPool, key: AssetKey, lp_out: Decimal) -> Decimal:
+    """Single-asset deposit that mints exactly ``lp_out`` (``ammAssetIn``); inverse of
+    ``lp_out_single``, solved as a quadratic in the deposit's share of the reserve."""
+    f1, f2 = _fee_mults(pool)
+    t1 = lp_out / pool.lp_supply
+    t2 = 1 + t1
+    d = f2 - t1 / t2
+    a, b, c = 1 / (t2 * t2), 2 * d / t2 - 1 / f1, d * d - f2 * f2
+    return pool.reserve(key) * (-b + (b * b - 4 * a * c).sqrt()) / (2 * a)
+
+
+def withdraw_single(pool: AMMPool, key: AssetKey, lp_in: Decimal) -> Decimal:
+    """Asset a single-asset withdrawal burning ``lp_in`` pays out (``ammAssetOut``)."""
+    f = pool.fee
+    t1 = lp_in / pool.lp_supply
+    return pool.reserve(key) * (t1 * t1 - t1 * (2 - f)) / (t1 * f - 1)
+
+
+def lp_in_single(pool: AMMPool, key: AssetKey, amount: Decimal) -> Decimal:
+    """LP tokens a single-asset withdrawal of ``amount`` burns (``lpTokensIn``); inverse of
+    ``withdraw_single``."""
+    f = pool.fee
+    r = min(amount / pool.reserve(key), Decimal(1))
+    c = r * f + 2 - f
+    return pool.lp_supply * (c - (c * c - 4 * r).sqrt()) / 2
+
+
+def proportional(pool: AMMPool, lp: Decimal) -> dict[AssetKey, Decimal]:
+    """Both assets in pool ratio for ``lp`` LP tokens (a two-asset deposit or withdrawal)."""
+    share = lp / pool.lp_supply
+    return {k: pool.reserve(k) * share for k in pool.assets}
+
+
+def deposit_eprice(pool: AMMPool, key: AssetKey, amount: Decimal) -> Decimal:
+    """Effective price, in ``key`` per LP token, of a single-asset deposit of ``amount``."""
+    return amount / lp_out_single(pool, key, amount)
+
+
+def withdraw_eprice(pool: AMMPool, key: AssetKey, amount: Decimal) -> Decimal:
+    """Effective price, in LP tokens per unit of ``key``, of withdrawing ``amount``."""
+    return lp_in_single(pool, key, amount) / amount
+
+
+# ── Mirror ───────────────────────────────────────────────────────────
+
+
+class AMMMirror:
+    def __init__(self) -> None:
+        self.pools: dict[str, AMMPool] = {}  # AMM account -> pool
+        self._by_pair: dict[frozenset[AssetKey], str] = {}
+
+    def get(self, assets: tuple[AssetKey, AssetKey] | list[AssetKey]) -> AMMPool | None:
+        account = self._by_pair.get(frozenset(assets))
+        return None if account is None else self.pools.get(account)
+
+    def apply(self, meta: dict) -> None:
+        nodes = [
+            (kind, n)
+            for node in meta.get("AffectedNodes", [])
+            for kind, n in node.items()
+            if isinstance(n, dict)
+        ]
+        # AMM entries first: a deposit's AccountRoot/RippleState nodes can precede the AMM
+        # node that tells us whose reserves they are.
+        for kind, n in nodes:
+            if n.get("LedgerEntryType") == "AMM":
+                self._apply_amm(n.get("FinalFields") or n.get("NewFields") or {}, kind)
+        if not self.pools:
+            return
+        for kind, n in nodes:
+            fields = n.get("FinalFields") or n.get("NewFields") or {}
+            entry = n.get("LedgerEntryType", "")
+            if kind != "DeletedNode":
+                self._apply_reserve(entry, fields)
+
+    def _apply_amm(self, fields: dict, kind: str) -> None:
+        account = fields.get("Account", "")
+        if not account:
+            return
+        if kind == "DeletedNode":
+            pool = self.pools.pop(account, None)
+            if pool is not None:
+                self._by_pair.pop(frozenset(pool.assets), None)
+            return
+        pool = self.pools.get(account)
+        if pool is None:
+            assets = (ledger_asset_key(fields.get("Asset")), ledger_asset_key(fields.get("Asset2")))
+            pool = self.pools[account] = AMMPool(account=account, assets=assets)
+            self._by_pair[frozenset(assets)] = account
+        lp = fields.get("LPTokenBalance")
+        if isinstance(lp, dict):
+            pool.lp_currency = lp.get("currency", pool.lp_currency)
+            pool.lp_supply = _decimal(lp.get("value")) or Decimal(0)
+        pool.trading_fee = int(fields.get("TradingFee", pool.trading_fee))
+        pool.vote_slots = [
+            (
+                v.get("VoteEntry", {}).get("Account", ""),
+                int(v.get("VoteEntry", {}).get("TradingFee", 0)),
+                int(v.get("VoteEntry", {}).get("VoteWeight", 0)),
+            )
+            for v in fields.get("VoteSlots", [])
+        ]
+        slot = fields.get("AuctionSlot")
+        if isinstance(slot, dict):
+            pool.auction_slot = AuctionSlot(
+                account=slot.get("Account", ""),
+                expiration=int(slot.get("Expiration", 0)),
+                price=_decimal(slot.get("Price", {}).get("value")) or Decimal(0),
+                discounted_fee=int(slot.get("DiscountedFee", 0)),
+                auth_accounts=[
+                    a.get("AuthAccount", {}).get("Account", "")
+                    for a in slot.get("AuthAccounts", [])
+                ],
+            )
+
+    def _apply_reserve(self, entry: str, fields: dict) -> None:
+        if entry == "AccountRoot":
+            pool = self.pools.get(fields.get("Account", ""))
+            if pool is not None and XRP in pool.assets and "Balance" in fields:
+                pool.reserves[XRP] = Decimal(fields["Balance"])
+        elif entry == "RippleState":
+            balance = fields.get("Balance")
+            low = fields.get("LowLimit", {}).get("issuer", "")
+            high = fields.get("HighLimit", {}).get("issuer", "")
+            if not isinstance(balance, dict):
+                return
+            value = _decimal(balance.get("value")) or Decimal(0)
+            currency = balance.get("currency", "")
+            # Balance is signed from the low side; the pool holds what the issuer owes it.
+            for account, issuer, held in ((low, high, value), (high, low, -value)):
+                pool = self.pools.get(account)
+                if pool is not None and (currency, issuer) in pool.assets:
+                    pool.reserves[(currency, issuer)] = held
+        elif entry == "MPToken":
+            pool = self.pools.get(fields.get("Account", ""))
+            mpt_id = fields.get("MPTokenIssuanceID", "")
+            if pool is not None and mpt_id in pool.assets:
+                pool.reserves[mpt_id] = Decimal(fields.get("MPTAmount", "0"))
+
+
+_mirror = AMMMirror()
+
+
+def pools() -> AMMMirror:
+    return _mirror
@@ -22,7 +22,6 @@ from workload.config import conf_file, config_file
 from workload.models import (
     AMM,
     DID,
-    NFT,
     Check,
     ConfidentialMPTIssuance,
     Credential,
@@ -32,6 +31,7 @@ from workload.models import (
     LoanBroker,
     MPTokenIssuance,
     NFTOffer,
+    NFTSet,
     Oracle,
     PaymentChannel,
     PermissionedDomain,
@@ -43,6 +43,7 @@ from workload.models import (
 from workload.modifiers import check_modifier_coverage
 from workload.probe import probe_network
 from workload.transactions import REGISTRY
+from workload.wallets import read_accounts, seeds
 
 
 class Workload:
@@ -50,7 +51,7 @@ class Workload:
         self.config = conf
         self.accounts: dict[str, UserAccount] = {}
         self.amms: list[AMM] = []
-        self.nfts: list[NFT] = []
+        self.nfts = NFTSet()
         self.nft_offers: list[NFTOffer] = []
         self.trust_lines: list[TrustLine] = []
         self.credentials: list[Credential] = []
@@ -102,7 +103,16 @@ class Workload:
         self.funding_wallet = Wallet.from_seed(
             self.config["genesis_account"]["master_seed"], algorithm=default_algo
         )
-        self.client = AsyncJsonRpcClient(self.xrpld)
+        # Submits fan out over every node prepare-workload generated (nodes.json); reads
+        # and the WS stream stay on the primary. Without the file the pool is just it.
+        from workload.nodepool import PooledJsonRpcClient, build_pool, load_node_names
+
+        self.node_pool = build_pool(
+            xrpld_host,
+            load_node_names(Path(os.environ.get("NODES_JSON", "/nodes.json"))),
+            xrpld_rpc_port,
+        )
+        self.client: AsyncJsonRpcClient = PooledJsonRpcClient(self.xrpld, self.node_pool)
 
         from workload.sequence import SequenceTracker
 
@@ -115,6 +125,26 @@ class Workload:
 
         configure_submit(self.delegates, self.accounts, self.sponsorships)
 
+        # Driver submits, batch packing and batch_random draw Sequences from the shared tracker.
+        from workload.packing import configure as configure_packing
+
+        configure_packing(self.seq)
+
+        # Hot accounts' ticket stock is refilled in the background through this client.
+        from workload.ticketpool import configure as configure_tickets
+
+        configure_tickets(self.client)
+
+        # Balances mirrored from validated meta, for handlers drawing solvent amounts.
+        from workload.balances import configure as configure_balances
+
+        configure_balances(self.accounts)
+
+        # Warm-start the fuzz corpus from seeds an earlier run persisted.
+        from workload.corpus import configure as configure_corpus
+
+        configure_corpus(Path(os.environ.get("FUZZ_CORPUS_DIR", "fuzz_corpus")))
+
         logger.info("Antithesis SDK handler: %s", type(_HANDLER).__name__)
         reachable("workload::started", {})
         always(True, "workload::sdk_works", {"message": "SDK canary assertion"})
@@ -125,15 +155,15 @@ class Workload:
         logger.info("Workload initialized after %ss", int(time.time() - self.start_time))
 
     def load_initial_accounts(self, accounts_json: Path) -> None:
-        """Load pre-generated accounts from JSON: [{"address": "r...", "seed": "s..."}, ...]."""
+        """Load pre-generated accounts: [{"address": "r...", "seed": "s..."}, ...] as JSON, or
+        one object per line for ``*.ndjson``. Wallets are derived lazily on first signature."""
         logger.info(f"Loading accounts from {accounts_json}")
-        accounts = json.loads(accounts_json.read_text())
-        default_algo = CryptoAlgorithm[
+        table = seeds()
+        table.algorithm = CryptoAlgorithm[
             conf_file["workload"]["accounts"]["default_crypto_algorithm"]
         ]
-        for entry in accounts:
-            wallet = Wallet.from_seed(seed=entry["seed"], algorithm=default_algo)
-            self.accounts[wallet.address] = UserAccount(wallet=wallet)
+        for address, seed in read_accounts(accounts_json):
+            self.accounts[address] = UserAccount(address=address, row=table.append(seed))
         logger.info(f"Loaded {len(self.accounts)} accounts")
 
     def wait_for_network(self, xrpld: str) -> None:
@@ -227,7 +257,11 @@ def create_app(workload: Workload) -> FastAPI:
             )
             # Antithesis ends a run immediately on a non-zero container exit before
             # setup_complete. Exiting here aborts a broken setup fast instead of idling
-            # the full duration; unreachable() above is dispatched synchronously first.
+            # the full duration; unreachable() above is dispatched synchronously first,
+            # and the deferred assertion queue is drained since os._exit skips atexit.
+            from workload.emit import flush as flush_emit
+
+            flush_emit()
             os._exit(1)
 
         yield
@@ -236,6 +270,12 @@ def create_app(workload: Workload) -> FastAPI:
         with contextlib.suppress(asyncio.CancelledError):
             await ws_task
 
+        from workload.emit import flush as flush_emit
+        from workload.fuzzstats import stats as fuzz_stats
+
+        flush_emit()
+        fuzz_stats().dump(Path(os.environ.get("FUZZ_STATS_FILE", "fuzz_stats.json.gz")))
+
     app = FastAPI(lifespan=lifespan)
     app.state.workload = workload
 
@@ -247,9 +287,92 @@ def create_app(workload: Workload) -> FastAPI:
     async def _probe_network(w: Workload = Depends(get_workload)) -> Response:
         return Response(status_code=200 if await probe_network(w) else 503)
 
+    @app.get("/nodes/stats")
+    def _node_stats(w: Workload = Depends(get_workload)) -> dict:
+        return w.node_pool.stats()
+
+    @app.get("/fuzz/stats")
+    def _fuzz_stats() -> dict:
+        from workload.fuzzstats import stats as fuzz_stats
+
+        return fuzz_stats().snapshot()
+
+    @app.get("/batch/pack/stats")
+    def _batch_pack_stats() -> dict:
+        from workload.packing import packer
+
+        return packer().snapshot()
+
+    @app.get("/payment/path/stats")
+    def _payment_path_stats() -> dict:
+        from workload.paths import path_cache
+
+        return path_cache().snapshot()
+
+    @app.get("/tickets/pool/stats")
+    def _ticket_pool_stats(w: Workload = Depends(get_workload)) -> dict:
+        from workload.ticketpool import pool
+
+        return pool().snapshot(w.accounts)
+
     for name, path, handler_fn, args_fn, _ in REGISTRY:
         app.get(path)(_make_endpoint(path, name, handler_fn, args_fn))
 
+    # The loan lifecycle engine submits real Loan* txs (their REGISTRY buckets assert on
+    # them); the step itself has no engine_result of its own, so it's wired like the audit.
+    from workload.transactions.lending import loan_lifecycle
+
+    app.get("/loan/lifecycle/step")(
+        _make_endpoint(
+            "/loan/lifecycle/step",
+            "LoanLifecycle",
+            loan_lifecycle,
+            lambda w: (w.accounts, w.loan_brokers, w.vaults, w.client),
+        )
+    )
+
+    @app.get("/loan/lifecycle/stats")
+    def _loan_lifecycle_stats() -> dict:
+        from workload.loans import lifecycle
+
+        return lifecycle().snapshot()
+
+    # Same for the NFT page-density mode: its NFToken* txs land in their own buckets.
+    from workload.transactions.nft import nft_density
+
+    app.get("/nft/density/step")(
+        _make_endpoint(
+            "/nft/density/step",
+            "NFTDensity",
+            nft_density,
+            lambda w: (w.accounts, w.client),
+        )
+    )
+
+    @app.get("/nft/pages/stats")
+    def _nft_pages_stats() -> dict:
+        from workload.nftpages import nft_pages
+
+        return nft_pages().snapshot()
+
+    # And for the payment-channel claim stream: redemptions are PaymentChannelClaims.
+    from workload.transactions.payment_channels import channel_stream
+
+    app.get("/channel/stream/step")(
+        _make_endpoint(
+            "/channel/stream/step",
+            "ChannelStream",
+            channel_stream,
+            lambda w: (w.accounts, w.client),
+        )
+    )
+
+    @app.get("/channel/stream/stats")
+    def _channel_stream_stats() -> dict:
+        from workload.channels import channels
+
+        return channels().snapshot()
+
     # SponsorshipAudit is a read-only ledger cross-check, not a transaction --
     # no engine_result, so it doesn't fit REGISTRY's seen/success/failure shape
     # (register_assertions() would starve waiting for a hit that never comes).
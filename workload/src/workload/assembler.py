@@ -2,13 +2,21 @@
 byte-spans and reassemble them, so structural ops can splice bytes the codec never emits.
 
 Reassembly concatenates the exact spans the parser consumed, so ``reassemble(parse(b)) == b``
-for any canonical blob — corruption is only ever what an operator explicitly splices."""
+for any canonical blob — corruption is only ever what an operator explicitly splices.
+
+Spans are ``memoryview`` slices of the input blob: parsing copies nothing, ops splice views,
+and ``reassemble`` is the single copy back into ``bytes``."""
 
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import NamedTuple
 
 from xrpl.core.binarycodec.binary_wrappers.binary_parser import BinaryParser
+from xrpl.core.binarycodec.definitions.definitions import get_field_instance, load_definitions
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+
+type Span = bytes | memoryview
 
 
 @dataclass
@@ -16,35 +24,181 @@ class Field:
     name: str
     type_name: str
     is_vl: bool  # variable-length-encoded: value leads with a 1-3 byte size prefix
-    header: bytes  # field-id bytes
+    header: Span  # field-id bytes
     # everything the parser consumed after the header: VL length prefix + content for a
     # variable-length field, or nested content + end marker for an STObject/STArray.
-    value: bytes
+    value: Span
 
     @property
     def raw(self) -> bytes:
-        return self.header + self.value
+        return bytes(self.header) + bytes(self.value)
+
+
+class _FieldInfo(NamedTuple):
+    name: str
+    type_name: str
+    is_vl: bool
+
+
+def _load_field_table() -> dict[tuple[int, int], _FieldInfo]:
+    """(type code, field code) → field info, derived once from the codec definitions so
+    it tracks the linked xrpl-py version instead of a hardcoded list."""
+    defs = load_definitions()
+    type_codes: dict[str, int] = defs["TYPES"]
+    table: dict[tuple[int, int], _FieldInfo] = {}
+    for name, meta in defs["FIELDS"].items():
+        if not meta.get("isSerialized") or meta["type"] not in type_codes:
+            continue
+        key = (type_codes[meta["type"]], meta["nth"])
+        table[key] = _FieldInfo(name, meta["type"], bool(meta.get("isVLEncoded")))
+    return table
+
+
+_FIELDS = _load_field_table()
+
+# Fixed-width serialized types, walked natively. Anything not here and not handled
+# below (Issue, XChainBridge, Number, ...) is rare on the wire and falls back to the codec.
+_FIXED_WIDTH: dict[str, int] = {
+    "UInt8": 1,
+    "UInt16": 2,
+    "UInt32": 4,
+    "UInt64": 8,
+    "Int32": 4,
+    "Int64": 8,
+    "Hash128": 16,
+    "Hash160": 20,
+    "Hash192": 24,
+    "Hash256": 32,
+    "Currency": 20,
+}
+
+_OBJECT_END = 0xE1  # STObject ObjectEndMarker (type 14, field 1)
+_ARRAY_END = 0xF1  # STArray ArrayEndMarker (type 15, field 1)
+
+# PathSet step flags and terminators; mirrors xrpl-py's path_set.py.
+_PATH_ACCOUNT = 0x01
+_PATH_CURRENCY = 0x10
+_PATH_ISSUER = 0x20
+_PATHSET_END = 0x00
+_PATH_SEPARATOR = 0xFF
+
+
+def _need(view: memoryview, end: int) -> None:
+    if end > len(view):
+        raise XRPLBinaryCodecException("unexpected end of blob")
+
+
+def _read_header(view: memoryview, pos: int) -> tuple[int, int, int]:
+    """Decode a 1-3 byte field id at ``pos``; returns (type code, field code, next pos)."""
+    _need(view, pos + 1)
+    first = view[pos]
+    type_code, field_code = first >> 4, first & 0x0F
+    pos += 1
+    if type_code == 0:
+        _need(view, pos + 1)
+        type_code = view[pos]
+        pos += 1
+    if field_code == 0:
+        _need(view, pos + 1)
+        field_code = view[pos]
+        pos += 1
+    return type_code, field_code, pos
+
+
+def _read_vl_length(view: memoryview, pos: int) -> tuple[int, int]:
+    """Decode a VL size prefix at ``pos``; returns (content length, content start)."""
+    _need(view, pos + 1)
+    b1 = view[pos]
+    if b1 <= 192:
+        return b1, pos + 1
+    if b1 <= 240:
+        _need(view, pos + 2)
+        return 193 + (b1 - 193) * 256 + view[pos + 1], pos + 2
+    if b1 <= 254:
+        _need(view, pos + 3)
+        return 12481 + (b1 - 241) * 65536 + view[pos + 1] * 256 + view[pos + 2], pos + 3
+    raise XRPLBinaryCodecException("Length prefix must contain between 1 and 3 bytes.")
+
+
+def _skip_path_set(view: memoryview, pos: int) -> int:
+    while True:
+        _need(view, pos + 1)
+        step = view[pos]
+        pos += 1
+        if step == _PATHSET_END:
+            return pos
+        if step == _PATH_SEPARATOR:
+            continue
+        pos += 20 * bool(step & _PATH_ACCOUNT)
+        pos += 20 * bool(step & _PATH_CURRENCY)
+        pos += 20 * bool(step & _PATH_ISSUER)
+
+
+def _skip_with_codec(view: memoryview, pos: int, info: _FieldInfo) -> int:
+    """Codec fallback for types without a native walker: parse the tail once, measure."""
+    parser = BinaryParser(bytes(view[pos:]).hex())
+    before = len(parser)
+    parser.read_field_value(get_field_instance(info.name))
+    return pos + before - len(parser)
+
+
+def _skip_value(view: memoryview, pos: int, info: _FieldInfo) -> int:
+    """Return the position just past the value of ``info`` starting at ``pos``."""
+    if info.is_vl:
+        length, start = _read_vl_length(view, pos)
+        end = start + length
+    elif (width := _FIXED_WIDTH.get(info.type_name)) is not None:
+        end = pos + width
+    elif info.type_name == "Amount":
+        _need(view, pos + 1)
+        first = view[pos]
+        end = pos + (48 if first & 0x80 else 33 if first & 0x20 else 8)
+    elif info.type_name == "STObject":
+        end = _skip_fields(view, pos, _OBJECT_END)
+    elif info.type_name == "STArray":
+        end = _skip_fields(view, pos, _ARRAY_END)
+    elif info.type_name == "PathSet":
+        end = _skip_path_set(view, pos)
+    else:
+        end = _skip_with_codec(view, pos, info)
+    _need(view, end)
+    return end
+
+
+def _field_info(type_code: int, field_code: int) -> _FieldInfo:
+    info = _FIELDS.get((type_code, field_code))
+    if info is None:
+        raise XRPLBinaryCodecException(f"unknown field id type={type_code} field={field_code}")
+    return info
+
+
+def _skip_fields(view: memoryview, pos: int, end_marker: int) -> int:
+    """Walk nested fields until the single-byte ``end_marker``; returns the position past it."""
+    while True:
+        _need(view, pos + 1)
+        if view[pos] == end_marker:
+            return pos + 1
+        type_code, field_code, value_pos = _read_header(view, pos)
+        pos = _skip_value(view, value_pos, _field_info(type_code, field_code))
 
 
-def parse(blob: bytes) -> list[Field]:
-    parser = BinaryParser(blob.hex())
+def parse(blob: Span) -> list[Field]:
+    view = memoryview(blob)
     fields: list[Field] = []
-    while not parser.is_end():
-        before = parser.bytes
-        instance = parser.read_field()
-        after_header = parser.bytes
-        parser.read_field_value(instance)
-        after_value = parser.bytes
-        header = before[: len(before) - len(after_header)]
-        value = after_header[: len(after_header) - len(after_value)]
+    pos = 0
+    while pos < len(view):
+        type_code, field_code, value_pos = _read_header(view, pos)
+        info = _field_info(type_code, field_code)
+        end = _skip_value(view, value_pos, info)
         fields.append(
-            Field(instance.name, instance.type, instance.is_variable_length_encoded, header, value)
+            Field(info.name, info.type_name, info.is_vl, view[pos:value_pos], view[value_pos:end])
         )
+        pos = end
     return fields
 
 
 def reassemble(fields: list[Field]) -> bytes:
-    return b"".join(f.raw for f in fields)
+    return b"".join(span for f in fields for span in (f.header, f.value))
 
 
 def vl_prefix_len(field: Field) -> int:
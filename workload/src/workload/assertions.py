@@ -1,9 +1,10 @@
 """Antithesis assertion helpers for the workload."""
 
-from antithesis.assertions import assert_raw
-from antithesis.lifecycle import send_event
 from xrpl.models import Transaction, TransactionFlag
 
+# Sampling/background-batching front for the SDK; see emit.py.
+from workload.emit import assert_raw, send_event
+
 _LOC_FILE = "workload/assertions.py"
 _LOC_CLASS = ""
 _LOC_COL = 0
@@ -573,7 +574,8 @@ def tx_submitting(name: str, txn: Transaction | dict | None = None) -> None:
     """Emit the full submitted-tx body BEFORE the RPC call, so it lands on the
     branch at/before any apply-time assert (no vtime-nudge needed to recover it).
     Fires the `seen` reachability assert. Pass the FINAL signed/co-signed tx so
-    autofilled Sequence/Fee and co-sign signers are captured.
+    autofilled Sequence/Fee and co-sign signers are captured. The event is dispatched
+    inline (not deferred) to keep that ordering; only its `tx` body is sampled.
     """
     raw = _tx_body(txn)
     details: dict[str, object] = {"tx_type": name}
@@ -582,7 +584,7 @@ def tx_submitting(name: str, txn: Transaction | dict | None = None) -> None:
         details["sequence"] = str(raw.get("Sequence", ""))
         details.update(_extract_object_ids(raw))
         details["tx"] = _redact_tx(raw)
-    send_event(f"workload::submitted : {name}", details)
+    send_event(f"workload::submitted : {name}", details, defer=False)
     assert_raw(
         condition=True,
         message=_seen_id(name),
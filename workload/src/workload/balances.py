@@ -0,0 +1,228 @@
+"""Local mirror of what each workload account holds, fed by validated tx metadata.
+
+The WS listener hands every validated tx's meta to ``BalanceMirror.apply``, which reads the
+final AccountRoot / RippleState / MPToken fields out of ``AffectedNodes`` (the same entries
+``assertions._balance_changes`` reports) into ``UserAccount.balances``:
+
+- ``"XRP"`` -> drops (int)
+- ``(currency, counterparty)`` -> IOU balance (Decimal) as the account sees the trust line:
+  positive when it holds the counterparty's issue, negative when it owes it
+- ``mpt_issuance_id`` -> MPT held (int)
+
+OwnerCount sits beside them, and the reserve settings follow the ``ledgerClosed`` stream.
+
+Handlers that mean to succeed pass a drawn amount through ``solvent``, which redraws it
+inside what the sender can actually spend, so the valid band spends its budget on deep
+success paths instead of ``tecUNFUNDED*``. The mirror trails the ledger by the submits still
+in flight and knows nothing about an account until a validated tx touches it; either way
+``solvent`` falls back to the amount it was given.
+"""
+
+from __future__ import annotations
+
+from decimal import ROUND_DOWN, ROUND_UP, Decimal, InvalidOperation
+
+import xrpl.models
+from xrpl.models import IssuedCurrency
+from xrpl.models import IssuedCurrencyAmount as IOUAmount
+from xrpl.models.amounts import MPTAmount
+from xrpl.models.currencies import MPTCurrency
+
+from workload.models import UserAccount
+from workload.randoms import randint
+
+XRP = "XRP"
+
+# How the mirrors key an asset: "XRP", (currency, issuer), or an MPT issuance ID.
+AssetKey = str | tuple[str, str]
+
+_IOU_DIGITS = 15  # IOU amounts carry 16 significant digits; stay one under
+
+# Protocol defaults until the first ledgerClosed message reports the live values.
+DEFAULT_RESERVE_BASE = 1_000_000
+DEFAULT_RESERVE_INC = 200_000
+# Left unspent on top of the reserve: this tx's fee, plus a few queued behind it.
+FEE_HEADROOM = 1_000
+
+
+def _decimal(value: object) -> Decimal | None:
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def asset_key(asset: IssuedCurrency | MPTCurrency | xrpl.models.XRP) -> AssetKey:
+    if isinstance(asset, IssuedCurrency):
+        return (asset.currency, asset.issuer)
+    if isinstance(asset, MPTCurrency):
+        return asset.mpt_issuance_id
+    return XRP
+
+
+def ledger_asset_key(raw: object) -> AssetKey:
+    """Key of an ``Issue`` / amount as it appears in ledger JSON (a bare string is XRP)."""
+    if not isinstance(raw, dict):
+        return XRP
+    if "mpt_issuance_id" in raw:
+        return str(raw["mpt_issuance_id"])
+    if raw.get("issuer"):
+        return (raw.get("currency", ""), raw["issuer"])
+    return XRP
+
+
+def fmt(key: AssetKey, value: Decimal, *, up: bool = False) -> str:
+    """``value`` as an amount string for ``key``'s asset: whole drops / MPT units, IOUs at 15
+    significant digits; truncated, or rounded away from zero with ``up``. Never zero —
+    callers pass a quote they mean to submit."""
+    rounding = ROUND_UP if up else ROUND_DOWN
+    if not isinstance(key, tuple):
+        return str(max(1, int(value.quantize(Decimal(1), rounding=rounding))))
+    if value <= 0:
+        return "0.000001"
+    exp = value.adjusted() - _IOU_DIGITS + 1
+    return format(value.quantize(Decimal(1).scaleb(exp), rounding=rounding).normalize(), "f")
+
+
+def amount_for_key(key: AssetKey, value: str) -> IOUAmount | MPTAmount | str:
+    if key == XRP:
+        return value
+    if isinstance(key, tuple):
+        return IOUAmount(currency=key[0], issuer=key[1], value=value)
+    return MPTAmount(mpt_issuance_id=key, value=value)
+
+
+class BalanceMirror:
+    def __init__(self) -> None:
+        self.accounts: dict[str, UserAccount] = {}
+        self.owner_counts: dict[str, int] = {}
+        self.reserve_base = DEFAULT_RESERVE_BASE
+        self.reserve_inc = DEFAULT_RESERVE_INC
+
+    def _set(self, address: str, key: AssetKey, value: object) -> None:
+        acct = self.accounts.get(address)
+        if acct is None:
+            return
+        if value is None:
+            acct.balances.pop(key, None)
+        else:
+            acct.balances[key] = value
+
+    def apply(self, meta: dict) -> None:
+        """Fold one validated tx's AffectedNodes into the mirror. Fee burns and tec results
+        move balances too, so this runs for every validated tx, not only tesSUCCESS."""
+        for node in meta.get("AffectedNodes", []):
+            for kind in ("ModifiedNode", "CreatedNode", "DeletedNode"):
+                n = node.get(kind)
+                if isinstance(n, dict):
+                    fields = n.get("FinalFields") or n.get("NewFields") or {}
+                    self._apply_entry(n.get("LedgerEntryType", ""), fields, kind == "DeletedNode")
+
+    def _apply_entry(self, entry: str, fields: dict, deleted: bool) -> None:
+        if entry == "AccountRoot":
+            address = fields.get("Account", "")
+            if address not in self.accounts:
+                return
+            if deleted:
+                self._set(address, XRP, None)
+                self.owner_counts.pop(address, None)
+                return
+            if "Balance" in fields:
+                self._set(address, XRP, int(fields["Balance"]))
+            if "OwnerCount" in fields:
+                self.owner_counts[address] = int(fields["OwnerCount"])
+        elif entry == "RippleState":
+            balance = fields.get("Balance")
+            low = fields.get("LowLimit", {}).get("issuer", "")
+            high = fields.get("HighLimit", {}).get("issuer", "")
+            if not isinstance(balance, dict) or not low or not high:
+                return
+            currency = balance.get("currency", "")
+            value = None if deleted else _decimal(balance.get("value"))
+            # Balance is signed from the low account's side; the high side sees its negation.
+            self._set(low, (currency, high), value)
+            self._set(high, (currency, low), None if value is None else -value)
+        elif entry == "MPToken":
+            holder = fields.get("Account", "")
+            mpt_id = fields.get("MPTokenIssuanceID", "")
+            if holder and mpt_id:
+                self._set(holder, mpt_id, None if deleted else int(fields.get("MPTAmount", "0")))
+
+    def on_ledger_closed(self, msg: dict) -> None:
+        self.reserve_base = int(msg.get("reserve_base", self.reserve_base))
+        self.reserve_inc = int(msg.get("reserve_inc", self.reserve_inc))
+
+    def reserve(self, address: str) -> int:
+        return self.reserve_base + self.reserve_inc * self.owner_counts.get(address, 0)
+
+    def spendable_xrp(self, address: str) -> int | None:
+        """Drops ``address`` can send without dipping into its reserve; None if unknown."""
+        acct = self.accounts.get(address)
+        if acct is None or XRP not in acct.balances:
+            return None
+        return max(0, acct.balances[XRP] - self.reserve(address) - FEE_HEADROOM)
+
+    def iou(self, address: str, currency: str, issuer: str) -> Decimal | None:
+        """IOU ``address`` holds of ``issuer``'s ``currency``; None if unknown or if
+        ``address`` is the issuer (bounded only by its holders' limits)."""
+        acct = self.accounts.get(address)
+        if acct is None or address == issuer:
+            return None
+        value = acct.balances.get((currency, issuer))
+        return None if value is None else max(Decimal(0), value)
+
+    def mpt(self, address: str, mpt_issuance_id: str) -> int | None:
+        acct = self.accounts.get(address)
+        if acct is None:
+            return None
+        return acct.balances.get(mpt_issuance_id)
+
+    def available(self, address: str, key: AssetKey) -> Decimal | None:
+        """What ``address`` can spend of the asset keyed ``key``; None if unknown."""
+        if key == XRP:
+            value: int | Decimal | None = self.spendable_xrp(address)
+        elif isinstance(key, tuple):
+            value = self.iou(address, *key)
+        else:
+            value = self.mpt(address, key)
+        return None if value is None else Decimal(value)
+
+    def holdings(self, address: str) -> list[tuple[str, str]]:
+        """(currency, issuer) of every IOU ``address`` holds a positive balance of."""
+        acct = self.accounts.get(address)
+        if acct is None:
+            return []
+        return [k for k, v in acct.balances.items() if isinstance(k, tuple) and v > 0]
+
+    def solvent(
+        self, address: str, amount: str | IOUAmount | MPTAmount
+    ) -> str | IOUAmount | MPTAmount:
+        """``amount`` if ``address`` can cover it, else the same asset redrawn uniformly in
+        ``[1, available]``. Unchanged when the mirror can't tell or nothing is spendable:
+        an unfunded send is still a legitimate (if shallow) outcome."""
+        if isinstance(amount, str):
+            available = self.spendable_xrp(address)
+            if available is None or available < 1 or int(amount) <= available:
+                return amount
+            return str(randint(1, available))
+        if isinstance(amount, MPTAmount):
+            held = self.mpt(address, amount.mpt_issuance_id)
+            if held is None or held < 1 or int(amount.value) <= held:
+                return amount
+            return MPTAmount(mpt_issuance_id=amount.mpt_issuance_id, value=str(randint(1, held)))
+        iou = self.iou(address, amount.currency, amount.issuer)
+        if iou is None or iou <= 0 or Decimal(amount.value) <= iou:
+            return amount
+        value = str(randint(1, int(iou))) if iou >= 1 else str(iou)
+        return IOUAmount(currency=amount.currency, issuer=amount.issuer, value=value)
+
+
+_mirror = BalanceMirror()
+
+
+def configure(accounts: dict[str, UserAccount]) -> None:
+    _mirror.accounts = accounts
+
+
+def mirror() -> BalanceMirror:
+    return _mirror
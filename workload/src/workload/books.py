@@ -0,0 +1,148 @@
+"""Local order-book mirror, fed by the ``Offer`` entries in validated tx metadata.
+
+A book is keyed ``(gets, pays, domain)`` from the resting offers' side: they give ``gets``
+(their TakerGets) for ``pays`` (their TakerPays), optionally inside a permissioned domain.
+Assets are keyed like ``workload.balances`` keys them, so XRP/IOU/MPT books all share one
+structure. Each book keeps its offers sorted by quality (TakerPays / TakerGets, lower is
+better for a taker), then by sequence, as rippled's book directories order them.
+
+``quote`` uses the book opposite a new offer to size it on purpose:
+
+- ``cross``: consume the top N levels, priced at the worst of them
+- ``partial``: take a slice of the best level
+- ``outside``: rest just beyond the best level, widening the spread without crossing
+
+so offer load exercises book stepping and partial fills at real depth instead of landing
+on prices nobody is quoting.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from decimal import Decimal
+
+from workload.balances import AssetKey, _decimal, ledger_asset_key, mirror
+from workload.randoms import choice, randint, random
+
+STRATEGIES = ("cross", "partial", "outside")
+MAX_CROSS_LEVELS = 8
+_SPREAD = Decimal("0.001")  # how far "outside" sits past the best level
+
+BookKey = tuple[AssetKey, AssetKey, str | None]
+
+
+@dataclass
+class BookOffer:
+    index: str
+    account: str
+    sequence: int
+    gets: Decimal
+    pays: Decimal
+
+    @property
+    def quality(self) -> Decimal:
+        return self.pays / self.gets
+
+
+class OrderBooks:
+    def __init__(self) -> None:
+        self.offers: dict[str, BookOffer] = {}
+        self._book_of: dict[str, BookKey] = {}
+        # book -> [(quality, sequence, index)], ascending
+        self.books: dict[BookKey, list[tuple[Decimal, int, str]]] = {}
+
+    def apply(self, meta: dict) -> None:
+        for node in meta.get("AffectedNodes", []):
+            for kind, n in node.items():
+                if not isinstance(n, dict) or n.get("LedgerEntryType") != "Offer":
+                    continue
+                index = n.get("LedgerIndex", "")
+                self._remove(index)
+                if kind != "DeletedNode":
+                    self._insert(index, n.get("FinalFields") or n.get("NewFields") or {})
+
+    def _insert(self, index: str, fields: dict) -> None:
+        gets, pays = _value(fields.get("TakerGets")), _value(fields.get("TakerPays"))
+        if not index or gets is None or pays is None or gets <= 0 or pays <= 0:
+            return  # fully consumed offers linger as zero-sized until deleted
+        offer = BookOffer(
+            index=index,
+            account=fields.get("Account", ""),
+            sequence=int(fields.get("Sequence", 0)),
+            gets=gets,
+            pays=pays,
+        )
+        key = (
+            ledger_asset_key(fields.get("TakerGets")),
+            ledger_asset_key(fields.get("TakerPays")),
+            fields.get("DomainID"),
+        )
+        self.offers[index] = offer
+        self._book_of[index] = key
+        bisect.insort(self.books.setdefault(key, []), (offer.quality, offer.sequence, index))
+
+    def _remove(self, index: str) -> None:
+        offer = self.offers.pop(index, None)
+        if offer is None:
+            return
+        key = self._book_of.pop(index)
+        book = self.books[key]
+        entry = (offer.quality, offer.sequence, index)
+        i = bisect.bisect_left(book, entry)
+        if i < len(book) and book[i] == entry:
+            del book[i]
+        if not book:
+            del self.books[key]
+
+    def book(
+        self, gets: AssetKey, pays: AssetKey, domain: str | None = None, depth: int = 0
+    ) -> list[BookOffer]:
+        """Offers giving ``gets`` for ``pays``, best first; the top ``depth`` (0 = all)."""
+        entries = self.books.get((gets, pays, domain), [])
+        if depth:
+            entries = entries[:depth]
+        return [self.offers[index] for _, _, index in entries]
+
+    def quote(
+        self, account: str, gets: AssetKey, pays: AssetKey, domain: str | None = None
+    ) -> tuple[Decimal, Decimal] | None:
+        """(TakerGets, TakerPays) for a new offer from ``account`` giving ``gets`` for
+        ``pays``, sized against the opposite book by a random strategy and capped at what
+        the balance mirror says ``account`` can give. None when that book is empty, or when
+        the mirror has ``account`` holding none of ``gets``: there is nothing to size a
+        funded offer against, and the caller's own draw is as good as any."""
+        opposite = self.book(pays, gets, domain, depth=MAX_CROSS_LEVELS)
+        # Crossing the account's own offers only cancels them; quote against everyone else's.
+        opposite = [o for o in opposite if o.account != account]
+        held = mirror().available(account, gets)
+        if not opposite or (held is not None and held <= 0):
+            return None
+        strategy = choice(STRATEGIES)
+        if strategy == "cross":
+            levels = opposite[: randint(1, len(opposite))]
+            want = sum((o.gets for o in levels), Decimal(0))
+            # Their quality is what they ask per unit given; ours must match the worst level.
+            give = want * levels[-1].quality
+        elif strategy == "partial":
+            want = opposite[0].gets * Decimal(str(random() or 0.5))
+            give = want * opposite[0].quality
+        else:  # outside
+            want = opposite[0].gets * Decimal(str(random() or 0.5))
+            give = want * opposite[0].quality * (1 - _SPREAD)
+        if held is not None and held < give:
+            want, give = want * held / give, held
+        return give, want
+
+
+def _value(raw: object) -> Decimal | None:
+    if isinstance(raw, dict):
+        return _decimal(raw.get("value"))
+    return _decimal(raw)
+
+
+_books = OrderBooks()
+
+
+def books() -> OrderBooks:
+    return _books
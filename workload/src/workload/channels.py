@@ -0,0 +1,241 @@
+"""Payment-channel claim signer: off-ledger claim streams with periodic redemption.
+
+A channel's source pays its destination by handing over signed claims, each authorizing a
+larger cumulative amount; the destination redeems only now and then, with the latest claim
+it holds. ``transactions.payment_channels.channel_claim`` sends one random balance per tx,
+so none of that — claim signatures, stale claims, claims past the channel's funds — shows
+up under load.
+
+``ChannelEngine`` keeps, per channel, the highest amount the source has authorized. It signs
+claims ahead in batches of ``CHANNEL_PRESIGN``, each a random step above the last and capped
+at the channel's funded ``Amount``, on a worker thread: one signature is milliseconds of
+pure-Python curve math, and a batch on the event loop would stall every other handler. Each
+batch also signs one claim past the funds, for over-limit redemptions.
+
+Every ``channel_stream`` step streams ``CHANNEL_STREAM_BURST`` pre-signed claims per
+channel to its destination (off-ledger: nothing is submitted) and, once
+``CHANNEL_REDEEM_EVERY`` have arrived, has the destination redeem one. Usually that is the
+latest claim; with ``CHANNEL_STALE_PCT`` an older one the ledger balance has already passed
+(tecUNFUNDED_PAYMENT), and with ``CHANNEL_OVER_LIMIT_PCT`` the over-limit one
+(tecUNFUNDED_PAYMENT too). A channel whose authorized amount has reached its funds is
+topped up by its source instead. Channel ``Amount`` and ``Balance`` come from the
+``PayChannel`` nodes in validated meta; ``/channel/stream/stats`` serves claim throughput,
+signing cost and per-kind redemption outcomes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from xrpl.core.binarycodec import encode_for_signing_claim
+from xrpl.core.keypairs import sign
+
+from workload import logging, params
+from workload.fuzzstats import Bucket
+from workload.models import UserAccount
+from workload.randoms import choice, random, sample
+
+log = logging.getLogger(__name__)
+
+CHANNELS = int(os.environ.get("CHANNEL_STREAM_CHANNELS", "8"))
+PRESIGN = int(os.environ.get("CHANNEL_PRESIGN", "64"))
+BURST = int(os.environ.get("CHANNEL_STREAM_BURST", "4"))
+REDEEM_EVERY = int(os.environ.get("CHANNEL_REDEEM_EVERY", "16"))
+STALE_PCT = float(os.environ.get("CHANNEL_STALE_PCT", "0.1"))
+OVER_LIMIT_PCT = float(os.environ.get("CHANNEL_OVER_LIMIT_PCT", "0.05"))
+
+LATEST = "latest"
+STALE = "stale"
+OVER_LIMIT = "over_limit"
+
+_HELD = 64  # delivered claims a destination keeps around for stale redemptions
+
+# Signing is CPU-bound and serialized here; one worker keeps it off the event loop without
+# several threads fighting the loop for the GIL.
+_signer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="channel-claims")
+
+
+@dataclass(frozen=True)
+class Claim:
+    amount: int  # cumulative drops authorized
+    signature: str
+
+
+@dataclass
+class ChannelEntry:
+    index: str
+    source: str
+    destination: str
+    public_key: str
+    amount: int = 0  # drops funded, per the ledger
+    balance: int = 0  # drops already paid out, per the ledger
+    authorized: int = 0  # highest amount signed for
+    presigned: deque[Claim] = field(default_factory=deque)
+    held: deque[Claim] = field(default_factory=lambda: deque(maxlen=_HELD))
+    over_limit: Claim | None = None
+    arrived: int = 0  # claims delivered since the last redemption
+
+    @property
+    def exhausted(self) -> bool:
+        """Nothing left to sign for below the funded amount."""
+        return not self.presigned and self.authorized >= self.amount
+
+
+def sign_claims(channel: str, amounts: list[int], private_key: str) -> list[Claim]:
+    """Claims for ``amounts`` on ``channel``, signed with ``private_key``."""
+    return [
+        Claim(
+            amount,
+            sign(
+                bytes.fromhex(encode_for_signing_claim({"channel": channel, "amount": amount})),
+                private_key,
+            ),
+        )
+        for amount in amounts
+    ]
+
+
+class ChannelEngine:
+    def __init__(self) -> None:
+        self.channels: dict[str, ChannelEntry] = {}
+        self._signing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.counts: Counter[str] = Counter()
+        self.sign_seconds = 0.0
+        self.actions: dict[str, Bucket] = defaultdict(Bucket)
+        self._started = time.monotonic()
+
+    def apply(self, meta: dict) -> None:
+        for node in meta.get("AffectedNodes", []):
+            for kind, n in node.items():
+                if not isinstance(n, dict) or n.get("LedgerEntryType") != "PayChannel":
+                    continue
+                index = n.get("LedgerIndex", "")
+                if kind == "DeletedNode":
+                    if self.channels.pop(index, None) is not None:
+                        self.counts["closed"] += 1
+                elif index:
+                    self._update(index, n.get("FinalFields") or n.get("NewFields") or {})
+
+    def _update(self, index: str, fields: dict) -> None:
+        entry = self.channels.get(index)
+        if entry is None:
+            entry = self.channels[index] = ChannelEntry(
+                index=index,
+                source=fields.get("Account", ""),
+                destination=fields.get("Destination", ""),
+                public_key=fields.get("PublicKey", ""),
+            )
+        balance = int(fields.get("Balance", 0))
+        self.counts["claimed_drops"] += max(0, balance - entry.balance)
+        entry.amount = int(fields.get("Amount", 0))
+        entry.balance = balance
+        # Claims at or below the paid-out balance can never redeem; start signing above it.
+        entry.authorized = max(entry.authorized, balance)
+
+    def live(self, accounts: dict[str, UserAccount]) -> list[ChannelEntry]:
+        """Channels whose source and destination the workload both controls."""
+        return [
+            c for c in self.channels.values() if c.source in accounts and c.destination in accounts
+        ]
+
+    def streaming(self, accounts: dict[str, UserAccount], count: int) -> list[ChannelEntry]:
+        channels = self.live(accounts)
+        return sample(channels, min(count, len(channels)))
+
+    def presign(self, entry: ChannelEntry, source: UserAccount) -> None:
+        """Start a background batch of claims for ``entry`` once its stock runs low."""
+        if entry.index in self._signing or len(entry.presigned) >= PRESIGN // 4:
+            return
+        if entry.authorized >= entry.amount:
+            return
+        wallet = source.wallet
+        if wallet.public_key.upper() != entry.public_key.upper():
+            self.counts["foreign_key"] += 1
+            return
+        amounts: list[int] = []
+        top = entry.authorized
+        while len(amounts) < PRESIGN and top < entry.amount:
+            top = min(entry.amount, top + params.channel_claim_step())
+            amounts.append(top)
+        # Reserved now, so the next batch continues above this one even before it's signed.
+        entry.authorized = top
+        over = entry.amount + params.channel_claim_step()
+        self._signing.add(entry.index)
+        task = asyncio.get_running_loop().create_task(
+            self._sign(entry, amounts, over, wallet.private_key)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _sign(
+        self, entry: ChannelEntry, amounts: list[int], over: int, private_key: str
+    ) -> None:
+        started = time.monotonic()
+        try:
+            claims = await asyncio.get_running_loop().run_in_executor(
+                _signer, sign_claims, entry.index, [*amounts, over], private_key
+            )
+        except Exception as e:
+            log.warning("Claim signing for channel %s failed: %s", entry.index, e)
+            return
+        finally:
+            self._signing.discard(entry.index)
+        self.sign_seconds += time.monotonic() - started
+        self.counts["signed"] += len(claims)
+        self.counts["sign_batches"] += 1
+        *claims, entry.over_limit = claims
+        entry.presigned.extend(claims)
+
+    def stream(self, entry: ChannelEntry) -> int:
+        """Hand up to ``BURST`` pre-signed claims to the destination; how many went."""
+        sent = 0
+        while sent < BURST and entry.presigned:
+            entry.held.append(entry.presigned.popleft())
+            sent += 1
+        entry.arrived += sent
+        self.counts["streamed"] += sent
+        return sent
+
+    def redemption(self, entry: ChannelEntry) -> tuple[str, Claim] | None:
+        """(kind, claim) the destination redeems now; None until ``REDEEM_EVERY`` claims
+        have arrived since the last one."""
+        if entry.arrived < REDEEM_EVERY or not entry.held:
+            return None
+        entry.arrived = 0
+        roll = random()
+        if roll < OVER_LIMIT_PCT and entry.over_limit is not None:
+            return OVER_LIMIT, entry.over_limit
+        if roll < OVER_LIMIT_PCT + STALE_PCT:
+            stale = [c for c in entry.held if c.amount <= entry.balance]
+            if stale:
+                return STALE, choice(stale)
+        return LATEST, entry.held[-1]
+
+    def record(self, action: str, outcome: str, latency: float) -> None:
+        self.actions[action].add(outcome, latency)
+
+    def snapshot(self) -> dict:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        signed = self.counts["signed"]
+        return {
+            "channels": len(self.channels),
+            "presigned": sum(len(c.presigned) for c in self.channels.values()),
+            "signing": len(self._signing),
+            "claims_per_second": round(self.counts["streamed"] / elapsed, 4),
+            "sign_ms_per_claim": round(1000 * self.sign_seconds / signed, 3) if signed else 0.0,
+            **self.counts,
+            "actions": {action: b.summary(elapsed) for action, b in sorted(self.actions.items())},
+        }
+
+
+_engine = ChannelEngine()
+
+
+def channels() -> ChannelEngine:
+    return _engine
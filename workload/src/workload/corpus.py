@@ -0,0 +1,156 @@
+"""Coverage-guided fuzz corpus: remember which mutation recipes reached new engine results
+and spend the finite submit budget replaying them.
+
+A seed is the op recipe ``submit_fuzzed`` recorded (``set:Amount``, ``drop:Destination``,
+``raw:truncate`` ...) plus the result it produced, keyed by tx type. Bases are rebuilt fresh
+on every call, so the recipe — not a stored blob — is what gets replayed against live state.
+Novel or rare results admit a seed; replays that find something new gain energy, barren
+replays decay, AFL-style. Admitted seeds append to a JSONL file so a later run starts warm.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from antithesis.lifecycle import send_event
+
+from workload import logging
+from workload.randoms import random
+
+log = logging.getLogger(__name__)
+
+# Probability a fuzz call replays a seed instead of mutating from scratch (when the type
+# has seeds). Kept below 1 so fresh exploration never stops.
+REPLAY_CHANCE = 0.5
+
+# A result seen at most this many times for a type still counts as rare enough to keep.
+_RARE_THRESHOLD = 2
+
+_NEW_RESULT_ENERGY = 8.0
+_RARE_RESULT_ENERGY = 2.0
+_FIND_BOOST = 2.0  # energy multiplier when a replay finds something new
+_DECAY = 0.9  # energy multiplier when a replay finds nothing
+_MIN_ENERGY = 0.05
+_MAX_ENERGY = 64.0
+
+_SEEDS_FILE = "seeds.jsonl"
+
+
+@dataclass
+class Seed:
+    tx_type: str
+    ops: list[str]
+    engine_result: str
+    energy: float = 1.0
+    picks: int = 0
+    finds: int = 0
+
+
+@dataclass
+class FuzzCorpus:
+    path: Path | None = None
+    seeds: dict[str, list[Seed]] = field(default_factory=lambda: defaultdict(list))
+    # tx type -> engine result -> count, across every fuzz attempt (seeded or not).
+    results: dict[str, Counter[str]] = field(default_factory=lambda: defaultdict(Counter))
+    # (tx type, op) -> times that op sat in a recipe that found a new/rare result.
+    op_finds: Counter[tuple[str, str]] = field(default_factory=Counter)
+
+    def load(self) -> None:
+        """Re-admit persisted seeds; unreadable lines are skipped, never fatal."""
+        if self.path is None:
+            return
+        seeds_file = self.path / _SEEDS_FILE
+        if not seeds_file.exists():
+            return
+        loaded = 0
+        for line in seeds_file.read_text().splitlines():
+            try:
+                raw = json.loads(line)
+                seed = Seed(
+                    tx_type=raw["tx_type"], ops=list(raw["ops"]), engine_result=raw["engine_result"]
+                )
+            except (ValueError, KeyError, TypeError):
+                continue
+            self.seeds[seed.tx_type].append(seed)
+            self.results[seed.tx_type][seed.engine_result] += 1
+            loaded += 1
+        log.info("Fuzz corpus: loaded %d seeds from %s", loaded, seeds_file)
+
+    def pick(self, tx_type: str) -> Seed | None:
+        """Energy-weighted seed for ``tx_type``, or None to mutate from scratch."""
+        pool = self.seeds.get(tx_type)
+        if not pool or random() >= REPLAY_CHANCE:
+            return None
+        target = random() * sum(s.energy for s in pool)
+        for seed in pool:
+            target -= seed.energy
+            if target <= 0:
+                break
+        seed.picks += 1
+        return seed
+
+    def record(self, tx_type: str, ops: list[str], engine_result: str, parent: Seed | None) -> bool:
+        """Count the outcome; admit a seed if the result is new or rare for the type.
+        Returns True when the attempt was interesting."""
+        seen = self.results[tx_type][engine_result]
+        self.results[tx_type][engine_result] = seen + 1
+        interesting = seen <= _RARE_THRESHOLD and bool(ops)
+        if parent is not None:
+            if interesting:
+                parent.finds += 1
+                parent.energy = min(_MAX_ENERGY, parent.energy * _FIND_BOOST)
+            else:
+                parent.energy = max(_MIN_ENERGY, parent.energy * _DECAY)
+        if not interesting:
+            return False
+        for op in ops:
+            self.op_finds[(tx_type, op)] += 1
+        if any(s.ops == ops and s.engine_result == engine_result for s in self.seeds[tx_type]):
+            return True
+        seed = Seed(
+            tx_type=tx_type,
+            ops=list(ops),
+            engine_result=engine_result,
+            energy=_NEW_RESULT_ENERGY if seen == 0 else _RARE_RESULT_ENERGY,
+        )
+        self.seeds[tx_type].append(seed)
+        self._persist(seed)
+        send_event(
+            "workload::fuzz_corpus_seed",
+            {"tx_type": tx_type, "ops": "; ".join(ops), "engine_result": engine_result},
+        )
+        return True
+
+    def penalize(self, parent: Seed | None) -> None:
+        """A replay that never reached the node (unencodable) only decays its seed."""
+        if parent is not None:
+            parent.energy = max(_MIN_ENERGY, parent.energy * _DECAY)
+
+    def _persist(self, seed: Seed) -> None:
+        if self.path is None:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            record = {"tx_type": seed.tx_type, "ops": seed.ops, "engine_result": seed.engine_result}
+            with (self.path / _SEEDS_FILE).open("a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            log.warning("Fuzz corpus: persisting seed failed: %s", e)
+
+
+_corpus = FuzzCorpus()
+
+
+def configure(path: Path | None) -> None:
+    """Point the corpus at its on-disk directory and load any earlier seeds. Called once
+    at init; without it the corpus still steers fuzzing, just in memory only."""
+    global _corpus
+    _corpus = FuzzCorpus(path=path)
+    _corpus.load()
+
+
+def corpus() -> FuzzCorpus:
+    return _corpus
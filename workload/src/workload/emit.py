@@ -0,0 +1,164 @@
+"""Emission layer in front of the Antithesis SDK for the per-tx event hot path.
+
+Every validated tx fires five-plus ``assert_raw`` calls and a detail-heavy ``send_event``.
+The asserts are cheap after their first hit: the SDK tracks each assert id and only encodes
+and emits its first pass and first fail, so they go straight through. Each ``send_event``,
+though, is JSON-encoded and written out in full. For those, this layer:
+
+- keeps bulky detail keys (``tx``, ``balance_changes``) on a deterministic
+  ``DETAIL_SAMPLE`` fraction of each event, not on every one. Sampling is counter-based
+  on purpose: drawing from ``workload.randoms`` would perturb Antithesis' exploration.
+- hands the event to a background thread that dispatches it in batches.
+
+Callers whose emission order against the RPC matters pass ``defer=False``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import math
+import os
+import queue
+import threading
+from collections import Counter
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from antithesis.assertions import assert_raw as _sdk_assert_raw
+from antithesis.lifecycle import send_event as _sdk_send_event
+
+from workload import logging
+
+log = logging.getLogger(__name__)
+
+DETAIL_SAMPLE = min(1.0, max(0.0, float(os.environ.get("ASSERT_DETAIL_SAMPLE", "0.1"))))
+BACKGROUND = os.environ.get("ASSERT_BACKGROUND", "1") != "0"
+
+_BULKY_DETAILS = ("tx", "balance_changes", "balance_changes_truncated")
+_BATCH_MAX = 256
+_FLUSH_TIMEOUT = 5.0
+
+_event_counts: Counter[str] = Counter()
+
+_queue: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+_dispatch_lock = threading.Lock()  # the SDK handler isn't documented thread-safe
+_worker: threading.Thread | None = None
+# Deferred calls queued but not yet dispatched, counting those the worker has already taken
+# off the queue: an empty queue alone doesn't mean everything went out, so ``flush`` waits
+# for this to reach zero.
+_pending = 0
+_idle = threading.Condition()
+
+
+def _dispatch(fn: Callable[[], None]) -> None:
+    with _dispatch_lock:
+        try:
+            fn()
+        except Exception as e:  # an SDK serialization failure must not kill the worker
+            log.warning("Antithesis emit failed: %s: %s", type(e).__name__, e)
+
+
+def _drain(block: bool) -> int:
+    global _pending
+    batch: list[Callable[[], None]] = []
+    try:
+        batch.append(_queue.get(block=block))
+        while len(batch) < _BATCH_MAX:
+            batch.append(_queue.get_nowait())
+    except queue.Empty:
+        pass
+    for fn in batch:
+        _dispatch(fn)
+    if batch:
+        with _idle:
+            _pending -= len(batch)
+            _idle.notify_all()
+    return len(batch)
+
+
+def _run() -> None:
+    while True:
+        _drain(block=True)
+
+
+def _submit(fn: Callable[[], None], defer: bool) -> None:
+    global _worker, _pending
+    if not (defer and BACKGROUND):
+        _dispatch(fn)
+        return
+    if _worker is None:
+        _worker = threading.Thread(target=_run, name="antithesis-emit", daemon=True)
+        _worker.start()
+    with _idle:
+        _pending += 1
+    _queue.put(fn)
+
+
+def flush() -> None:
+    """Dispatch everything still queued, on the calling thread, then wait (up to
+    ``_FLUSH_TIMEOUT``) for any batch the worker is partway through. Called at shutdown and
+    before a hard exit, which skips atexit."""
+    while _drain(block=False):
+        pass
+    with _idle:
+        if not _idle.wait_for(lambda: _pending == 0, timeout=_FLUSH_TIMEOUT):
+            log.warning("Antithesis emit flush timed out with a batch still in flight")
+
+
+atexit.register(flush)
+
+
+def assert_raw(
+    *,
+    condition: bool,
+    message: str,
+    details: Mapping[str, Any] | None,
+    loc_filename: str,
+    loc_function: str,
+    loc_class: str,
+    loc_begin_line: int,
+    loc_begin_column: int,
+    hit: bool,
+    must_hit: bool,
+    assert_type: str,
+    display_type: str,
+    assert_id: str,
+) -> None:
+    """``antithesis.assertions.assert_raw``, dispatched inline: the SDK already skips all
+    but the first pass and first fail of each id before encoding anything."""
+    _dispatch(
+        lambda: _sdk_assert_raw(
+            condition=condition,
+            message=message,
+            details=details,
+            loc_filename=loc_filename,
+            loc_function=loc_function,
+            loc_class=loc_class,
+            loc_begin_line=loc_begin_line,
+            loc_begin_column=loc_begin_column,
+            hit=hit,
+            must_hit=must_hit,
+            assert_type=assert_type,
+            display_type=display_type,
+            assert_id=assert_id,
+        )
+    )
+
+
+def _sampled(name: str, details: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Strip bulky keys from all but a ``DETAIL_SAMPLE`` fraction of ``name``'s events: the
+    n-th keeps them when ``n * DETAIL_SAMPLE`` crosses an integer, so any rate in [0, 1]
+    is met exactly over a run, starting with the first event."""
+    if not any(k in details for k in _BULKY_DETAILS):
+        return details
+    n = _event_counts[name]
+    _event_counts[name] = n + 1
+    if math.ceil((n + 1) * DETAIL_SAMPLE) > math.ceil(n * DETAIL_SAMPLE):
+        return details
+    return {k: v for k, v in details.items() if k not in _BULKY_DETAILS}
+
+
+def send_event(name: str, details: Mapping[str, Any] | None = None, *, defer: bool = True) -> None:
+    """``antithesis.lifecycle.send_event`` with bulky-detail sampling and deferral."""
+    payload = _sampled(name, details) if details else details
+    _submit(lambda: _sdk_send_event(name, payload), defer=defer)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
 from contextlib import AbstractContextManager
 
@@ -9,12 +10,16 @@ import httpx
 from antithesis.lifecycle import send_event
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.clients import XRPLRequestFailureException
+from xrpl.core.binarycodec import encode
 from xrpl.core.binarycodec.definitions.definitions import load_definitions
 from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
 from xrpl.models.transactions.transaction import Transaction
 from xrpl.wallet import Wallet
 
 from workload import params, rawfuzz
+from workload.corpus import Seed, corpus
+from workload.fuzzstats import PREDICTED_REJECT, SKIPPED, TIMEOUT, UNDECODABLE, stats
+from workload.preflight import preflight
 from workload.randoms import choice, randint, random
 from workload.submit import submit_raw
 
@@ -181,10 +186,11 @@ def _hostile_for_type(field_type: str) -> object:
     return None
 
 
-def fuzz_mutate(tx_dict: dict) -> list[str]:
-    """Apply 1-3 random mutations to ``tx_dict`` in place; return op descriptions."""
+def fuzz_mutate(tx_dict: dict, rounds: int | None = None) -> list[str]:
+    """Apply ``rounds`` (default 1-3) random mutations to ``tx_dict`` in place; return
+    op descriptions."""
     ops: list[str] = []
-    for _ in range(randint(1, 3)):
+    for _ in range(rounds if rounds is not None else randint(1, 3)):
         # Recompute each round — a prior drop may have removed fields.
         present = [k for k in tx_dict if k not in _PROTECTED]
         if random() < 0.8:
@@ -214,6 +220,69 @@ def fuzz_mutate(tx_dict: dict) -> list[str]:
     return ops
 
 
+_INJECTABLE_TYPE = dict(_INJECTABLE)
+
+# Chance a corpus replay stacks one fresh random op on top of the recorded recipe
+# (AFL havoc): the replay alone re-walks a known path, the extra op steps off it.
+HAVOC_CHANCE = 0.5
+
+
+def replay_mutations(tx_dict: dict, recipe: list[str]) -> list[str]:
+    """Re-apply a recorded codec-legal op recipe to a fresh base, drawing new hostile
+    values for the same fields. Ops whose field no longer fits (absent for set/drop/morph,
+    present for inject) are skipped; returns the ops actually applied."""
+    ops: list[str] = []
+    for op in recipe:
+        kind, _, field = op.partition(":")
+        if field in _PROTECTED:
+            continue
+        if kind in ("set", "noop") and field in tx_dict:
+            before = tx_dict[field]
+            after = _hostile(before)
+            tx_dict[field] = after
+            ops.append(f"set:{field}" if after != before else f"noop:{field}")
+        elif kind == "morph" and field in tx_dict:
+            tx_dict[field] = _type_morph(tx_dict[field])
+            ops.append(op)
+        elif kind == "drop" and field in tx_dict:
+            tx_dict.pop(field)
+            ops.append(op)
+        elif kind == "inject" and field not in tx_dict and field in _INJECTABLE_TYPE:
+            tx_dict[field] = _hostile_for_type(_INJECTABLE_TYPE[field])
+            ops.append(op)
+    return ops
+
+
+def _escalation_for(name: str, ops: list[str], seed: Seed | None) -> rawfuzz.Escalation | None:
+    """Raw-band escalation for this call: a raw seed replays its operator, a codec-legal
+    seed never escalates, and an unseeded call escalates at ``RAW_CHANCE``."""
+    if seed is not None:
+        raw = [op.removeprefix("raw:") for op in seed.ops if op.startswith("raw:")]
+        return rawfuzz.escalate_tag(name, raw[0], ops) if raw else None
+    return rawfuzz.escalate(name, ops) if random() < rawfuzz.RAW_CHANCE else None
+
+
+_MISSING = object()
+
+# What an unencodable mutated dict raises from the codec (or from submit_raw's encode).
+_ENCODE_ERRORS = (XRPLBinaryCodecException, ValueError, TypeError, KeyError, OverflowError)
+
+
+def _transplant(original: dict, planned: dict) -> Callable[[dict], None]:
+    """Replay the diff ``original`` → ``planned`` onto the autofilled dict. Mutations never
+    touch ``_PROTECTED`` (the fields autofill owns), so the result is the same tx the plan
+    was encoded and checked as."""
+    dropped = [k for k in original if k not in planned]
+    changed = {k: v for k, v in planned.items() if original.get(k, _MISSING) != v}
+
+    def _apply(d: dict) -> None:
+        for k in dropped:
+            d.pop(k, None)
+        d.update(changed)
+
+    return _apply
+
+
 async def submit_fuzzed(
     name: str,
     base: Transaction,
@@ -224,13 +293,25 @@ async def submit_fuzzed(
     an unserializable shape emits ``workload::fuzz_skipped`` and returns None.
 
     A ``RAW_CHANCE`` fraction escalates to the raw band when it covers ``name``.
+    The fuzz corpus may instead hand back a productive earlier recipe to replay; every
+    outcome is fed back so the corpus can re-weight its seeds. Codec-legal mutations are
+    checked offline first: unencodable ones, and ones ``preflight`` predicts end in a known
+    shallow reject (past their sampling budget), never reach the network.
     """
     ops: list[str] = []
     dict_mutate: Callable[[dict], None] | None
     encode_ctx: AbstractContextManager[None] | None
     blob_mutate: Callable[[bytes], bytes] | None
+    rule: str | None = None
 
-    escalation = rawfuzz.escalate(name, ops) if random() < rawfuzz.RAW_CHANCE else None
+    started = time.monotonic()
+    fuzz_stats = stats()
+    fuzz_corpus = corpus()
+    checker = preflight()
+    seed = fuzz_corpus.pick(name)
+    escalation = _escalation_for(name, ops, seed)
+    if seed is not None and escalation is None and any(op.startswith("raw:") for op in seed.ops):
+        seed = None  # raw operator gone or no longer applies: mutate from scratch
     if escalation is not None:
         dict_mutate = escalation.dict_mutate
         encode_ctx = escalation.encode_ctx
@@ -238,17 +319,44 @@ async def submit_fuzzed(
     else:
         encode_ctx = None
         blob_mutate = None
-
-        def _codec_legal(d: dict) -> None:
-            ops.extend(fuzz_mutate(d))
-
-        dict_mutate = _codec_legal
+        # Plan the codec-legal mutation on the pre-autofill dict so an unencodable or
+        # predicted-doomed shape is dropped before autofill/sign/submit spend any RPCs.
+        original = base.to_xrpl()
+        planned = base.to_xrpl()
+        if seed is None:
+            ops.extend(fuzz_mutate(planned))
+        else:
+            ops.extend(replay_mutations(planned, seed.ops))
+            if not ops or random() < HAVOC_CHANCE:
+                ops.extend(fuzz_mutate(planned, rounds=1))
+        try:
+            encode(planned)
+        except _ENCODE_ERRORS as e:
+            fuzz_corpus.penalize(seed)
+            fuzz_stats.record(name, ops, SKIPPED, time.monotonic() - started)
+            send_event(
+                "workload::fuzz_skipped",
+                {"tx_type": name, "ops": "; ".join(ops), "error": type(e).__name__},
+            )
+            return None
+        rule = checker.predict(name, planned, ops)
+        if rule is not None and checker.should_skip(name, rule, ops):
+            fuzz_corpus.penalize(seed)
+            fuzz_stats.record(name, ops, PREDICTED_REJECT, time.monotonic() - started)
+            send_event(
+                "workload::fuzz_predicted_reject",
+                {"tx_type": name, "ops": "; ".join(ops), "rule": rule},
+            )
+            return None
+        dict_mutate = _transplant(original, planned)
 
     try:
         result = await submit_raw(
             name, base, client, wallet, dict_mutate, encode_ctx=encode_ctx, blob_mutate=blob_mutate
         )
-    except (XRPLBinaryCodecException, ValueError, TypeError, KeyError, OverflowError) as e:
+    except _ENCODE_ERRORS as e:
+        fuzz_corpus.penalize(seed)
+        fuzz_stats.record(name, ops, SKIPPED, time.monotonic() - started)
         send_event(
             "workload::fuzz_skipped",
             {"tx_type": name, "ops": "; ".join(ops), "error": type(e).__name__},
@@ -256,6 +364,10 @@ async def submit_fuzzed(
         return None
     except httpx.TimeoutException as e:
         # Node hung on the blob past xrpl-py's 10s ceiling — a DoS smell, not a build failure.
+        fuzz_corpus.record(name, ops, TIMEOUT, seed)
+        fuzz_stats.record(name, ops, TIMEOUT, time.monotonic() - started)
+        if escalation is None:
+            checker.learn(name, ops, rule, TIMEOUT)
         send_event(
             "workload::fuzz_timeout",
             {"tx_type": name, "ops": "; ".join(ops), "error": type(e).__name__},
@@ -263,19 +375,30 @@ async def submit_fuzzed(
         return None
     except XRPLRequestFailureException:
         # Non-JSON response: the node choked rather than cleanly rejecting — crash-adjacent.
+        fuzz_corpus.record(name, ops, UNDECODABLE, seed)
+        fuzz_stats.record(name, ops, UNDECODABLE, time.monotonic() - started)
+        if escalation is None:
+            checker.learn(name, ops, rule, UNDECODABLE)
         send_event(
             "workload::fuzz_undecodable_response",
             {"tx_type": name, "ops": "; ".join(ops)},
         )
         return None
     tx_hash = result.get("tx_json", {}).get("hash", "") or result.get("hash", "")
+    engine_result = result.get("engine_result", "")
+    outcome = engine_result or result.get("error", "")
+    fuzz_corpus.record(name, ops, engine_result, seed)
+    fuzz_stats.record(name, ops, outcome, time.monotonic() - started)
+    if escalation is None:
+        checker.learn(name, ops, rule, outcome)
     send_event(
         "workload::fuzz",
         {
             "tx_type": name,
             "ops": "; ".join(ops),
-            "engine_result": result.get("engine_result", ""),
+            "engine_result": engine_result,
             "hash": tx_hash,
+            "replayed": seed is not None,
         },
     )
     return result
@@ -0,0 +1,157 @@
+"""In-process statistics for the fuzz and raw bands: which (tx type, mutation op, raw
+operator) buckets spend the submit budget, what they get back, and how long it takes.
+
+``submit_fuzzed`` records every attempt, including ones that never reach the node (codec
+skips, predicted rejects). An attempt counts once in the bucket of each distinct op it
+carried, so a two-op recipe shows up under both ops. ``/fuzz/stats`` serves the live
+snapshot; at shutdown the table is dumped column-wise so a run's numbers can be compared
+against the weights in ``rawfuzz._OPERATORS``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from workload import logging
+from workload.preflight import is_shallow
+
+log = logging.getLogger(__name__)
+
+# Outcomes that never came from rippled's engine; everything else is an engine result
+# (or an RPC error string when there was none).
+SKIPPED = "skipped"
+PREDICTED_REJECT = "predicted_reject"
+TIMEOUT = "timeout"
+UNDECODABLE = "undecodable"
+
+_NONE = "-"  # bucket label for "no mutation op" / "no raw operator"
+
+_COLUMNS = ("tx_type", "op", "raw_operator", "outcome", "count", "latency_total", "latency_max")
+
+
+@dataclass
+class Bucket:
+    attempts: int = 0
+    outcomes: Counter[str] = field(default_factory=Counter)
+    latency_total: float = 0.0  # seconds, summed over attempts
+    latency_max: float = 0.0
+    # outcome -> [latency total, latency max]: a fast reject and a slow success in one
+    # bucket don't share a latency.
+    outcome_latency: dict[str, list[float]] = field(default_factory=dict)
+
+    def add(self, outcome: str, latency: float) -> None:
+        self.attempts += 1
+        self.outcomes[outcome] += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+        per = self.outcome_latency.setdefault(outcome, [0.0, 0.0])
+        per[0] += latency
+        per[1] = max(per[1], latency)
+
+    def rate(self, outcome: str) -> float:
+        return self.outcomes[outcome] / self.attempts if self.attempts else 0.0
+
+    def summary(self, elapsed: float | None = None) -> dict:
+        """Attempts, latency and outcomes for a stats endpoint; with ``elapsed`` (seconds
+        the bucket has been filling), attempts per second too."""
+        out: dict = {"attempts": self.attempts}
+        if elapsed is not None:
+            out["per_second"] = round(self.attempts / elapsed, 4)
+        out["latency_mean"] = round(self.latency_total / self.attempts, 4) if self.attempts else 0.0
+        out["latency_max"] = round(self.latency_max, 4)
+        out["outcomes"] = dict(self.outcomes.most_common())
+        return out
+
+    def deep(self) -> int:
+        """Attempts that got past preflight: an engine result that isn't a shallow reject."""
+        local = (SKIPPED, PREDICTED_REJECT, TIMEOUT, UNDECODABLE)
+        return sum(n for o, n in self.outcomes.items() if o not in local and not is_shallow(o))
+
+
+def _split(ops: list[str]) -> tuple[list[str], str]:
+    """Mutation ops (deduplicated, order kept) and the raw operator tag of one attempt."""
+    raw = next((op.removeprefix("raw:") for op in ops if op.startswith("raw:")), _NONE)
+    mutations = list(dict.fromkeys(op for op in ops if not op.startswith("raw:")))
+    return mutations or [_NONE], raw
+
+
+class FuzzStats:
+    def __init__(self) -> None:
+        self.buckets: dict[tuple[str, str, str], Bucket] = defaultdict(Bucket)
+        # raw operator -> whole attempts (one per attempt, unlike the per-op buckets).
+        self.operators: dict[str, Bucket] = defaultdict(Bucket)
+
+    def record(self, tx_type: str, ops: list[str], outcome: str, latency: float) -> None:
+        mutations, raw = _split(ops)
+        for bucket in (
+            self.operators[raw],
+            *(self.buckets[(tx_type, op, raw)] for op in mutations),
+        ):
+            bucket.add(outcome or _NONE, latency)
+
+    def by_operator(self) -> dict[str, dict]:
+        """Per raw operator (``-`` is the codec-legal band): its share of attempts and how
+        much of it got past preflight — the number to weigh against its ``_OPERATORS`` weight."""
+        total = sum(b.attempts for b in self.operators.values())
+        return {
+            raw: {
+                "attempts": b.attempts,
+                "share": round(b.attempts / total, 4) if total else 0.0,
+                "deep_rate": round(b.deep() / b.attempts, 4) if b.attempts else 0.0,
+                "latency_mean": round(b.latency_total / b.attempts, 4) if b.attempts else 0.0,
+            }
+            for raw, b in sorted(self.operators.items(), key=lambda kv: -kv[1].attempts)
+        }
+
+    def snapshot(self) -> dict:
+        rows = [
+            {
+                "tx_type": tx_type,
+                "op": op,
+                "raw_operator": raw,
+                "attempts": b.attempts,
+                "skip_rate": round(b.rate(SKIPPED) + b.rate(PREDICTED_REJECT), 4),
+                "timeout_rate": round(b.rate(TIMEOUT), 4),
+                "undecodable_rate": round(b.rate(UNDECODABLE), 4),
+                "latency_mean": round(b.latency_total / b.attempts, 4) if b.attempts else 0.0,
+                "latency_max": round(b.latency_max, 4),
+                "outcomes": dict(b.outcomes.most_common()),
+            }
+            for (tx_type, op, raw), b in sorted(self.buckets.items())
+        ]
+        return {"operators": self.by_operator(), "buckets": rows}
+
+    def dump(self, path: Path) -> None:
+        """Write one row per (bucket, outcome) as parallel columns, gzipped JSON. Columnar
+        keeps the repeated type/op/operator strings compressible and loads straight into a
+        dataframe; never fatal, shutdown must not fail on a full disk."""
+        columns: dict[str, list] = {name: [] for name in _COLUMNS}
+        for (tx_type, op, raw), b in sorted(self.buckets.items()):
+            for outcome, count in b.outcomes.items():
+                total, peak = b.outcome_latency.get(outcome, (0.0, 0.0))
+                columns["tx_type"].append(tx_type)
+                columns["op"].append(op)
+                columns["raw_operator"].append(raw)
+                columns["outcome"].append(outcome)
+                columns["count"].append(count)
+                columns["latency_total"].append(round(total, 4))
+                columns["latency_max"].append(round(peak, 4))
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(path, "wt") as f:
+                json.dump(columns, f, separators=(",", ":"))
+        except OSError as e:
+            log.warning("Fuzz stats: dump to %s failed: %s", path, e)
+            return
+        log.info("Fuzz stats: dumped %d rows to %s", len(columns["count"]), path)
+
+
+_stats = FuzzStats()
+
+
+def stats() -> FuzzStats:
+    return _stats
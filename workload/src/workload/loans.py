@@ -0,0 +1,307 @@
+"""Loan lifecycle mirror for the lending scenario engine, fed by validated tx metadata.
+
+``models.Loan`` knows a loan's borrower and broker, and a principal the updaters guess from
+``PrincipalRequested`` minus whatever was paid. ``LoanLifecycle.apply`` reads the ``Loan``
+entries themselves out of each validated tx's meta instead — PrincipalOutstanding,
+TotalValueOutstanding (principal + scheduled interest + fees), PeriodicPayment,
+PaymentRemaining, NextPaymentDueDate and the default / impaired flags — and places every
+loan in one lifecycle stage:
+
+    originated -> current -> late -> impaired -> defaulted | paid_off -> deleted
+
+``late`` comes from the scheduler's ``LOAN_LATE`` ready set, so ``advance`` runs after each
+``ledgerClosed`` to move loans whose due date has passed. Every loan also draws a ``plan``
+at origination — pay on time, pay late, pay short, get impaired, default, or pay off early
+— and ``next_action`` is what that plan does in the loan's current stage, or None while it
+waits for the clock. ``transactions.lending.loan_lifecycle`` drives the actions; the stats
+here record per-stage dwell times and per-(stage, action) throughput and submit latency,
+served at ``/loan/lifecycle/stats``.
+
+A loan is marked ``pending`` when a tx for it is submitted, and ``next_action`` holds it
+until ``apply`` sees its entry change (or ``PENDING_SECS`` pass), so neither the next step
+nor an overlapping one sends a second LoanPay against a ledger state that is about to move.
+
+Scale: each step originates up to ``ORIGINATIONS`` loans (distinct borrowers) and drives up
+to ``CONCURRENCY`` others, at most one tx per account, until ``TARGET_LOANS`` are live. So
+reaching thousands of concurrent loans takes roughly TARGET_LOANS / ORIGINATIONS steps, and
+the per-step concurrency is capped by the number of funded non-broker accounts: raise
+``LOAN_LIFECYCLE_ORIGINATIONS`` and ``LOAN_LIFECYCLE_CONCURRENCY`` together with the account
+count, and let several ``parallel_driver_loan_lifecycle_step`` drivers run at once.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from workload.balances import _decimal
+from workload.fuzzstats import Bucket
+from workload.randoms import choice
+from workload.readyset import ReadySet
+from workload.schedule import LOAN_DEFAULTABLE, LOAN_LATE, schedule
+
+ORIGINATED = "originated"
+CURRENT = "current"
+LATE = "late"
+IMPAIRED = "impaired"
+DEFAULTED = "defaulted"
+PAID_OFF = "paid_off"
+DELETED = "deleted"
+
+# Live loans the engine keeps in flight, how many it originates per step, and how many of
+# them it drives per step.
+TARGET_LOANS = int(os.environ.get("LOAN_LIFECYCLE_LOANS", "2000"))
+ORIGINATIONS = int(os.environ.get("LOAN_LIFECYCLE_ORIGINATIONS", "4"))
+CONCURRENCY = int(os.environ.get("LOAN_LIFECYCLE_CONCURRENCY", "32"))
+# How long a loan with a submitted tx waits for its meta before it may be driven again.
+PENDING_SECS = float(os.environ.get("LOAN_LIFECYCLE_PENDING_SECS", "20"))
+
+STAGES = (ORIGINATED, CURRENT, LATE, IMPAIRED, DEFAULTED, PAID_OFF)
+
+PLANS = ("on_time", "late", "partial", "impair", "default", "payoff")
+
+# Actions next_action hands the driver.
+PAY = "pay"
+PAY_LATE = "pay_late"
+PAY_PARTIAL = "pay_partial"
+PAY_OFF = "pay_off"
+IMPAIR = "impair"
+UNIMPAIR = "unimpair"
+DEFAULT = "default"
+DELETE = "delete"
+
+# Loan ledger flags (not the LoanManage tx flags, though they share bits).
+_LSF_LOAN_DEFAULT = 0x00010000
+_LSF_LOAN_IMPAIRED = 0x00020000
+
+
+@dataclass
+class LoanEntry:
+    index: str
+    borrower: str
+    broker_id: str
+    plan: str
+    principal: Decimal = Decimal(0)
+    total_outstanding: Decimal = Decimal(0)
+    management_fee: Decimal = Decimal(0)
+    periodic_payment: Decimal = Decimal(0)
+    payments_total: int = 0
+    payments_remaining: int = 0
+    next_due: int = 0
+    interval: int = 0
+    grace: int = 0
+    flags: int = 0
+    stage: str = ORIGINATED
+    opened: float = field(default_factory=time.monotonic)
+    stage_since: float = field(default_factory=time.monotonic)
+
+    @property
+    def interest(self) -> Decimal:
+        """Scheduled interest still owed: what's outstanding beyond principal and fees."""
+        return max(Decimal(0), self.total_outstanding - self.principal - self.management_fee)
+
+    def _stage(self) -> str:
+        if self.flags & _LSF_LOAN_DEFAULT:
+            return DEFAULTED
+        if self.payments_remaining == 0 or self.principal <= 0:
+            return PAID_OFF
+        if self.flags & _LSF_LOAN_IMPAIRED:
+            return IMPAIRED
+        if self.index in schedule().ready[LOAN_LATE]:
+            return LATE
+        return ORIGINATED if self.payments_remaining == self.payments_total else CURRENT
+
+
+@dataclass
+class StageStats:
+    entered: int = 0
+    exited: int = 0
+    dwell_total: float = 0.0  # seconds spent in the stage by loans that left it
+    dwell_max: float = 0.0
+
+
+class LoanLifecycle:
+    def __init__(self) -> None:
+        self.loans: dict[str, LoanEntry] = {}
+        self.by_stage: dict[str, ReadySet[str]] = {s: ReadySet() for s in STAGES}
+        self.pending: dict[str, float] = {}  # loan index -> monotonic deadline
+        self.stages: dict[str, StageStats] = defaultdict(StageStats)
+        self.actions: dict[tuple[str, str], Bucket] = defaultdict(Bucket)
+        self.completed = 0
+        self.lifetime_total = 0.0  # seconds from first sighting to LoanDelete, summed
+        self._started = time.monotonic()
+
+    def apply(self, meta: dict) -> None:
+        for node in meta.get("AffectedNodes", []):
+            for kind, n in node.items():
+                if not isinstance(n, dict) or n.get("LedgerEntryType") != "Loan":
+                    continue
+                index = n.get("LedgerIndex", "")
+                if kind == "DeletedNode":
+                    self._delete(index)
+                elif index:
+                    self._update(index, n.get("FinalFields") or n.get("NewFields") or {})
+
+    def _update(self, index: str, fields: dict) -> None:
+        self.pending.pop(index, None)
+        entry = self.loans.get(index)
+        if entry is None:
+            entry = self.loans[index] = LoanEntry(
+                index=index,
+                borrower=fields.get("Borrower", ""),
+                broker_id=fields.get("LoanBrokerID", ""),
+                plan=choice(PLANS),
+                payments_total=int(fields.get("PaymentRemaining", 0)),
+            )
+            self.stages[ORIGINATED].entered += 1
+            self.by_stage[ORIGINATED].add(index)
+        # Meta omits fields at their default, so an absent one is zero, not unchanged: a
+        # paid-off loan's PrincipalOutstanding and PaymentRemaining simply disappear.
+        entry.principal = _number(fields, "PrincipalOutstanding")
+        entry.total_outstanding = _number(fields, "TotalValueOutstanding")
+        entry.management_fee = _number(fields, "ManagementFeeOutstanding")
+        entry.periodic_payment = _number(fields, "PeriodicPayment")
+        entry.payments_remaining = int(fields.get("PaymentRemaining", 0))
+        entry.next_due = int(fields.get("NextPaymentDueDate", 0))
+        entry.interval = int(fields.get("PaymentInterval", 0))
+        entry.grace = int(fields.get("GracePeriod", 0))
+        entry.flags = int(fields.get("Flags", 0))
+        stage = entry._stage()
+        if entry.stage == IMPAIRED and stage != IMPAIRED and entry.plan == "impair":
+            entry.plan = "on_time"  # impaired once and recovered: pay out the rest
+        self._move(entry, stage)
+
+    def _move(self, entry: LoanEntry, stage: str) -> None:
+        if stage == entry.stage:
+            return
+        now = time.monotonic()
+        dwell = now - entry.stage_since
+        left = self.stages[entry.stage]
+        left.exited += 1
+        left.dwell_total += dwell
+        left.dwell_max = max(left.dwell_max, dwell)
+        self.by_stage[entry.stage].discard(entry.index)
+        entry.stage, entry.stage_since = stage, now
+        self.stages[stage].entered += 1
+        if stage != DELETED:
+            self.by_stage[stage].add(entry.index)
+
+    def _delete(self, index: str) -> None:
+        self.pending.pop(index, None)
+        entry = self.loans.pop(index, None)
+        if entry is None:
+            return
+        self._move(entry, DELETED)
+        self.completed += 1
+        self.lifetime_total += time.monotonic() - entry.opened
+
+    def advance(self) -> None:
+        """Move loans the scheduler now reports past due into ``late``."""
+        for index in schedule().ready[LOAN_LATE]:
+            entry = self.loans.get(index)
+            if entry is not None and entry.stage in (ORIGINATED, CURRENT):
+                self._move(entry, LATE)
+
+    def active(self) -> int:
+        """Loans not yet defaulted or paid off."""
+        return sum(len(self.by_stage[s]) for s in (ORIGINATED, CURRENT, LATE, IMPAIRED))
+
+    def pick(self) -> LoanEntry | None:
+        """A loan from a uniformly drawn non-empty stage, so the few loans in a rare stage
+        (impaired, defaulted) are driven as often as the many current ones."""
+        stages = [s for s in STAGES if self.by_stage[s]]
+        if not stages:
+            return None
+        index = self.by_stage[choice(stages)].pick()
+        return None if index is None else self.loans.get(index)
+
+    def mark(self, index: str) -> None:
+        """A tx for the loan is in flight: hold it until its meta arrives."""
+        self.pending[index] = time.monotonic() + PENDING_SECS
+
+    def settle(self, index: str) -> None:
+        """The in-flight tx won't produce meta (rejected, or never reached the server)."""
+        self.pending.pop(index, None)
+
+    def in_flight(self, index: str) -> bool:
+        deadline = self.pending.get(index)
+        if deadline is None:
+            return False
+        if time.monotonic() < deadline:
+            return True
+        del self.pending[index]
+        return False
+
+    def next_action(self, entry: LoanEntry) -> str | None:
+        """What ``entry``'s plan does in its stage; None while it waits on the clock or on
+        a tx already in flight."""
+        if self.in_flight(entry.index):
+            return None
+        stage, plan = entry.stage, entry.plan
+        defaultable = entry.index in schedule().ready[LOAN_DEFAULTABLE]
+        if stage in (DEFAULTED, PAID_OFF):
+            return DELETE
+        if plan == "default":
+            if defaultable:
+                return DEFAULT
+            return IMPAIR if stage == LATE else None
+        if stage == IMPAIRED:
+            return UNIMPAIR if plan == "impair" else PAY_LATE
+        if stage == LATE:
+            return PAY_LATE
+        if plan == "late":
+            return None
+        if plan == "impair":
+            return IMPAIR
+        if plan == "payoff":
+            return PAY_OFF
+        # Installments go in during the back half of their period, not the moment the
+        # previous one validates, so a loan's payments keep pace with its PaymentInterval.
+        if schedule().started and schedule().now < entry.next_due - entry.interval // 2:
+            return None
+        if plan == "partial":
+            return choice([PAY_PARTIAL, PAY])
+        return PAY
+
+    def record(self, stage: str, action: str, outcome: str, latency: float) -> None:
+        self.actions[(stage, action)].add(outcome, latency)
+
+    def snapshot(self) -> dict:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        return {
+            "loans": len(self.loans),
+            "pending": len(self.pending),
+            "completed": self.completed,
+            "lifetime_mean": round(self.lifetime_total / self.completed, 3)
+            if self.completed
+            else 0.0,
+            "stages": {
+                stage: {
+                    "live": len(self.by_stage[stage]) if stage in self.by_stage else 0,
+                    "entered": s.entered,
+                    "exited": s.exited,
+                    "per_second": round(s.entered / elapsed, 4),
+                    "dwell_mean": round(s.dwell_total / s.exited, 3) if s.exited else 0.0,
+                    "dwell_max": round(s.dwell_max, 3),
+                }
+                for stage, s in self.stages.items()
+            },
+            "actions": [
+                {"stage": stage, "action": action, **b.summary(elapsed)}
+                for (stage, action), b in sorted(self.actions.items())
+            ],
+        }
+
+
+def _number(fields: dict, name: str) -> Decimal:
+    return _decimal(fields.get(name, 0)) or Decimal(0)
+
+
+_lifecycle = LoanLifecycle()
+
+
+def lifecycle() -> LoanLifecycle:
+    return _lifecycle
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from typing import Any
 
 import xrpl.models
 from xrpl.models.currencies import IssuedCurrency, MPTCurrency
 from xrpl.wallet import Wallet
 
+from workload.readyset import ReadySet
+from workload.wallets import wallet_at
+
 
 def short_address(address: str) -> str:
     return "..".join([address[:6], address[-5:]])
@@ -17,6 +22,64 @@ class NFT:
     nftoken_id: str
 
 
+class NFTSet:
+    """Tracked NFTs, indexed by token and by owner.
+
+    Add, remove, change of owner and a uniform pick are all O(1), so a burn or transfer no
+    longer rescans every tracked token (or every account) to find the one it touched.
+    """
+
+    def __init__(self) -> None:
+        self._nfts: dict[str, NFT] = {}
+        self._ids: ReadySet[str] = ReadySet()
+        self._owned: dict[str, ReadySet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._nfts)
+
+    def __iter__(self) -> Iterator[NFT]:
+        return iter(list(self._nfts.values()))
+
+    def get(self, nftoken_id: str) -> NFT | None:
+        return self._nfts.get(nftoken_id)
+
+    def owned(self, owner: str) -> ReadySet[str]:
+        """Token ids ``owner`` holds (an empty set, not stored, for an unknown owner)."""
+        return self._owned.get(owner) or ReadySet()
+
+    def pick(self) -> NFT:
+        """A uniformly drawn tracked NFT; raises IndexError when there are none."""
+        nftoken_id = self._ids.pick()
+        if nftoken_id is None:
+            raise IndexError("no tracked NFTs")
+        return self._nfts[nftoken_id]
+
+    def add(self, nft: NFT) -> None:
+        self.remove(nft.nftoken_id)
+        self._nfts[nft.nftoken_id] = nft
+        self._ids.add(nft.nftoken_id)
+        self._owned.setdefault(nft.owner, ReadySet()).add(nft.nftoken_id)
+
+    def remove(self, nftoken_id: str) -> NFT | None:
+        nft = self._nfts.pop(nftoken_id, None)
+        if nft is None:
+            return None
+        self._ids.discard(nftoken_id)
+        owned = self._owned.get(nft.owner)
+        if owned is not None:
+            owned.discard(nftoken_id)
+            if not owned:
+                del self._owned[nft.owner]
+        return nft
+
+    def move(self, nftoken_id: str, owner: str) -> NFT | None:
+        """Record ``owner`` as the token's new holder; returns the NFT as it was before."""
+        old = self.remove(nftoken_id)
+        if old is not None:
+            self.add(NFT(owner=owner, nftoken_id=nftoken_id))
+        return old
+
+
 @dataclass
 class NFTOffer:
     creator: str
@@ -25,34 +88,74 @@ class NFTOffer:
     is_sell: bool
 
 
-@dataclass
 class Account:
-    wallet: Wallet
-    address: str = field(init=False)
+    """An account the workload controls.
+
+    Holds its wallet outright, or just an address plus a row of the compact seed table, with
+    the wallet derived on first use (see ``workload.wallets``). Slotted, with mutable state
+    allocated on first touch: a synthetic genesis can carry a million of these.
+    """
+
+    __slots__ = ("_row", "_wallet", "address")
+
+    def __init__(
+        self, wallet: Wallet | None = None, *, address: str | None = None, row: int | None = None
+    ) -> None:
+        self._wallet = wallet
+        self._row = row
+        if wallet is not None:
+            self.address: str = wallet.address
+        elif address is not None and row is not None:
+            self.address = address
+        else:
+            raise ValueError("Account needs a wallet, or an address and a seed-table row")
 
-    def __post_init__(self) -> None:
-        self.address = self.wallet.address
+    @property
+    def wallet(self) -> Wallet:
+        if self._wallet is not None:
+            return self._wallet
+        assert self._row is not None
+        return wallet_at(self._row)
 
     def __str__(self) -> str:
         return short_address(self.address)
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.address})"
+
 
-@dataclass
 class Gateway(Account):
-    issued_currencies: dict = field(default_factory=dict)
+    __slots__ = ("issued_currencies",)
+
+    def __init__(self, wallet: Wallet | None = None, **kwargs: Any) -> None:
+        super().__init__(wallet, **kwargs)
+        self.issued_currencies: dict = {}
 
 
-@dataclass
 class UserAccount(Account):
-    balances: dict = field(default_factory=dict)
-    _tickets: set = field(default_factory=set)
-    _nfts: set = field(default_factory=set)
-    # ElGamal keypair for Confidential MPT (XLS-0096); set during confidential setup.
-    elgamal_private_key: str | None = None
-    elgamal_public_key: str | None = None
+    __slots__ = ("_balances", "_nfts", "_tickets", "elgamal_private_key", "elgamal_public_key")
+
+    def __init__(
+        self, wallet: Wallet | None = None, *, address: str | None = None, row: int | None = None
+    ) -> None:
+        super().__init__(wallet, address=address, row=row)
+        self._balances: dict | None = None
+        self._tickets: ReadySet[int] | None = None
+        self._nfts: set | None = None
+        # ElGamal keypair for Confidential MPT (XLS-0096); set during confidential setup.
+        self.elgamal_private_key: str | None = None
+        self.elgamal_public_key: str | None = None
+
+    @property
+    def balances(self) -> dict:
+        if self._balances is None:
+            self._balances = {}
+        return self._balances
 
     @property
     def nfts(self) -> set:
+        if self._nfts is None:
+            self._nfts = set()
         return self._nfts
 
     @nfts.setter
@@ -60,11 +163,14 @@ class UserAccount(Account):
         self._nfts = value
 
     @property
-    def tickets(self) -> set:
+    def tickets(self) -> ReadySet[int]:
+        """TicketSequences the account holds; ``take`` hands one out in O(1)."""
+        if self._tickets is None:
+            self._tickets = ReadySet()
         return self._tickets
 
     @tickets.setter
-    def tickets(self, value: set) -> None:
+    def tickets(self, value: ReadySet[int]) -> None:
         self._tickets = value
 
 
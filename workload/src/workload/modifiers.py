@@ -21,6 +21,7 @@ from xrpl.wallet import Wallet
 
 from workload import params
 from workload.randoms import choice, random, sample
+from workload.ticketpool import pool
 from workload.transactions import TX_TYPES
 from workload.transactions.delegation import DELEGABLE_TX_TYPES, maybe_delegate
 from workload.transactions.sponsorship import _pick_reserve_sponsor, pick_prefunded_fee_sponsor
@@ -81,10 +82,11 @@ def _apply_ticket(
     name: str, txn: Transaction, wallet: Wallet, ctx: ModifierCtx
 ) -> ModResult | None:
     acct = ctx.accounts.get(txn.account)
-    if acct is None or not acct.tickets:
+    if acct is None:
+        return None
+    ticket_sequence = pool().take(acct)  # optimistic consume: avoid reuse by concurrent submits
+    if ticket_sequence is None:
         return None
-    ticket_sequence = choice(sorted(acct.tickets))
-    acct.tickets.discard(ticket_sequence)  # optimistic consume: avoid reuse by concurrent submits
     return ModResult(
         txn=txn.__replace__(sequence=0, ticket_sequence=ticket_sequence),
         wallet=wallet,
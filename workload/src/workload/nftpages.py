@@ -0,0 +1,226 @@
+"""NFTokenPage mirror and the page-density load mode, fed by validated tx metadata.
+
+An account's NFTs live in a chain of ``NFTokenPage`` entries of up to 32 tokens each, keyed
+by the owner's AccountID followed by the low 96 bits of the tokens they hold. Minting into a
+full page splits it; burning or transferring out of a page that then fits into its neighbour
+merges the two. Random mints and burns spread over every account rarely get an owner past
+one page, so those code paths in rippled stay cold.
+
+``NFTPages.apply`` reads every ``NFTokenPage`` node out of each validated tx's meta and
+keeps the token ids on each page, the pages each owner holds and the owner of each token. A
+page created for an owner who already had one is a split; a page deleted while its owner
+keeps others is a merge. It also follows sell offers that name a ``Destination``, which is
+how the density mode hands tokens from one owner to another.
+
+The density mode (``transactions.nft.nft_density``) picks ``NFT_DENSITY_OWNERS`` accounts.
+Each fills by minting until it holds ``NFT_DENSITY_PAGES`` pages' worth of tokens, then
+drains — burning tokens off its sparsest page, or offering them to an owner still filling —
+until it is down to half a page, and fills again. A token with a burn or transfer offer in
+flight, and an inbound offer with an accept in flight, is held back until the meta shows it
+go (or ``NFT_DENSITY_PENDING_SECS`` pass), so no two steps spend the same one. Page counts,
+fill and split/merge totals are served at ``/nft/pages/stats``.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter, defaultdict
+
+from xrpl.core.addresscodec import encode_classic_address
+
+from workload.fuzzstats import Bucket
+from workload.models import UserAccount
+from workload.randoms import sample
+from workload.readyset import ReadySet
+
+PAGE_CAPACITY = 32  # dirMaxTokensPerPage
+
+DENSE_OWNERS = int(os.environ.get("NFT_DENSITY_OWNERS", "4"))
+DENSE_PAGES = int(os.environ.get("NFT_DENSITY_PAGES", "4"))
+# How long a token or offer with a tx in flight waits for its meta before it's used again.
+PENDING_SECS = float(os.environ.get("NFT_DENSITY_PENDING_SECS", "20"))
+
+FILL = "fill"
+DRAIN = "drain"
+
+# Tokens an owner mints up to before draining, and drains down to before filling again.
+_FILL_TO = PAGE_CAPACITY * DENSE_PAGES
+_DRAIN_TO = PAGE_CAPACITY // 2
+
+_LSF_SELL_NFTOKEN = 0x00000001
+
+
+def page_owner(index: str) -> str:
+    """The classic address of the account an NFTokenPage index belongs to."""
+    return encode_classic_address(bytes.fromhex(index[:40]))
+
+
+class NFTPages:
+    def __init__(self) -> None:
+        self.pages: dict[str, set[str]] = {}  # page index -> token ids on it
+        self.by_owner: dict[str, set[str]] = {}  # owner -> page indices
+        self.owner_of: dict[str, str] = {}  # token id -> owner, per the pages
+        self.events: Counter[str] = Counter()  # created / deleted / splits / merges
+        # Destined sell offers: offer id -> (token id, destination); destination -> offer ids.
+        self.offers: dict[str, tuple[str, str]] = {}
+        self.inbound: dict[str, ReadySet[str]] = defaultdict(ReadySet)
+        self.offered: set[str] = set()  # token ids with a destined sell offer outstanding
+        self.pending: dict[str, float] = {}  # token / offer id with a tx in flight -> deadline
+        self.dense: dict[str, str] = {}  # density-mode owner -> FILL / DRAIN
+        self.actions: dict[str, Bucket] = defaultdict(Bucket)
+        self._started = time.monotonic()
+
+    def apply(self, meta: dict) -> None:
+        removed: list[tuple[str, str]] = []
+        added: list[tuple[str, str]] = []
+        created: list[str] = []
+        deleted: list[str] = []
+        for node in meta.get("AffectedNodes", []):
+            for kind, n in node.items():
+                if not isinstance(n, dict):
+                    continue
+                entry, index = n.get("LedgerEntryType"), n.get("LedgerIndex", "")
+                fields = n.get("FinalFields") or n.get("NewFields") or {}
+                if entry == "NFTokenOffer" and index:
+                    self._apply_offer(kind, index, fields)
+                if entry != "NFTokenPage" or not index:
+                    continue
+                owner = page_owner(index)
+                before = self.pages.pop(index, set())
+                if kind == "DeletedNode":
+                    after: set[str] = set()
+                    self.by_owner.get(owner, set()).discard(index)
+                    deleted.append(owner)
+                else:
+                    after = {t["NFToken"]["NFTokenID"] for t in fields.get("NFTokens", [])}
+                    self.pages[index] = after
+                    self.by_owner.setdefault(owner, set()).add(index)
+                    if kind == "CreatedNode":
+                        created.append(owner)
+                removed.extend((owner, t) for t in before - after)
+                added.extend((owner, t) for t in after - before)
+        # A split or merge moves tokens between pages of one owner in the same tx, so drop
+        # everything that left a page before recording what arrived on one.
+        for owner, token in removed:
+            if self.owner_of.get(token) == owner:
+                del self.owner_of[token]
+            self.pending.pop(token, None)
+        for owner, token in added:
+            self.owner_of[token] = owner
+        for owner in created:
+            self.events["created"] += 1
+            if len(self.by_owner[owner]) > 1:
+                self.events["splits"] += 1
+        for owner in deleted:
+            self.events["deleted"] += 1
+            if self.by_owner.get(owner):
+                self.events["merges"] += 1
+            else:
+                self.by_owner.pop(owner, None)
+
+    def _apply_offer(self, kind: str, index: str, fields: dict) -> None:
+        if kind == "DeletedNode":
+            self.pending.pop(index, None)
+            token, destination = self.offers.pop(index, ("", ""))
+            if token:
+                self.inbound[destination].discard(index)
+                self.offered.discard(token)
+        elif kind == "CreatedNode" and "Destination" in fields:
+            if int(fields.get("Flags", 0)) & _LSF_SELL_NFTOKEN:
+                token, destination = fields.get("NFTokenID", ""), fields["Destination"]
+                self.offers[index] = (token, destination)
+                self.inbound[destination].add(index)
+                self.offered.add(token)
+                self.pending.pop(token, None)
+
+    def mark(self, key: str) -> None:
+        """A burn / transfer offer for token ``key``, or an accept of offer ``key``, is in
+        flight: hold it back until its meta arrives."""
+        self.pending[key] = time.monotonic() + PENDING_SECS
+
+    def settle(self, key: str) -> None:
+        """The in-flight tx won't produce meta (rejected, or never reached the server)."""
+        self.pending.pop(key, None)
+
+    def in_flight(self) -> set[str]:
+        now = time.monotonic()
+        for key in [k for k, deadline in self.pending.items() if deadline <= now]:
+            del self.pending[key]
+        return set(self.pending)
+
+    def tokens(self, owner: str) -> int:
+        return sum(len(self.pages[p]) for p in self.by_owner.get(owner, ()))
+
+    def sparsest(self, owner: str) -> list[str]:
+        """Tokens on ``owner``'s emptiest page not already offered away or being burned.
+        Emptying a page from its sparse end is what lets it fold into a neighbour."""
+        taken = self.offered | self.in_flight()
+        pages = sorted(
+            (self.pages[p] - taken for p in self.by_owner.get(owner, ())),
+            key=len,
+        )
+        return next((sorted(tokens) for tokens in pages if tokens), [])
+
+    def acceptable(self, owner: str) -> list[str]:
+        """Sell offers destined for ``owner`` with no accept already in flight."""
+        busy = self.in_flight()
+        return [o for o in self.inbound.get(owner, ()) if o not in busy]
+
+    def dense_owners(self, accounts: dict[str, UserAccount]) -> list[str]:
+        """The density mode's owners, drawn once from ``accounts`` (and topped up if any
+        stop being tracked)."""
+        for owner in [o for o in self.dense if o not in accounts]:
+            del self.dense[owner]
+        want = min(DENSE_OWNERS, len(accounts)) - len(self.dense)
+        if want > 0:
+            spare = [a for a in accounts if a not in self.dense]
+            self.dense.update(dict.fromkeys(sample(spare, want), FILL))
+        return list(self.dense)
+
+    def phase(self, owner: str) -> str:
+        """FILL until ``owner`` holds ``_FILL_TO`` tokens, then DRAIN down to ``_DRAIN_TO``."""
+        held = self.tokens(owner)
+        if self.dense[owner] == FILL and held >= _FILL_TO:
+            self.dense[owner] = DRAIN
+        elif self.dense[owner] == DRAIN and held <= _DRAIN_TO:
+            self.dense[owner] = FILL
+        return self.dense[owner]
+
+    def record(self, action: str, outcome: str, latency: float) -> None:
+        self.actions[action].add(outcome, latency)
+
+    def snapshot(self) -> dict:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        counts = [len(p) for p in self.by_owner.values()]
+        fill: Counter[int] = Counter(len(tokens) for tokens in self.pages.values())
+        return {
+            "pages": len(self.pages),
+            "owners": len(self.by_owner),
+            "tokens": len(self.owner_of),
+            "pages_per_owner_max": max(counts, default=0),
+            "pages_per_owner_mean": round(sum(counts) / len(counts), 3) if counts else 0.0,
+            "tokens_per_page_mean": round(len(self.owner_of) / len(self.pages), 3)
+            if self.pages
+            else 0.0,
+            "tokens_per_page": dict(sorted(fill.items())),
+            **self.events,
+            "pending_transfers": len(self.offers),
+            "in_flight": len(self.pending),
+            "dense_owners": {
+                owner: {
+                    "phase": phase,
+                    "pages": len(self.by_owner.get(owner, ())),
+                    "tokens": self.tokens(owner),
+                }
+                for owner, phase in self.dense.items()
+            },
+            "actions": {action: b.summary(elapsed) for action, b in sorted(self.actions.items())},
+        }
+
+
+_pages = NFTPages()
+
+
+def nft_pages() -> NFTPages:
+    return _pages
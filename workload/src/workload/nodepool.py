@@ -0,0 +1,194 @@
+"""Submit fan-out across every xrpld in the network instead of the single XRPLD_NAME node.
+
+prepare-workload writes the node names it generated (``node_config.get_node_configs``) to
+``nodes.json``; the pool builds one JSON-RPC client per node from it. Only submits fan out:
+reads (account_info, autofill's fee/ledger lookups) stay on the primary node so sequence
+and state reads see one consistent view, and the WS state stream stays single-sourced on
+the primary, so no cross-node dedup is needed there.
+
+Policies (``SUBMIT_POLICY``):
+- ``sticky`` (default): an account always lands on the same node (while healthy), so its
+  own submits queue in one node's open ledger in sequence order.
+- ``round_robin``: rotate through healthy nodes.
+- ``least_latency``: lowest submit-latency EWMA, ties broken by in-flight count.
+
+The two spreading policies send one account's consecutive autofilled submits to different
+nodes; one that hasn't seen the previous Sequence yet holds the next (``terPRE_SEQ``) or
+rejects a replay (``tefPAST_SEQ``). They're for runs that want exactly that churn.
+
+A node that fails ``EJECT_AFTER`` submits in a row is ejected for ``EJECT_SECS``, then
+readmitted on probation; one more failure ejects it again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.asyncio.clients.client import REQUEST_TIMEOUT
+from xrpl.core.addresscodec import encode_classic_address
+from xrpl.core.binarycodec.exceptions import XRPLBinaryCodecException
+from xrpl.models.requests.request import Request, RequestMethod
+from xrpl.models.response import Response
+
+from workload import assembler, logging
+
+log = logging.getLogger(__name__)
+
+POLICIES = ("sticky", "round_robin", "least_latency")
+
+EJECT_AFTER = 3
+EJECT_SECS = 30.0
+_LATENCY_ALPHA = 0.2  # EWMA weight of the newest sample
+
+_SUBMIT_METHODS = {RequestMethod.SUBMIT, RequestMethod.SUBMIT_MULTISIGNED}
+
+
+@dataclass
+class Node:
+    name: str
+    client: AsyncJsonRpcClient
+    latency: float | None = None  # submit-latency EWMA, seconds
+    inflight: int = 0
+    submits: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    ejected_until: float = 0.0
+    ejections: int = 0
+
+    def healthy(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def stats(self, now: float) -> dict:
+        return {
+            "latency_ms": None if self.latency is None else round(self.latency * 1000, 1),
+            "inflight": self.inflight,
+            "submits": self.submits,
+            "errors": self.errors,
+            "ejections": self.ejections,
+            "healthy": self.healthy(now),
+        }
+
+
+@dataclass
+class NodePool:
+    nodes: list[Node]
+    policy: str = "sticky"
+    _cursor: int = field(default=0, repr=False)
+
+    def pick(self, account: str | None) -> Node:
+        now = time.monotonic()
+        healthy = [n for n in self.nodes if n.healthy(now)]
+        if not healthy:
+            # Everything ejected: the least-recently-ejected node is the best bet.
+            return min(self.nodes, key=lambda n: n.ejected_until)
+        if self.policy == "least_latency":
+            # Unmeasured nodes sort first so every node gets sampled.
+            return min(healthy, key=lambda n: (n.latency or 0.0, n.inflight))
+        if self.policy == "sticky" and account is not None:
+            # Hash over the full list so an account's node doesn't move when another
+            # node is ejected; walk forward only if its own node is the one out.
+            start = zlib.crc32(account.encode()) % len(self.nodes)
+            for i in range(len(self.nodes)):
+                node = self.nodes[(start + i) % len(self.nodes)]
+                if node.healthy(now):
+                    return node
+        self._cursor = (self._cursor + 1) % len(healthy)
+        return healthy[self._cursor]
+
+    def observe(self, node: Node, latency: float, ok: bool) -> None:
+        node.submits += 1
+        if ok:
+            node.consecutive_failures = 0
+            node.latency = (
+                latency
+                if node.latency is None
+                else _LATENCY_ALPHA * latency + (1 - _LATENCY_ALPHA) * node.latency
+            )
+            return
+        node.errors += 1
+        node.consecutive_failures += 1
+        if node.consecutive_failures >= EJECT_AFTER:
+            node.ejected_until = time.monotonic() + EJECT_SECS
+            node.ejections += 1
+            # Probation on readmission: one more failure before a success ejects again.
+            node.consecutive_failures = EJECT_AFTER - 1
+            log.warning("Node pool: ejecting %s for %ss", node.name, EJECT_SECS)
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        return {"policy": self.policy, "nodes": {n.name: n.stats(now) for n in self.nodes}}
+
+
+def _submit_account(request: Request) -> str | None:
+    """Sending account of a submit, for the sticky policy. Walks the blob's field spans
+    natively instead of decoding the whole tx."""
+    tx_json = getattr(request, "tx_json", None)
+    if isinstance(tx_json, dict):
+        return tx_json.get("Account")
+    tx_blob = getattr(request, "tx_blob", None)
+    if not tx_blob:
+        return None
+    try:
+        for f in assembler.parse(bytes.fromhex(tx_blob)):
+            if f.name == "Account":
+                return encode_classic_address(bytes(f.value[assembler.vl_prefix_len(f) :]))
+    except (XRPLBinaryCodecException, ValueError):
+        return None
+    return None
+
+
+class PooledJsonRpcClient(AsyncJsonRpcClient):
+    """AsyncJsonRpcClient on the primary node that routes submits through the pool.
+    Drop-in for ``Workload.client``: every existing call site fans out unchanged."""
+
+    def __init__(self, url: str, pool: NodePool) -> None:
+        super().__init__(url)
+        self.pool = pool
+
+    async def _request_impl(
+        self, request: Request, *, timeout: float = REQUEST_TIMEOUT
+    ) -> Response:
+        if request.method not in _SUBMIT_METHODS or len(self.pool.nodes) < 2:
+            return await super()._request_impl(request, timeout=timeout)
+        node = self.pool.pick(_submit_account(request))
+        node.inflight += 1
+        started = time.monotonic()
+        ok = False
+        try:
+            # Transport failures and undecodable responses count against the node; an
+            # RPC-level error (tooBusy, a tx reject) is a healthy node answering.
+            response = await node.client._request_impl(request, timeout=timeout)
+            ok = True
+            return response
+        finally:
+            node.inflight -= 1
+            self.pool.observe(node, time.monotonic() - started, ok)
+
+
+def load_node_names(path: Path) -> list[str]:
+    """Node names from prepare-workload's nodes.json; [] when absent or unreadable."""
+    if not path.is_file():
+        return []
+    try:
+        spec = json.loads(path.read_text())
+        return [*spec.get("validators", []), *spec.get("peers", [])]
+    except (ValueError, AttributeError, TypeError) as e:
+        log.warning("Node pool: ignoring unreadable %s: %s", path, e)
+        return []
+
+
+def build_pool(primary: str, names: list[str], rpc_port: str | int) -> NodePool:
+    policy = os.environ.get("SUBMIT_POLICY", "sticky")
+    if policy not in POLICIES:
+        log.warning("Node pool: unknown SUBMIT_POLICY %r, using sticky", policy)
+        policy = "sticky"
+    ordered = [primary, *(n for n in names if n != primary)]
+    nodes = [Node(n, AsyncJsonRpcClient(f"http://{n}:{rpc_port}")) for n in ordered]
+    log.info("Node pool: %d node(s), policy %s: %s", len(nodes), policy, ", ".join(ordered))
+    return NodePool(nodes, policy)
@@ -0,0 +1,243 @@
+"""Batch packing: fold concurrent driver submits from one account into ``Batch`` containers.
+
+With ``BATCH_PACK=1``, ``submit_tx`` hands each packable driver transaction to
+``BatchPacker.submit`` instead of signing it on its own. The packer queues it per account;
+a queue that reaches ``BATCH_PACK_SIZE`` (2-8, rippled's inner limit) is sent at once, and
+one that doesn't is sent ``BATCH_PACK_LINGER_MS`` after its first entry. So whatever
+handlers happen to be in flight for the same account — a payment, an offer, a trust line —
+ride in one container. A queue holding a single transaction by then goes out individually.
+
+Each Batch takes its Sequences (outer first, then one per inner) from the shared
+``SequenceTracker``, with no RPC: driver submits sent individually draw from the same
+tracker (see ``submit``), so it stays in step with the account. The outer fee is computed
+here from one ``fee`` request: twice the base fee plus each inner's own cost (owner reserve
+for AccountDelete/AMMCreate/VaultCreate, the fulfillment surcharge for EscrowFinish), which
+is what xrpl-py's autofill would get to with one ``fee`` request per inner. Inner
+transactions that don't run leave a Sequence gap; the next submit from that account then
+gets ``terPRE_SEQ`` and resets the tracker, so the gap costs one transaction.
+
+Packed inners skip the transaction modifiers (ticket, delegate, sponsor): a single-signer
+inner can't carry a TicketSequence next to its assigned Sequence, another signer, or a
+co-signing sponsor. Each inner still fires its own ``tx_submitting`` (and so its ``seen``
+hit) under its handler's name before the Batch goes out.
+
+The packing mode (``BATCH_PACK_MODE``) is a Batch flag name or ``random``. Whether packing
+is on or off, every driver submit is counted as packed or individual; ``/batch/pack/stats``
+compares transactions per second and submit latency of the two.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+
+from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.asyncio.ledger import get_fee
+from xrpl.models import Batch, BatchFlag, EscrowFinish, TransactionFlag
+from xrpl.models.transactions.transaction import Transaction
+from xrpl.wallet import Wallet
+
+from workload.assertions import tx_submitting
+from workload.balances import mirror
+from workload.fuzzstats import Bucket
+from workload.randoms import choice
+from workload.sequence import SequenceTracker, consumes_sequence
+
+ENABLED = os.environ.get("BATCH_PACK", "0") == "1"
+SIZE = min(8, max(2, int(os.environ.get("BATCH_PACK_SIZE", "8"))))
+MODE = os.environ.get("BATCH_PACK_MODE", "independent")
+LINGER = int(os.environ.get("BATCH_PACK_LINGER_MS", "250")) / 1000
+
+_MODES = {
+    "all_or_nothing": BatchFlag.TF_ALL_OR_NOTHING,
+    "only_one": BatchFlag.TF_ONLY_ONE,
+    "until_failure": BatchFlag.TF_UNTIL_FAILURE,
+    "independent": BatchFlag.TF_INDEPENDENT,
+}
+
+_TF_INNER_BATCH_TXN = int(TransactionFlag.TF_INNER_BATCH_TXN)
+
+# Batch::disabledTxTypes, plus Batch itself (cannot nest); confidential txs carry a proof
+# surcharge this module doesn't price.
+_UNPACKABLE_PREFIXES = ("Vault", "Loan", "Batch", "Confidential")
+# Inner txs whose cost is one owner reserve rather than the base fee.
+_RESERVE_FEE_TYPES = {"AccountDelete", "AMMCreate", "VaultCreate"}
+
+
+@dataclass
+class _Pending:
+    name: str
+    txn: Transaction
+    wallet: Wallet
+    future: asyncio.Future[dict]
+    queued: float = field(default_factory=time.monotonic)
+
+
+def inner_fee(txn: Transaction, base_fee: int) -> int:
+    """Drops an inner transaction adds to its Batch's fee."""
+    tx_type = txn.transaction_type.value
+    if tx_type in _RESERVE_FEE_TYPES:
+        return mirror().reserve_inc
+    if isinstance(txn, EscrowFinish) and txn.fulfillment is not None:
+        return math.ceil(base_fee * (33 + len(txn.fulfillment.encode("ascii")) / 16))
+    return base_fee
+
+
+async def batch_fee(inners: list[Transaction], client: AsyncJsonRpcClient) -> str:
+    """Fee for a single-signer Batch of ``inners``: 2 x base + every inner's own cost."""
+    base_fee = int(await get_fee(client))
+    return str(2 * base_fee + sum(inner_fee(txn, base_fee) for txn in inners))
+
+
+def as_inner(txn: Transaction, sequence: int) -> Transaction:
+    """``txn`` in inner-Batch form: tfInnerBatchTxn set, zero fee, unsigned, ``sequence``."""
+    tx_json = txn.to_xrpl()
+    tx_json["Flags"] = int(tx_json.get("Flags", 0)) | _TF_INNER_BATCH_TXN
+    tx_json["Fee"] = "0"
+    tx_json["SigningPubKey"] = ""
+    tx_json["Sequence"] = sequence
+    tx_json.pop("LastLedgerSequence", None)
+    return Transaction.from_xrpl(tx_json)
+
+
+class BatchPacker:
+    def __init__(self) -> None:
+        self.enabled = ENABLED
+        self.size = SIZE
+        self.sequences: SequenceTracker | None = None
+        self._queues: dict[str, list[_Pending]] = {}
+        self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        # "packed" / "individual" -> one attempt per transaction, latency from submit_tx
+        # entry to the tentative result (queueing included for packed ones).
+        self.modes: dict[str, Bucket] = {"packed": Bucket(), "individual": Bucket()}
+        self.fill: Counter[int] = Counter()  # inner count -> Batches sent
+        self._started = time.monotonic()
+
+    async def allocate(self, address: str, count: int) -> list[int]:
+        """``count`` consecutive Sequences for ``address`` from the shared tracker."""
+        assert self.sequences is not None  # configured at startup, before any driver runs
+        first = await self.sequences.next_seq(address)
+        self.sequences.advance(address, count - 1)
+        return list(range(first, first + count))
+
+    def realign(self, address: str, result: dict) -> None:
+        """Re-read ``address``'s Sequence next time if the Batch didn't take its own."""
+        if not consumes_sequence(result.get("engine_result", "")):
+            self.release(address)
+
+    def release(self, address: str) -> None:
+        """Forget the Sequences handed out for ``address``: not all of them will be used."""
+        if self.sequences is not None:
+            self.sequences.reset(address)
+
+    def packable(self, name: str, txn: Transaction, wallet: Wallet) -> bool:
+        return (
+            self.enabled
+            and self.sequences is not None
+            and not name.startswith(_UNPACKABLE_PREFIXES)
+            and not txn.transaction_type.value.startswith(_UNPACKABLE_PREFIXES)
+            # Only the account's own key can sign for it inside a single-signer Batch.
+            and wallet.address == txn.account
+            and txn.sequence is None
+            and txn.ticket_sequence is None
+            and not txn.has_flag(_TF_INNER_BATCH_TXN)
+        )
+
+    async def submit(
+        self, name: str, txn: Transaction, client: AsyncJsonRpcClient, wallet: Wallet
+    ) -> dict:
+        """Queue ``txn`` for its account's next Batch; returns that Batch's tentative result
+        (or ``txn``'s own, if it ended up sent alone)."""
+        pending = _Pending(name, txn, wallet, asyncio.get_running_loop().create_future())
+        queue = self._queues.setdefault(txn.account, [])
+        queue.append(pending)
+        if len(queue) >= self.size:
+            self._flush(txn.account, client)
+        elif len(queue) == 1:
+            self._timers[txn.account] = asyncio.get_running_loop().call_later(
+                LINGER, self._flush, txn.account, client
+            )
+        return await pending.future
+
+    def _flush(self, account: str, client: AsyncJsonRpcClient) -> None:
+        timer = self._timers.pop(account, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._queues.pop(account, [])
+        if items:
+            task = asyncio.get_running_loop().create_task(self._send(account, items, client))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, account: str, items: list[_Pending], client: AsyncJsonRpcClient) -> None:
+        # Lazy import: submit -> packing -> submit would cycle.
+        from workload.submit import sign_and_submit, submit_individually
+
+        seqs = self.sequences
+        assert seqs is not None  # packable() holds submits back until configured
+        try:
+            if len(items) == 1:
+                only = items[0]
+                result = await submit_individually(only.name, only.txn, client, only.wallet)
+                self.record("individual", result, only.queued)
+                only.future.set_result(result)
+                return
+            outer, *rest = await self.allocate(account, len(items) + 1)
+            inners = [as_inner(p.txn, seq) for p, seq in zip(items, rest, strict=True)]
+            flag = _MODES[choice(list(_MODES))] if MODE == "random" else _MODES[MODE]
+            batch = Batch(
+                account=account,
+                flags=flag,
+                raw_transactions=inners,
+                sequence=outer,
+                fee=await batch_fee(inners, client),
+            )
+            for p, inner in zip(items, inners, strict=True):
+                tx_submitting(p.name, inner)
+            result = await sign_and_submit("Batch", batch, client, items[0].wallet)
+        except Exception as e:
+            # The Sequences drawn for this Batch may never be used; realign on the next one.
+            seqs.reset(account)
+            for p in items:
+                if not p.future.done():
+                    p.future.set_exception(e)
+            return
+        self.realign(account, result)
+        self.fill[len(items)] += 1
+        for p in items:
+            self.record("packed", result, p.queued)
+            p.future.set_result(result)
+
+    def record(self, mode: str, result: dict, started: float) -> None:
+        self.modes[mode].add(result.get("engine_result", ""), time.monotonic() - started)
+
+    def snapshot(self) -> dict:
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        batches = sum(self.fill.values())
+        return {
+            "enabled": self.enabled,
+            "size": self.size,
+            "mode": MODE,
+            "batches": batches,
+            "fill_mean": round(sum(n * c for n, c in self.fill.items()) / batches, 3)
+            if batches
+            else 0.0,
+            "fill": dict(sorted(self.fill.items())),
+            "modes": {mode: b.summary(elapsed) for mode, b in self.modes.items()},
+        }
+
+
+_packer = BatchPacker()
+
+
+def configure(sequences: SequenceTracker) -> None:
+    _packer.sequences = sequences
+
+
+def packer() -> BatchPacker:
+    return _packer
@@ -202,6 +202,12 @@ def amm_bid_max() -> str:
     return str(randint(1_000, 10_000))
 
 
+def amm_pool_fraction() -> float:
+    """Share of a mirrored pool's reserve / LP supply a quoted AMM op moves: mostly a
+    sliver, sometimes a bite big enough to move the price."""
+    return random() * choice([0.001, 0.01, 0.1, 0.5])
+
+
 def amm_vote_fee() -> int:
     return randint(0, 1000)
 
@@ -259,6 +265,15 @@ def loan_grace_period(payment_interval: int) -> int:
     return randint(60, max(60, payment_interval))
 
 
+def loan_lifecycle_interval() -> int:
+    """Short periods so the lifecycle engine sees loans go late within a run."""
+    return randint(60, 600)
+
+
+def loan_lifecycle_payment_total() -> int:
+    return randint(2, 6)
+
+
 def loan_cover_deposit_amount() -> str:
     return str(randint(100_000, 10_000_000))
 
@@ -330,6 +345,11 @@ def channel_fund_amount() -> str:
     return str(randint(100_000, 10_000_000))
 
 
+def channel_claim_step() -> int:
+    """Drops one streamed claim authorizes beyond the previous one."""
+    return randint(1_000, 100_000)
+
+
 def channel_claim_balance(channel_amount: str) -> str:
     """≤ channel amount."""
     max_val = int(channel_amount)
@@ -0,0 +1,241 @@
+"""Path sets for cross-currency payments, cached per (source asset, destination asset).
+
+Direct payments never leave the payment engine's default path, so its strand building, book
+and AMM steps and multi-path liquidity sorting only run when an offer happens to cross. The
+path-payment mode (``transactions.payments.payment_path``) sends cross-currency payments
+with explicit ``Paths`` instead, and gets them here.
+
+``PathCache.lookup`` serves a pair's path set from the cache until ``PATH_CACHE_TTL``
+seconds have passed. On a miss it asks rippled (``ripple_path_find``; ``path_find`` is a
+WebSocket subscription and the workload submits over JSON-RPC), falls back to the local
+mirrors, or uses only one of them, per ``PATH_SOURCE`` (``mixed``, ``rpc`` or ``local``).
+Locally a path is a chain of XRP/IOU assets, each hop backed by a non-empty book in
+``workload.books`` or a funded pool in ``workload.ammstate``, with up to
+``MAX_INTERMEDIATES`` assets between source and destination. rippled adds the direct path
+itself, so only paths through at least one intermediate are kept. Expired entries are
+dropped on lookup, and the cache is swept down to ``PATH_CACHE_MAX`` entries, soonest to
+expire first. Hits, misses, evictions and lookup latency are served at
+``/payment/path/stats``.
+
+The cache is keyed by asset pair, not by account: rippled's alternatives are computed for
+one sender, but the books and pools between two assets are the same for all of them.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+
+import httpx
+from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.constants import XRPLException
+from xrpl.models import XRP as XRPCurrency
+from xrpl.models import IssuedCurrency
+from xrpl.models.amounts import Amount
+from xrpl.models.requests import RipplePathFind
+
+from workload import logging
+from workload.ammstate import pools
+from workload.balances import XRP, AssetKey
+from workload.books import books
+from workload.fuzzstats import Bucket
+from workload.randoms import choice
+
+log = logging.getLogger(__name__)
+
+TTL = float(os.environ.get("PATH_CACHE_TTL", "30"))
+MAX_ENTRIES = int(os.environ.get("PATH_CACHE_MAX", "256"))
+SOURCE = os.environ.get("PATH_SOURCE", "mixed")
+
+MAX_INTERMEDIATES = 2
+MAX_PATHS = 6  # rippled's limit on paths per Payment
+
+PathSet = list[list[dict[str, str]]]  # path steps as ledger JSON
+
+RPC = "rpc"
+LOCAL = "local"
+
+
+@dataclass
+class CachedPaths:
+    paths: PathSet
+    origin: str  # RPC / LOCAL
+    expires: float
+
+
+def pathable(key: AssetKey) -> bool:
+    """XRP or an IOU: MPTs can't be a path step (PaymentMPT covers MPT legs)."""
+    return key == XRP or isinstance(key, tuple)
+
+
+def step(key: AssetKey) -> dict[str, str]:
+    if isinstance(key, tuple):
+        return {"currency": key[0], "issuer": key[1]}
+    return {"currency": XRP}
+
+
+def graph() -> dict[AssetKey, set[AssetKey]]:
+    """asset -> assets one book or pool hop converts it into, over open (non-domain) books."""
+    edges: dict[AssetKey, set[AssetKey]] = defaultdict(set)
+    for gets, pays, domain in books().books:
+        # Offers giving ``gets`` for ``pays`` turn a payer's ``pays`` into ``gets``.
+        if domain is None and pathable(gets) and pathable(pays):
+            edges[pays].add(gets)
+    for pool in pools().pools.values():
+        a, b = pool.assets
+        if pool.funded() and pathable(a) and pathable(b):
+            edges[a].add(b)
+            edges[b].add(a)
+    return edges
+
+
+def routes(src: AssetKey, edges: dict[AssetKey, set[AssetKey]]) -> dict[AssetKey, PathSet]:
+    """Every asset reachable from ``src`` through 1..MAX_INTERMEDIATES other assets, with
+    the paths (intermediate steps only) that reach it, shortest first."""
+    found: dict[AssetKey, PathSet] = defaultdict(list)
+    frontier: list[list[AssetKey]] = [[src]]
+    for _ in range(MAX_INTERMEDIATES):
+        extended = []
+        for chain in frontier:
+            for hop in edges.get(chain[-1], ()):
+                if hop in chain:
+                    continue
+                extended.append([*chain, hop])
+                for dst in edges.get(hop, ()):
+                    if dst not in chain and dst != hop and len(found[dst]) < MAX_PATHS:
+                        found[dst].append([step(k) for k in [*chain[1:], hop]])
+        frontier = extended
+    return {dst: paths for dst, paths in found.items() if paths}
+
+
+class PathCache:
+    def __init__(self) -> None:
+        self.entries: dict[tuple[AssetKey, AssetKey], CachedPaths] = {}
+        self.counts: Counter[str] = Counter()
+        self.lookups: dict[str, Bucket] = defaultdict(Bucket)  # origin -> found / empty
+
+    def pick_pair(self) -> tuple[AssetKey, AssetKey, PathSet] | None:
+        """A (source, destination) asset pair the local mirrors can route through at least
+        one intermediate, with those local paths."""
+        edges = graph()
+        sources = list(edges)
+        for _ in range(4):
+            if not sources:
+                return None
+            src = choice(sources)
+            reachable = routes(src, edges)
+            if reachable:
+                dst = choice(list(reachable))
+                return src, dst, reachable[dst]
+        return None
+
+    def get(self, src: AssetKey, dst: AssetKey) -> CachedPaths | None:
+        entry = self.entries.get((src, dst))
+        if entry is None:
+            return None
+        if entry.expires <= time.monotonic():
+            del self.entries[(src, dst)]
+            self.counts["expired"] += 1
+            return None
+        return entry
+
+    def put(self, src: AssetKey, dst: AssetKey, paths: PathSet, origin: str) -> CachedPaths:
+        entry = self.entries[(src, dst)] = CachedPaths(paths, origin, time.monotonic() + TTL)
+        if len(self.entries) > MAX_ENTRIES:
+            self._sweep()
+        return entry
+
+    def _sweep(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, e in self.entries.items() if e.expires <= now]:
+            del self.entries[key]
+            self.counts["expired"] += 1
+        excess = len(self.entries) - MAX_ENTRIES
+        if excess > 0:
+            for key in sorted(self.entries, key=lambda k: self.entries[k].expires)[:excess]:
+                del self.entries[key]
+            self.counts["evicted"] += excess
+
+    async def lookup(
+        self,
+        src: AssetKey,
+        dst: AssetKey,
+        local: PathSet,
+        account: str,
+        destination: str,
+        deliver: Amount,
+        client: AsyncJsonRpcClient,
+    ) -> CachedPaths | None:
+        """``src`` -> ``dst`` paths: cached, else from rippled and/or ``local`` per
+        ``PATH_SOURCE``; None when neither has any."""
+        cached = self.get(src, dst)
+        if cached is not None:
+            self.counts["hits"] += 1
+            return cached
+        self.counts["misses"] += 1
+        if SOURCE != LOCAL:
+            paths = await self._ripple_path_find(src, account, destination, deliver, client)
+            if paths:
+                return self.put(src, dst, paths, RPC)
+        if SOURCE != RPC and local:
+            self.lookups[LOCAL].add("found", 0.0)
+            return self.put(src, dst, local[:MAX_PATHS], LOCAL)
+        return None
+
+    async def _ripple_path_find(
+        self,
+        src: AssetKey,
+        account: str,
+        destination: str,
+        deliver: Amount,
+        client: AsyncJsonRpcClient,
+    ) -> PathSet:
+        currency: IssuedCurrency | XRPCurrency = XRPCurrency()
+        if isinstance(src, tuple):
+            currency = IssuedCurrency(currency=src[0], issuer=src[1])
+        request = RipplePathFind(
+            source_account=account,
+            destination_account=destination,
+            destination_amount=deliver,
+            source_currencies=[currency],
+        )
+        started = time.monotonic()
+        try:
+            response = await client.request(request)
+        except (XRPLException, httpx.TimeoutException) as e:
+            self.lookups[RPC].add(type(e).__name__, time.monotonic() - started)
+            log.debug("ripple_path_find %s: %s", account, e)
+            return []
+        alternatives = response.result.get("alternatives", []) if response.is_successful() else []
+        paths: list[list[dict]] = next(
+            (a["paths_computed"] for a in alternatives if a.get("paths_computed")), []
+        )
+        outcome = "found" if paths else "empty" if response.is_successful() else "error"
+        self.lookups[RPC].add(outcome, time.monotonic() - started)
+        return [
+            [{k: s[k] for k in ("account", "currency", "issuer") if k in s} for s in path]
+            for path in paths[:MAX_PATHS]
+        ]
+
+    def snapshot(self) -> dict:
+        hits, misses = self.counts["hits"], self.counts["misses"]
+        now = time.monotonic()
+        return {
+            "source": SOURCE,
+            "ttl": TTL,
+            "entries": len(self.entries),
+            "live": sum(1 for e in self.entries.values() if e.expires > now),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            **self.counts,
+            # No per-second rate: lookups only happen on cache misses, so it says nothing.
+            "lookups": {origin: b.summary() for origin, b in sorted(self.lookups.items())},
+        }
+
+
+_cache = PathCache()
+
+
+def path_cache() -> PathCache:
+    return _cache
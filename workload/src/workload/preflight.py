@@ -0,0 +1,176 @@
+"""Offline preflight for the codec-legal fuzz band: predict mutations rippled will reject
+at preflight with a shallow, already-known result, and stop paying autofill + sign +
+submit for every repeat of them.
+
+Two sources of prediction:
+- Static rules derived from xrpl-py: flag bits outside the type's ``*Flag`` enum, a
+  dropped field the model marks REQUIRED, an injected field the model doesn't carry,
+  and an Amount that is negative or above the XRP supply.
+- A learned table of (tx type, op) → observed results: an op whose results are almost
+  always one shallow code predicts that code.
+
+Predictions are never trusted blind. Each (type, rule, ops) key still submits its first
+``SAMPLE_BUDGET`` hits, and any non-shallow outcome marks the key deep for good — so a
+rule that lags rippled (or an xrpl-py model that lags it) un-learns itself.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import os
+from collections import Counter, defaultdict
+
+from xrpl.core.binarycodec.definitions.definitions import load_definitions
+from xrpl.models import transactions as _transactions
+from xrpl.models.base_model import _key_to_json
+from xrpl.models.exceptions import XRPLModelException
+from xrpl.models.required import REQUIRED
+from xrpl.models.transactions.transaction import Transaction
+
+from workload.randoms import random
+
+# "skip": drop a predicted reject once its budget is spent. "downweight": still submit
+# RESAMPLE_CHANCE of them, so drift in rippled shows up. "off": predict nothing.
+MODE = os.environ.get("FUZZ_PREFLIGHT", "downweight")
+
+# Submits each (type, rule, ops) key always gets before prediction may skip it.
+SAMPLE_BUDGET = 3
+RESAMPLE_CHANCE = 0.1
+
+# Learned prediction needs this many observations of an op, this concentrated.
+_MIN_OBSERVATIONS = 8
+_MIN_SHARE = 0.95
+
+# Flag bits legal on every type: tfFullyCanonicalSig. tfInnerBatchTxn is excluded on
+# purpose — outside a Batch it is itself a preflight reject.
+_UNIVERSAL_FLAGS = 0x80000000
+
+_MAX_XRP_DROPS = 10**17
+
+_FIELD_TYPES: dict[str, str] = {
+    name: meta["type"] for name, meta in load_definitions()["FIELDS"].items()
+}
+
+
+def is_shallow(outcome: str) -> bool:
+    """Rejected before the transactor ran: tem* malformed, or rippled refused to parse."""
+    return outcome.startswith("tem") or outcome in ("invalidTransaction", "malformedTransaction")
+
+
+@functools.cache
+def _model_fields(tx_type: str) -> dict[str, bool] | None:
+    """snake_case model field → required, or None if xrpl-py has no model for the type."""
+    try:
+        cls = Transaction.get_transaction_type(tx_type)
+    except XRPLModelException:
+        return None
+    return {f.name: f.default is REQUIRED for f in dataclasses.fields(cls)}
+
+
+@functools.cache
+def _flag_mask(tx_type: str) -> int | None:
+    """Every flag bit xrpl-py knows for the type, or None if it ships no ``*Flag`` enum
+    (then the rule abstains rather than guess)."""
+    enum = getattr(_transactions, f"{tx_type}Flag", None)
+    if enum is None:
+        return None
+    mask = _UNIVERSAL_FLAGS
+    for flag in enum:
+        mask |= int(flag.value)
+    return mask
+
+
+def _snake(field: str) -> str | None:
+    try:
+        return _key_to_json(field)
+    except XRPLModelException:
+        return None
+
+
+def _bad_amount(value: object) -> bool:
+    if isinstance(value, str):
+        try:
+            drops = int(value)
+        except ValueError:
+            return False
+        return drops < 0 or drops > _MAX_XRP_DROPS
+    if isinstance(value, dict):
+        return str(value.get("value", "")).startswith("-")
+    return False
+
+
+def _static_rule(tx_dict: dict, ops: list[str]) -> str | None:
+    tx_type = str(tx_dict.get("TransactionType", ""))
+    fields = _model_fields(tx_type)
+    for op in ops:
+        kind, _, field = op.partition(":")
+        if kind == "set" and field == "Flags":
+            mask = _flag_mask(tx_type)
+            flags = tx_dict.get("Flags")
+            if mask is not None and isinstance(flags, int) and flags & ~mask:
+                return "flag_mask"
+        if (
+            kind == "set"
+            and _FIELD_TYPES.get(field) == "Amount"
+            and _bad_amount(tx_dict.get(field))
+        ):
+            return "amount_range"
+        if fields is None:
+            continue
+        snake = _snake(field)
+        if kind == "drop" and snake is not None and fields.get(snake):
+            return "missing_required"
+        if kind == "inject" and snake is not None and snake not in fields:
+            return "unknown_field"
+    return None
+
+
+class Preflight:
+    def __init__(self) -> None:
+        # (tx type, op) -> outcome counts, fed by every codec-legal fuzz submit.
+        self.observed: dict[tuple[str, str], Counter[str]] = defaultdict(Counter)
+        # (tx type, rule, ops) -> submits spent on it; keys proven deep are dropped for good.
+        self._budget: Counter[tuple[str, str, tuple[str, ...]]] = Counter()
+        self._deep: set[tuple[str, str, tuple[str, ...]]] = set()
+
+    def _learned_rule(self, name: str, ops: list[str]) -> str | None:
+        for op in ops:
+            counts = self.observed.get((name, op))
+            if not counts:
+                continue
+            total = counts.total()
+            outcome, hits = counts.most_common(1)[0]
+            if total >= _MIN_OBSERVATIONS and hits / total >= _MIN_SHARE and is_shallow(outcome):
+                return f"learned:{outcome}"
+        return None
+
+    def predict(self, name: str, tx_dict: dict, ops: list[str]) -> str | None:
+        """The rule predicting a shallow reject for this mutation, or None."""
+        if MODE == "off" or not ops:
+            return None
+        return _static_rule(tx_dict, ops) or self._learned_rule(name, ops)
+
+    def should_skip(self, name: str, rule: str, ops: list[str]) -> bool:
+        """Spend the key's sampling budget first; afterwards skip (or, downweighted,
+        mostly skip) unless an earlier sample proved the key reaches past preflight."""
+        key = (name, rule, tuple(sorted(ops)))
+        if key in self._deep:
+            return False
+        if self._budget[key] < SAMPLE_BUDGET:
+            self._budget[key] += 1
+            return False
+        return not (MODE == "downweight" and random() < RESAMPLE_CHANCE)
+
+    def learn(self, name: str, ops: list[str], rule: str | None, outcome: str) -> None:
+        for op in ops:
+            self.observed[(name, op)][outcome] += 1
+        if rule is not None and not is_shallow(outcome):
+            self._deep.add((name, rule, tuple(sorted(ops))))
+
+
+_preflight = Preflight()
+
+
+def preflight() -> Preflight:
+    return _preflight
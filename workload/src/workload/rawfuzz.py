@@ -205,3 +205,13 @@ def escalate(name: str, ops: list[str]) -> Escalation | None:
     op = choice(pool)
     ops.append(f"raw:{op.tag}")
     return op.build()
+
+
+def escalate_tag(name: str, tag: str, ops: list[str]) -> Escalation | None:
+    """Rebuild the raw operator ``tag`` (a corpus replay), else ``None`` if it no longer
+    exists or doesn't apply to ``name``."""
+    op = next((o for o in _OPERATORS if o.tag == tag and o.applies(name)), None)
+    if op is None:
+        return None
+    ops.append(f"raw:{op.tag}")
+    return op.build()
@@ -0,0 +1,52 @@
+"""``ReadySet``: a set that also hands out a uniformly drawn member in O(1)."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+from workload.randoms import randint
+
+
+class ReadySet[T]:
+    """Set with O(1) add, discard and uniform pick (swap-remove over a list)."""
+
+    def __init__(self) -> None:
+        self._items: list[T] = []
+        self._pos: dict[T, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._pos
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def add(self, item: T) -> None:
+        if item not in self._pos:
+            self._pos[item] = len(self._items)
+            self._items.append(item)
+
+    def update(self, items: Iterable[T]) -> None:
+        for item in items:
+            self.add(item)
+
+    def discard(self, item: T) -> None:
+        i = self._pos.pop(item, None)
+        if i is None:
+            return
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last
+            self._pos[last] = i
+
+    def pick(self) -> T | None:
+        return self._items[randint(0, len(self._items) - 1)] if self._items else None
+
+    def take(self) -> T | None:
+        """Pick and remove."""
+        item = self.pick()
+        if item is not None:
+            self.discard(item)
+        return item
@@ -0,0 +1,156 @@
+"""Ledger-time scheduler for the workload's time-gated ledger objects.
+
+Escrows, checks, credentials, payment channels and loans each carry ripple-epoch deadlines
+(FinishAfter / CancelAfter, Expiration, NextPaymentDueDate + GracePeriod) that decide which
+transactions on them can succeed. Handlers used to pick such objects without looking at the
+clock, so a time-gated success path was hit only by luck.
+
+``Scheduler.apply`` reads those fields out of every validated tx's meta and pushes one
+deadline per (kind, ledger index) onto a per-kind min-heap. ``advance`` is fed the
+``ledger_time`` of each ``ledgerClosed`` message: every deadline the ledger's close time has
+passed moves into that kind's ready set. rippled compares against the parent ledger's close
+time, so the next ledger is the first that will honour a deadline a closed ledger has passed.
+Whether "passed" includes the deadline itself depends on the kind: escrow FinishAfter and
+CancelAfter and credential expiry need the close time strictly after it, while check and
+payment-channel expiry (``parentCloseTime >= Expiration``) count it at the deadline
+(``INCLUSIVE``). Pushes and pops are O(log n); ready sets pick
+and drop in O(1). ``upcoming`` peeks at the next deadline not yet passed, for faulty paths
+that aim one ledger early.
+
+Until the first ``ledgerClosed`` arrives ``started`` is False and handlers keep their old
+time-blind picks.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from workload.readyset import ReadySet
+
+ESCROW_FINISH = "escrow_finish"
+ESCROW_CANCEL = "escrow_cancel"
+CHECK_EXPIRED = "check_expired"
+CREDENTIAL_EXPIRED = "credential_expired"
+CHANNEL_EXPIRED = "channel_expired"
+LOAN_LATE = "loan_late"
+LOAN_DEFAULTABLE = "loan_defaultable"
+
+KINDS = (
+    ESCROW_FINISH,
+    ESCROW_CANCEL,
+    CHECK_EXPIRED,
+    CREDENTIAL_EXPIRED,
+    CHANNEL_EXPIRED,
+    LOAN_LATE,
+    LOAN_DEFAULTABLE,
+)
+
+# Kinds rippled treats as passed at the deadline itself; every other kind needs the close
+# time strictly after it.
+INCLUSIVE = frozenset({CHECK_EXPIRED, CHANNEL_EXPIRED})
+
+
+def passed(kind: str, deadline: int, now: int) -> bool:
+    """Whether a ledger closed at ``now`` has passed ``kind``'s ``deadline``."""
+    return deadline <= now if kind in INCLUSIVE else deadline < now
+
+
+class Scheduler:
+    def __init__(self) -> None:
+        self.now = 0  # close time of the latest validated ledger, ripple epoch seconds
+        self._heaps: dict[str, list[tuple[int, str]]] = {k: [] for k in KINDS}
+        # (kind, index) -> its live deadline; heap entries that disagree are stale
+        self._deadlines: dict[tuple[str, str], int] = {}
+        self.ready: dict[str, ReadySet[str]] = {k: ReadySet() for k in KINDS}
+
+    @property
+    def started(self) -> bool:
+        return self.now > 0
+
+    def schedule(self, kind: str, index: str, deadline: int) -> None:
+        """(Re)schedule ``index`` for ``kind`` at ``deadline``, replacing any earlier one."""
+        self.ready[kind].discard(index)
+        self._deadlines[(kind, index)] = deadline
+        if passed(kind, deadline, self.now):
+            self._passed(kind, index)
+        else:
+            heapq.heappush(self._heaps[kind], (deadline, index))
+
+    def _passed(self, kind: str, index: str) -> None:
+        self.ready[kind].add(index)
+        if kind == ESCROW_CANCEL:
+            # Past CancelAfter an escrow can only be cancelled, never finished.
+            self.cancel(ESCROW_FINISH, index)
+
+    def cancel(self, kind: str, index: str) -> None:
+        self._deadlines.pop((kind, index), None)
+        self.ready[kind].discard(index)
+
+    def forget(self, index: str) -> None:
+        for kind in KINDS:
+            self.cancel(kind, index)
+
+    def advance(self, close_time: int) -> None:
+        self.now = max(self.now, close_time)
+        for kind, heap in self._heaps.items():
+            while heap and passed(kind, heap[0][0], self.now):
+                deadline, index = heapq.heappop(heap)
+                if self._deadlines.get((kind, index)) == deadline:
+                    self._passed(kind, index)
+
+    def upcoming(self, kind: str) -> tuple[int, str] | None:
+        """Earliest (deadline, index) of ``kind`` not yet passed."""
+        heap = self._heaps[kind]
+        while heap and self._deadlines.get((kind, heap[0][1])) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def apply(self, meta: dict) -> None:
+        for node in meta.get("AffectedNodes", []):
+            for kind, n in node.items():
+                if not isinstance(n, dict):
+                    continue
+                index = n.get("LedgerIndex", "")
+                if kind == "DeletedNode":
+                    self.forget(index)
+                elif index:
+                    self._apply_entry(
+                        n.get("LedgerEntryType", ""),
+                        index,
+                        n.get("FinalFields") or n.get("NewFields") or {},
+                        created=kind == "CreatedNode",
+                    )
+
+    def _apply_entry(self, entry: str, index: str, fields: dict, *, created: bool) -> None:
+        if entry == "Escrow" and created:
+            cancel_after = fields.get("CancelAfter")
+            # No FinishAfter: finishable (given the fulfillment) from the start.
+            self.schedule(ESCROW_FINISH, index, int(fields.get("FinishAfter", -1)))
+            if cancel_after is not None:
+                self.schedule(ESCROW_CANCEL, index, int(cancel_after))
+        elif entry in ("Check", "Credential") and "Expiration" in fields:
+            kind = CHECK_EXPIRED if entry == "Check" else CREDENTIAL_EXPIRED
+            if (kind, index) not in self._deadlines:
+                self.schedule(kind, index, int(fields["Expiration"]))
+        elif entry == "PayChannel":
+            # Expiration appears (or moves) when the source asks to close; CancelAfter is fixed.
+            times = [int(fields[f]) for f in ("Expiration", "CancelAfter") if f in fields]
+            if times and self._deadlines.get((CHANNEL_EXPIRED, index)) != min(times):
+                self.schedule(CHANNEL_EXPIRED, index, min(times))
+        elif entry == "Loan":
+            due = fields.get("NextPaymentDueDate")
+            if due is None or int(fields.get("PaymentRemaining", 0)) == 0:
+                self.cancel(LOAN_LATE, index)
+                self.cancel(LOAN_DEFAULTABLE, index)
+                return
+            due = int(due)
+            if self._deadlines.get((LOAN_LATE, index)) != due:
+                self.schedule(LOAN_LATE, index, due)
+                self.schedule(LOAN_DEFAULTABLE, index, due + int(fields.get("GracePeriod", 0)))
+
+
+_scheduler = Scheduler()
+
+
+def schedule() -> Scheduler:
+    return _scheduler
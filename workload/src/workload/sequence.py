@@ -28,12 +28,22 @@ class SequenceTracker:
         return seq
 
     def advance(self, address: str, by: int) -> None:
-        """Bump tracked sequence by ``by`` (no-op if untracked). For TicketCreate:
-        it advances Sequence by TicketCount + 1 but next_seq only added the +1,
-        so callers pass ``by = TicketCount`` to keep a reused account aligned."""
+        """Bump tracked sequence by ``by`` (no-op if untracked): reserves ``by`` more
+        after the one ``next_seq`` just returned, e.g. for a Batch's inner transactions."""
         if address in self._seqs:
             self._seqs[address] += by
 
+    def observe(self, address: str, next_free: int) -> None:
+        """A submit the tracker didn't number (autofilled, fuzzed, a TicketCreate's extra
+        sequences) left ``address`` at ``next_free``: move past it (no-op if untracked)."""
+        if address in self._seqs:
+            self._seqs[address] = max(self._seqs[address], next_free)
+
     def reset(self, address: str) -> None:
         """Force re-initialization on next call (e.g., after a known desync)."""
         self._seqs.pop(address, None)
+
+
+def consumes_sequence(engine_result: str) -> bool:
+    """Whether a tentative result means the tx took its Sequence (applied, or queued)."""
+    return engine_result.startswith(("tes", "tec")) or engine_result == "terQUEUED"
@@ -64,12 +64,14 @@ from workload.assertions import assert_no_internal_error_submit
 from workload.models import ConfidentialHolder, ConfidentialMPTIssuance, UserAccount
 from workload.sequence import SequenceTracker
 from workload.submit import submit_tx
+from workload.ticketpool import TARGET as TICKET_POOL_TARGET
+from workload.ticketpool import pool as ticket_pool
 
 # ── Constants ───────────────────────────────────────────────────────────
 _SETUP_CREDENTIAL_TYPE = b"setup".hex()
 _TRUSTLINE_LIMIT = "1000000000000000"
 _VAULT_ASSETS_MAXIMUM = "1000000000"
-_TICKET_COUNT = 5
+_TICKET_COUNT = TICKET_POOL_TARGET  # seeded to the pool's full stock; it refills from there
 _IOU_DISTRIBUTION_AMOUNT = "10000"
 _MPT_DISTRIBUTION_AMOUNT = "10000"
 _AMM_XRP_AMOUNT = "100000000"  # 100 XRP in drops
@@ -253,7 +255,7 @@ def _vault_exists(txn: Any, w: Workload) -> bool:
 
 
 def _nft_exists(txn: Any, w: Workload) -> bool:
-    return any(n.owner == txn.account for n in w.nfts)
+    return bool(w.nfts.owned(txn.account))
 
 
 def _nft_offer_exists(txn: Any, w: Workload) -> bool:
@@ -744,7 +746,7 @@ _CROSS_RESOURCE_RICH_RANGE = range(77, 97)  # accounts[77..96]: ticket + delegat
 _CROSS_RESOURCE_DELEGATE_INDICES = (97, 98)  # authorized delegates (perm chunk A / chunk B)
 _CROSS_RESOURCE_FUNDED_SPONSOR_INDEX = 99  # funds a fee+reserve Sponsorship for every rich acct
 _CROSS_RESOURCE_EXHAUSTED_SPONSOR_INDEX = 6  # fee-only (reserve budget 0) -> prefunded_exhausted
-_CROSS_RESOURCE_TICKET_SEED = 60  # generous so the ticket pool outlasts driver consumption
+_CROSS_RESOURCE_TICKET_SEED = TICKET_POOL_TARGET  # full stock; the pool refills from there
 _CROSS_RESOURCE_EXHAUSTED_COUNT = 4  # rich accts that also get an exhausted-reserve sponsorship
 _DELEGATE_PERMS_MAX = 10  # rippled PERMISSIONS_MAX_LENGTH per DelegateSet
 
@@ -903,6 +905,7 @@ async def _setup_cross_resource(
     n_tickets = await _submit_batch("cross_resource_tickets", ticket_txns, client, seq)
     for r in rich:
         seq.advance(r.address, _CROSS_RESOURCE_TICKET_SEED)
+    ticket_pool().hot.update(rich_addrs)
 
     # Let the WS listener track the seeded state (modifier ctx reads tracked
     # delegates / sponsorships / per-account tickets).
@@ -1447,10 +1450,10 @@ async def run_setup(workload: Workload) -> dict[str, int]:
         seq,
     )
     summary["tickets"] *= _TICKET_COUNT
-    # TicketCreate advances Sequence by TicketCount + 1 but next_seq counted
-    # only +1; realign the tracker for accounts reused later (domains in step 11).
-    for i in ticket_indices:
-        seq.advance(accs[i].address, _TICKET_COUNT)
+    # TicketCreate advances Sequence by TicketCount + 1 but next_seq counted only +1;
+    # sign_and_submit moves the tracker past the rest for accounts reused later
+    # (domains in step 11).
+    ticket_pool().hot.update(accs[i].address for i in ticket_indices)
 
     # ── 11. Permissioned domains ─────────────────────────────────────
     if len(accs) > 52:
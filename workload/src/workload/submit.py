@@ -1,5 +1,14 @@
-"""Fire-and-forget transaction submission; ws_listener.py handles validated results."""
+"""Fire-and-forget transaction submission; ws_listener.py handles validated results.
 
+Driver submits take their Sequence from the shared ``SequenceTracker`` (the one
+``packing.configure`` installs) rather than autofilling it over RPC, so the tracker stays
+in step with everything the account sends and batch packing can allocate from it.
+Submits that number themselves — autofilled ones, setup's pre-stamped ones, fuzzed ones —
+move the tracker past the Sequence they used; a rejected or failed tracked submit resets
+the account so its next one re-reads the ledger.
+"""
+
+import time
 from collections.abc import Callable
 from contextlib import AbstractContextManager, nullcontext
 from typing import Any
@@ -8,12 +17,15 @@ from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.asyncio.transaction import autofill, autofill_and_sign, submit
 from xrpl.core import keypairs
 from xrpl.core.binarycodec import encode, encode_for_signing
+from xrpl.core.binarycodec.types import STObject
+from xrpl.models import TicketCreate
 from xrpl.models.requests import SubmitOnly
 from xrpl.models.transactions.transaction import Transaction
 from xrpl.wallet import Wallet
 
 from workload import logging
 from workload.assertions import assert_modifier_combo, tx_submitted, tx_submitting
+from workload.sequence import SequenceTracker, consumes_sequence
 
 log = logging.getLogger(__name__)
 
@@ -67,8 +79,38 @@ async def submit_tx(
     """
     if seq is not None:
         txn = txn.__replace__(sequence=seq)
+    if not _modifiers_enabled:
+        return await submit_individually(name, txn, client, wallet)
+
+    # Lazy import: packing -> submit would cycle.
+    from workload.packing import packer
+
+    batcher = packer()
+    if seq is None and batcher.packable(name, txn, wallet):
+        return await batcher.submit(name, txn, client, wallet)
+    started = time.monotonic()
+    result = await submit_individually(name, txn, client, wallet)
+    batcher.record("individual", result, started)
+    return result
+
+
+def _sequences() -> SequenceTracker | None:
+    # Lazy import: packing -> submit would cycle.
+    from workload.packing import packer
+
+    return packer().sequences
 
+
+async def submit_individually(
+    name: str, txn: Transaction, client: AsyncJsonRpcClient, wallet: Wallet
+) -> dict:
+    """``submit_tx`` without batch packing: modifiers (once enabled), sign, submit.
+
+    Once modifiers are enabled (driver submits), a transaction still without a Sequence or
+    TicketSequence after them gets the tracker's next one for its account.
+    """
     cosigns: list[Callable[[Any], Any]] = []
+    sequences = None
     if _modifiers_enabled:
         # Lazy import: modifiers -> transactions -> delegation -> submit would cycle.
         from workload.modifiers import ModifierCtx, apply_modifiers
@@ -76,14 +118,54 @@ async def submit_tx(
         ctx = ModifierCtx(delegates=_delegates, accounts=_accounts, sponsorships=_sponsorships)
         txn, wallet, applied, cosigns = apply_modifiers(name, txn, wallet, ctx)
         assert_modifier_combo(name, applied)
+        if txn.sequence is None and txn.ticket_sequence is None:
+            sequences = _sequences()
+        if sequences is not None:
+            txn = txn.__replace__(sequence=await sequences.next_seq(txn.account))
+    if sequences is None:
+        return await sign_and_submit(name, txn, client, wallet, cosigns)
+    try:
+        result = await sign_and_submit(name, txn, client, wallet, cosigns)
+    except Exception:
+        sequences.reset(txn.account)
+        raise
+    if not consumes_sequence(result.get("engine_result", "")):
+        # The Sequence went unused (or was already taken): re-read it next time.
+        sequences.reset(txn.account)
+    return result
+
+
+def _observe(account: Any, sequence: Any, result: dict, extra: int = 0) -> None:
+    """Move the tracker past a submit that numbered itself, if it took its Sequence."""
+    sequences = _sequences()
+    if (
+        sequences is not None
+        and isinstance(account, str)
+        and isinstance(sequence, int)
+        and sequence > 0
+        and consumes_sequence(result.get("engine_result", ""))
+    ):
+        sequences.observe(account, sequence + 1 + extra)
 
+
+async def sign_and_submit(
+    name: str,
+    txn: Transaction,
+    client: AsyncJsonRpcClient,
+    wallet: Wallet,
+    cosigns: list[Callable[[Any], Any]] | None = None,
+) -> dict:
+    """Autofill, sign, apply post-sign ``cosigns``, submit; no modifiers, no packing."""
     signed = await autofill_and_sign(txn, client, wallet)
-    for cosign in cosigns:
+    for cosign in cosigns or ():
         signed = cosign(signed)
     tx_submitting(name, signed)
     response = await submit(signed, client)
     result: dict = response.result
     tx_submitted(name, signed, result)
+    # TicketCreate takes TicketCount sequences on top of its own.
+    extra = signed.ticket_count if isinstance(signed, TicketCreate) else 0
+    _observe(signed.account, signed.sequence, result, extra)
     return result
 
 
@@ -117,14 +199,20 @@ async def submit_raw(
     with encode_ctx if encode_ctx is not None else nullcontext():
         serialized = encode_for_signing(tx_dict)
         tx_dict["TxnSignature"] = keypairs.sign(bytes.fromhex(serialized), wallet.private_key)
-        tx_blob = encode(tx_dict)
+        if blob_mutate is None:
+            tx_blob = encode(tx_dict)
+        else:
+            # Serialize straight to bytes: the op walks and splices native bytes, and the
+            # result is hex-encoded exactly once, below, for the submit request.
+            blob = bytes(STObject.from_value(tx_dict))
     if blob_mutate is not None:
-        mutated = blob_mutate(bytes.fromhex(tx_blob)).hex().upper()
-        if mutated == tx_blob.upper():
+        mutated = blob_mutate(blob)
+        if mutated == blob:
             raise BlobUnchanged(name)
-        tx_blob = mutated
+        tx_blob = mutated.hex().upper()
     tx_submitting(name, tx_dict)
     response = await client.request(SubmitOnly(tx_blob=tx_blob))
     result: dict = response.result
     tx_submitted(name, tx_dict, result)
+    _observe(tx_dict.get("Account"), tx_dict.get("Sequence"), result)
     return result
@@ -0,0 +1,126 @@
+"""Ticket pool manager: a standing stock of Tickets per hot account.
+
+The ticket modifier puts ``Sequence=0`` + a ``TicketSequence`` on a driver submit, so
+transactions from one account can be in flight together without queuing behind each
+other's Sequence (no ``terPRE_SEQ`` stalls). It used to draw from whatever tickets setup and
+random ``/tickets/create/random`` calls happened to leave, sorting the set on every draw;
+once those ran out the account fell back to sequenced submits for the rest of the run.
+
+``TicketPool.take`` hands out a ticket in O(1) from the account's ``ReadySet``. An account
+that draws tickets is hot (setup registers its cross-resource accounts up front; others join
+on their first draw, up to ``TICKET_POOL_HOT``). When a hot account's stock falls below
+``TICKET_POOL_LOW_WATER``, ``take`` starts one background ``TicketCreate`` for the shortfall
+up to ``TICKET_POOL_TARGET``, capped by the owner reserve the balance mirror says the
+account can spare. The refill counts as in flight until the WS listener adds the new tickets
+(``restocked``) or ``_REFILL_TIMEOUT`` passes, so a lost refill is retried rather than
+blocking the account for good.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections import Counter
+
+import httpx
+from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.constants import XRPLException
+from xrpl.models.transactions import TicketCreate
+
+from workload import logging
+from workload.balances import mirror
+from workload.models import UserAccount
+
+log = logging.getLogger(__name__)
+
+TARGET = min(250, int(os.environ.get("TICKET_POOL_TARGET", "60")))  # rippled: 250 per account
+LOW_WATER = int(os.environ.get("TICKET_POOL_LOW_WATER", str(TARGET // 4)))
+MAX_HOT = int(os.environ.get("TICKET_POOL_HOT", "64"))
+
+_REFILL_TIMEOUT = 30.0  # seconds a refill may stay unvalidated before another is allowed
+_REFILL_ACCEPTED = ("tesSUCCESS", "terQUEUED")
+
+
+class TicketPool:
+    def __init__(self) -> None:
+        self.client: AsyncJsonRpcClient | None = None
+        self.hot: set[str] = set()
+        self._refilling: dict[str, float] = {}  # address -> monotonic deadline
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.counts: Counter[str] = Counter()
+
+    def take(self, acct: UserAccount) -> int | None:
+        """A ticket of ``acct``'s, removed from its stock (consumed optimistically, so
+        concurrent submits never share one); None when it holds none."""
+        had = len(acct.tickets)
+        ticket = acct.tickets.take()
+        self.counts["taken" if ticket is not None else "empty"] += 1
+        if acct.address not in self.hot and had and len(self.hot) < MAX_HOT:
+            self.hot.add(acct.address)
+        if acct.address in self.hot:
+            self._maybe_refill(acct)
+        return ticket
+
+    def restocked(self, address: str) -> None:
+        self._refilling.pop(address, None)
+
+    def _maybe_refill(self, acct: UserAccount) -> None:
+        stock = len(acct.tickets)
+        if self.client is None or stock >= LOW_WATER:
+            return
+        if self._refilling.get(acct.address, 0.0) > time.monotonic():
+            return
+        count = TARGET - stock
+        spendable = mirror().spendable_xrp(acct.address)
+        if spendable is not None:
+            count = min(count, spendable // mirror().reserve_inc)
+        if count < 1:
+            self.counts["refill_unfunded"] += 1
+            return
+        self._refilling[acct.address] = time.monotonic() + _REFILL_TIMEOUT
+        task = asyncio.get_running_loop().create_task(self._refill(acct, count))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refill(self, acct: UserAccount, count: int) -> None:
+        # Lazy import: submit -> modifiers -> ticketpool -> submit would cycle.
+        from workload.submit import sign_and_submit
+
+        assert self.client is not None
+        txn = TicketCreate(account=acct.address, ticket_count=count)
+        try:
+            # Straight to sign_and_submit: a refill is pool upkeep, not driver load, so it
+            # skips the modifiers and batch packing.
+            result = await sign_and_submit("TicketCreate", txn, self.client, acct.wallet)
+        except (XRPLException, httpx.TimeoutException) as e:
+            log.warning("Ticket refill for %s failed: %s: %s", acct, type(e).__name__, e)
+            self.restocked(acct.address)
+            return
+        self.counts["refills"] += 1
+        if result.get("engine_result") not in _REFILL_ACCEPTED:
+            self.counts["refills_rejected"] += 1
+            self.restocked(acct.address)  # let the next draw try again
+
+    def snapshot(self, accounts: dict[str, UserAccount]) -> dict:
+        stocks = [len(accounts[a].tickets) for a in self.hot if a in accounts]
+        return {
+            "target": TARGET,
+            "low_water": LOW_WATER,
+            "hot": len(self.hot),
+            "refilling": len(self._refilling),
+            "stock_min": min(stocks, default=0),
+            "stock_mean": round(sum(stocks) / len(stocks), 2) if stocks else 0.0,
+            **self.counts,
+        }
+
+
+_pool = TicketPool()
+
+
+def configure(client: AsyncJsonRpcClient) -> None:
+    _pool.client = client
+
+
+def pool() -> TicketPool:
+    return _pool
@@ -15,6 +15,7 @@ from xrpl.models.currencies import MPTCurrency
 from xrpl.models.transactions import MPTokenIssuanceCreateFlag
 
 from workload import params
+from workload.loans import lifecycle
 from workload.models import (
     AMM,
     DID,
@@ -37,6 +38,8 @@ from workload.models import (
     UserAccount,
     Vault,
 )
+from workload.nftpages import nft_pages
+from workload.ticketpool import pool as ticket_pool
 from workload.transactions.account_delete import account_delete
 from workload.transactions.account_set import account_set_random
 from workload.transactions.amm import (
@@ -94,7 +97,7 @@ from workload.transactions.payment_channels import (
     channel_create,
     channel_fund,
 )
-from workload.transactions.payments import payment_random
+from workload.transactions.payments import payment_path, payment_random
 from workload.transactions.permissioned_dex import (
     offer_create_domain,
     offer_create_hybrid,
@@ -242,7 +245,7 @@ def _on_nftoken_mint(w: Workload, tx: dict, meta: dict) -> None:
     nftoken_id = meta.get("nftoken_id")
     if nftoken_id:
         account = tx["Account"]
-        w.nfts.append(NFT(owner=account, nftoken_id=nftoken_id))
+        w.nfts.add(NFT(owner=account, nftoken_id=nftoken_id))
         if account in w.accounts:
             w.accounts[account].nfts.add(nftoken_id)
 
@@ -250,9 +253,9 @@ def _on_nftoken_mint(w: Workload, tx: dict, meta: dict) -> None:
 def _on_nftoken_burn(w: Workload, tx: dict, meta: dict) -> None:
     nftoken_id = tx.get("NFTokenID")
     if nftoken_id:
-        w.nfts[:] = [n for n in w.nfts if n.nftoken_id != nftoken_id]
-        for acc in w.accounts.values():
-            acc.nfts.discard(nftoken_id)
+        nft = w.nfts.remove(nftoken_id)
+        if nft is not None and nft.owner in w.accounts:
+            w.accounts[nft.owner].nfts.discard(nftoken_id)
 
 
 def _on_nftoken_create_offer(w: Workload, tx: dict, meta: dict) -> None:
@@ -274,6 +277,22 @@ def _on_nftoken_cancel_offer(w: Workload, tx: dict, meta: dict) -> None:
         w.nft_offers[:] = [o for o in w.nft_offers if o.offer_id not in removed]
 
 
+def _on_nftoken_accept_offer(w: Workload, tx: dict, meta: dict) -> None:
+    accepted = {tx.get("NFTokenSellOffer"), tx.get("NFTokenBuyOffer")} - {None}
+    if accepted:
+        w.nft_offers[:] = [o for o in w.nft_offers if o.offer_id not in accepted]
+    # nftoken_id is at meta top level here too; the page mirror has seen where it landed.
+    nftoken_id = meta.get("nftoken_id", "")
+    owner = nft_pages().owner_of.get(nftoken_id)
+    if owner is None:
+        return
+    old = w.nfts.move(nftoken_id, owner)
+    if old is not None and old.owner in w.accounts:
+        w.accounts[old.owner].nfts.discard(nftoken_id)
+    if owner in w.accounts:
+        w.accounts[owner].nfts.add(nftoken_id)
+
+
 def _on_mpt_create(w: Workload, tx: dict, meta: dict) -> None:
     # mpt_issuance_id is at meta top level, like nftoken_id for NFTs
     mpt_id = meta.get("mpt_issuance_id")
@@ -454,6 +473,7 @@ def _on_ticket_create(w: Workload, tx: dict, meta: dict) -> None:
     count = tx.get("TicketCount", 0)
     if account in w.accounts and seq and count:
         w.accounts[account].tickets.update(range(seq + 1, seq + 1 + count))
+        ticket_pool().restocked(account)
 
 
 def _parse_accepted_credentials(tx: dict) -> list[tuple[str, str]]:
@@ -566,7 +586,14 @@ def _on_loan_manage(w: Workload, tx: dict, meta: dict) -> None:
 
 def _on_loan_pay(w: Workload, tx: dict, meta: dict) -> None:
     loan = _find_loan(w, tx.get("LoanID", ""))
-    if loan:
+    if not loan:
+        return
+    # The lifecycle mirror already folded this tx's Loan entry in: use the ledger's
+    # PrincipalOutstanding over a guess (a payment covers interest and fees first).
+    entry = lifecycle().loans.get(loan.loan_id)
+    if entry is not None:
+        loan.principal = int(entry.principal)
+    else:
         loan.principal = max(0, loan.principal - _extract_amount(tx))
 
 
@@ -1040,7 +1067,7 @@ REGISTRY: list[tuple[str, str, Handler, ArgsFn, StateUpdater | None]] = [
         "/nft/accept_offer/random",
         nftoken_accept_offer,
         lambda w: (w.accounts, w.nfts, w.nft_offers, w.client),
-        None,
+        _on_nftoken_accept_offer,
     ),
     (
         "AccountSet",
@@ -1310,6 +1337,15 @@ REGISTRY: list[tuple[str, str, Handler, ArgsFn, StateUpdater | None]] = [
         lambda w: (w.accounts, w.mpt_issuances, w.client),
         None,
     ),
+    # PaymentPath: synthetic name; on-ledger type is Payment (no updater).
+    # ws_listener fires tx_result when a validated Payment carries Paths.
+    (
+        "PaymentPath",
+        "/payment/path/random",
+        payment_path,
+        lambda w: (w.accounts, w.client),
+        None,
+    ),
     (
         "CheckCreate",
         "/check/create/random",
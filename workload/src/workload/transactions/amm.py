@@ -1,5 +1,7 @@
 """AMM transaction generators; MPT pools (XLS-82) are handled everywhere, not skipped."""
 
+from decimal import Decimal
+
 import xrpl.models
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models import AuthAccount, IssuedCurrency
@@ -17,7 +19,9 @@ from xrpl.models.transactions import (
 from xrpl.models.transactions.amm_deposit import AMMDepositFlag
 from xrpl.models.transactions.amm_withdraw import AMMWithdrawFlag
 
-from workload import params
+from workload import ammstate, params
+from workload.ammstate import AMMPool
+from workload.balances import AssetKey, asset_key, fmt, mirror
 from workload.fuzz import submit_fuzzed
 from workload.models import AMM, MPTokenIssuance, TrustLine, UserAccount
 from workload.randoms import choice, randint, random, sample
@@ -91,6 +95,35 @@ def _amount_for(
     return IOUAmount(currency=asset.currency, issuer=asset.issuer, value=value)
 
 
+def _deposit_amount(
+    src: UserAccount, asset: IssuedCurrency | MPTCurrency | xrpl.models.XRP
+) -> IOUAmount | MPTAmount | str:
+    return mirror().solvent(src.address, _amount_for(asset, params.amm_deposit_amount()))
+
+
+def _pool_for(amm: AMM) -> AMMPool | None:
+    """Mirrored state of ``amm``, when it's known well enough to quote against."""
+    pool = ammstate.pools().get([asset_key(a) for a in amm.assets])
+    return pool if pool is not None and pool.funded() else None
+
+
+def _quoted(
+    asset: IssuedCurrency | MPTCurrency | xrpl.models.XRP, value: Decimal
+) -> IOUAmount | MPTAmount | str:
+    return _amount_for(asset, fmt(asset_key(asset), value))
+
+
+def _lp_value(lp: IssuedCurrency, value: Decimal) -> str:
+    return fmt(asset_key(lp), value)
+
+
+def _quoted_deposit(src: UserAccount, pool: AMMPool, key: AssetKey) -> Decimal:
+    """Deposit of ``key`` sized against the pool's reserve, capped at what ``src`` holds."""
+    want = pool.reserve(key) * Decimal(str(params.amm_pool_fraction()))
+    held = mirror().available(src.address, key)
+    return want if held is None else min(want, held)
+
+
 def _iou_leg(amm: AMM) -> IssuedCurrency | None:
     """IOU leg (skip XRP/MPT), or None: signed-IOU faulty vectors must skip MPT-only pools."""
     for a in amm.assets:
@@ -389,7 +422,10 @@ def _amm_deposit_base(
     accounts: dict[str, UserAccount],
     amms: list[AMM],
 ) -> tuple[AMMDeposit, UserAccount] | None:
-    """Valid AMMDeposit + depositor; None when no two-asset AMM exists."""
+    """Valid AMMDeposit + depositor; None when no two-asset AMM exists. With a mirrored pool,
+    amounts are quoted off its reserves and LP supply (proportional legs, the exact deposit
+    for an LP-token ask, the exact EPrice); otherwise drawn from params. Either way they stay
+    within what the mirror says ``src`` holds."""
     if not accounts or not amms:
         return None
     amm = choice(amms)
@@ -397,6 +433,7 @@ def _amm_deposit_base(
     if len(amm.assets) < 2:
         return None
     asset1, asset2 = amm.assets[0], amm.assets[1]
+    pool = _pool_for(amm)
     mode = choice(
         [
             "single_asset",
@@ -410,7 +447,10 @@ def _amm_deposit_base(
 
     if mode == "single_asset":
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_deposit_amount())
+        if pool:
+            amount = _quoted(a, _quoted_deposit(src, pool, asset_key(a)))
+        else:
+            amount = _deposit_amount(src, a)
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -420,8 +460,18 @@ def _amm_deposit_base(
         )
 
     elif mode == "two_asset":
-        amt1 = _amount_for(asset1, params.amm_deposit_amount())
-        amt2 = _amount_for(asset2, params.amm_deposit_amount())
+        if pool:
+            # Exactly in pool ratio: neither leg is the binding one.
+            k1, k2 = asset_key(asset1), asset_key(asset2)
+            v1 = _quoted_deposit(src, pool, k1)
+            v2 = v1 * pool.reserve(k2) / pool.reserve(k1)
+            held2 = mirror().available(src.address, k2)
+            if held2 is not None and v2 > held2:
+                v1, v2 = v1 * held2 / v2, held2
+            amt1, amt2 = _quoted(asset1, v1), _quoted(asset2, v2)
+        else:
+            amt1 = _deposit_amount(src, asset1)
+            amt2 = _deposit_amount(src, asset2)
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -435,11 +485,17 @@ def _amm_deposit_base(
         if not amm.lp_token:
             return None
         lp = amm.lp_token[0]
-        lp_out = IOUAmount(
-            currency=lp.currency,
-            issuer=lp.issuer,
-            value=params.amm_lp_token_amount(),
-        )
+        if pool:
+            # Largest share both of src's balances cover, then a fraction of it.
+            share = Decimal(str(params.amm_pool_fraction()))
+            for k in pool.assets:
+                held = mirror().available(src.address, k)
+                if held is not None:
+                    share = min(share, held / pool.reserve(k))
+            lp_value = fmt(asset_key(lp), pool.lp_supply * share)
+        else:
+            lp_value = params.amm_lp_token_amount()
+        lp_out = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=lp_value)
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -453,12 +509,16 @@ def _amm_deposit_base(
             return None
         lp = amm.lp_token[0]
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_deposit_amount())
-        lp_out = IOUAmount(
-            currency=lp.currency,
-            issuer=lp.issuer,
-            value=params.amm_lp_token_amount(),
-        )
+        if pool:
+            # Amount is the most src will pay: quote the LP tokens that exact amount mints.
+            k = asset_key(a)
+            value = _quoted_deposit(src, pool, k)
+            amount = _quoted(a, value)
+            lp_value = fmt(asset_key(lp), ammstate.lp_out_single(pool, k, value))
+        else:
+            amount = _deposit_amount(src, a)
+            lp_value = params.amm_lp_token_amount()
+        lp_out = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=lp_value)
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -470,8 +530,14 @@ def _amm_deposit_base(
 
     elif mode == "limit_lp_token":
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_deposit_amount())
-        e_price = _amount_for(a, str(randint(1, 1000)))
+        if pool:
+            k = asset_key(a)
+            value = _quoted_deposit(src, pool, k)
+            amount = _quoted(a, value)
+            e_price = _quoted(a, ammstate.deposit_eprice(pool, k, value))
+        else:
+            amount = _deposit_amount(src, a)
+            e_price = _amount_for(a, str(randint(1, 1000)))
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -482,8 +548,8 @@ def _amm_deposit_base(
         )
 
     else:  # two_asset_if_empty
-        amt1 = _amount_for(asset1, params.amm_deposit_amount())
-        amt2 = _amount_for(asset2, params.amm_deposit_amount())
+        amt1 = _deposit_amount(src, asset1)
+        amt2 = _deposit_amount(src, asset2)
         txn = AMMDeposit(
             account=src.address,
             asset=asset1,
@@ -639,7 +705,9 @@ def _amm_withdraw_base(
     accounts: dict[str, UserAccount],
     amms: list[AMM],
 ) -> tuple[AMMWithdraw, UserAccount] | None:
-    """Valid AMMWithdraw + withdrawer; None when no two-asset AMM exists."""
+    """Valid AMMWithdraw + withdrawer; None when no two-asset AMM exists. With a mirrored
+    pool and a known LP balance, the LP tokens burned are a share of what ``src`` holds and
+    the asset amounts are the exact payouts for them (the minimum the ledger must honour)."""
     if not accounts or not amms:
         return None
     amm = choice(amms)
@@ -649,6 +717,15 @@ def _amm_withdraw_base(
     if src is None or len(amm.assets) < 2:
         return None
     asset1, asset2 = amm.assets[0], amm.assets[1]
+    pool = _pool_for(amm)
+    held_lp = (
+        mirror().iou(src.address, amm.lp_token[0].currency, amm.lp_token[0].issuer)
+        if pool and amm.lp_token
+        else None
+    )
+    if not held_lp:
+        pool = None
+    lp_in_value = held_lp * Decimal(str(params.amm_pool_fraction())) if held_lp else Decimal(0)
     mode = choice(
         [
             "single_asset",
@@ -663,7 +740,10 @@ def _amm_withdraw_base(
 
     if mode == "single_asset":
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_withdraw_amount())
+        if pool:
+            amount = _quoted(a, ammstate.withdraw_single(pool, asset_key(a), lp_in_value))
+        else:
+            amount = _amount_for(a, params.amm_withdraw_amount())
         txn = AMMWithdraw(
             account=src.address,
             asset=asset1,
@@ -679,7 +759,7 @@ def _amm_withdraw_base(
         lp_in = IOUAmount(
             currency=lp.currency,
             issuer=lp.issuer,
-            value=params.amm_lp_token_amount(),
+            value=_lp_value(lp, lp_in_value) if pool else params.amm_lp_token_amount(),
         )
         txn = AMMWithdraw(
             account=src.address,
@@ -699,7 +779,11 @@ def _amm_withdraw_base(
 
     elif mode == "one_asset_withdraw_all":
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_withdraw_amount())
+        if pool and held_lp:
+            # Amount is the minimum to receive: exactly what burning every LP token pays.
+            amount = _quoted(a, ammstate.withdraw_single(pool, asset_key(a), held_lp))
+        else:
+            amount = _amount_for(a, params.amm_withdraw_amount())
         txn = AMMWithdraw(
             account=src.address,
             asset=asset1,
@@ -709,8 +793,13 @@ def _amm_withdraw_base(
         )
 
     elif mode == "two_asset":
-        amt1 = _amount_for(asset1, params.amm_withdraw_amount())
-        amt2 = _amount_for(asset2, params.amm_withdraw_amount())
+        if pool:
+            legs = ammstate.proportional(pool, lp_in_value)
+            amt1 = _quoted(asset1, legs[asset_key(asset1)])
+            amt2 = _quoted(asset2, legs[asset_key(asset2)])
+        else:
+            amt1 = _amount_for(asset1, params.amm_withdraw_amount())
+            amt2 = _amount_for(asset2, params.amm_withdraw_amount())
         txn = AMMWithdraw(
             account=src.address,
             asset=asset1,
@@ -725,12 +814,13 @@ def _amm_withdraw_base(
             return None
         lp = amm.lp_token[0]
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_withdraw_amount())
-        lp_in = IOUAmount(
-            currency=lp.currency,
-            issuer=lp.issuer,
-            value=params.amm_lp_token_amount(),
-        )
+        if pool:
+            amount = _quoted(a, ammstate.withdraw_single(pool, asset_key(a), lp_in_value))
+            lp_value = _lp_value(lp, lp_in_value)
+        else:
+            amount = _amount_for(a, params.amm_withdraw_amount())
+            lp_value = params.amm_lp_token_amount()
+        lp_in = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=lp_value)
         txn = AMMWithdraw(
             account=src.address,
             asset=asset1,
@@ -742,8 +832,14 @@ def _amm_withdraw_base(
 
     else:  # limit_lp_token
         a = choice([asset1, asset2])
-        amount = _amount_for(a, params.amm_withdraw_amount())
-        e_price = _amount_for(a, str(randint(1, 1000)))
+        if pool:
+            k = asset_key(a)
+            value = ammstate.withdraw_single(pool, k, lp_in_value)
+            amount = _quoted(a, value)
+            e_price = _quoted(a, ammstate.withdraw_eprice(pool, k, value))
+        else:
+            amount = _amount_for(a, params.amm_withdraw_amount())
+            e_price = _amount_for(a, str(randint(1, 1000)))
         txn = AMMWithdraw(
             account=src.address,
             asset=asset1,
@@ -1020,10 +1116,18 @@ def _amm_bid_base(
     src = choice(list(accounts.values()))
     lp = amm.lp_token[0]
     mode = choice(["basic_bid", "bid_with_auth_accounts"])
+    min_value, max_value = params.amm_bid_min(), params.amm_bid_max()
+    pool = _pool_for(amm)
+    held_lp = mirror().iou(src.address, lp.currency, lp.issuer)
+    if pool and held_lp:
+        # Bid right at the current slot price, with everything src holds as the ceiling.
+        slot_price = pool.auction_slot.price
+        min_value = _lp_value(lp, min(slot_price, held_lp) if slot_price > 0 else held_lp / 100)
+        max_value = _lp_value(lp, held_lp)
 
     if mode == "basic_bid":
-        bid_min = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=params.amm_bid_min())
-        bid_max = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=params.amm_bid_max())
+        bid_min = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=min_value)
+        bid_max = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=max_value)
         txn = AMMBid(
             account=src.address,
             asset=amm.assets[0],
@@ -1036,7 +1140,7 @@ def _amm_bid_base(
         acct_list = list(accounts.values())
         num_auth = randint(1, min(4, len(acct_list)))
         auth_accounts = [AuthAccount(account=a.address) for a in sample(acct_list, num_auth)]
-        bid_min = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=params.amm_bid_min())
+        bid_min = IOUAmount(currency=lp.currency, issuer=lp.issuer, value=min_value)
         txn = AMMBid(
             account=src.address,
             asset=amm.assets[0],
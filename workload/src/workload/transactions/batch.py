@@ -1,7 +1,6 @@
 """Batch transaction generators for the antithesis workload."""
 
 import xrpl.models
-from xrpl.asyncio.account import get_next_valid_seq_number
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models import Batch, BatchFlag, IssuedCurrencyAmount, Payment
 from xrpl.models.transactions import (
@@ -21,6 +20,7 @@ from xrpl.wallet import Wallet
 from workload import params
 from workload.fuzz import submit_fuzzed
 from workload.models import UserAccount
+from workload.packing import batch_fee, packer
 from workload.randoms import choice, sample
 from workload.submit import submit_tx
 
@@ -113,18 +113,20 @@ async def batch_random(accounts: dict[str, UserAccount], client: AsyncJsonRpcCli
 async def _batch_base(
     accounts: dict[str, UserAccount], client: AsyncJsonRpcClient
 ) -> tuple[Batch, Wallet] | None:
-    """Valid single-account Batch + wallet; shared by valid and fuzz."""
+    """Valid single-account Batch + wallet; shared by valid and fuzz. Its Sequences come
+    from the shared tracker, like a packed Batch's."""
     if len(accounts) < 2:
         return None
     src_address, dst = sample(list(accounts), 2)
-    sequence = await get_next_valid_seq_number(src_address, client)
+    sequence, *inner_seqs = await packer().allocate(src_address, params.batch_size() + 1)
     src = accounts[src_address]
-    inner_txns = [_build_inner(src, dst, sequence + idx + 1) for idx in range(params.batch_size())]
+    inner_txns = [_build_inner(src, dst, seq) for seq in inner_seqs]
     batch_txn = Batch(
         account=src.address,
         flags=choice(list(BatchFlag)),
         raw_transactions=inner_txns,
         sequence=sequence,
+        fee=await batch_fee(inner_txns, client),
     )
     return batch_txn, src.wallet
 
@@ -135,6 +137,9 @@ async def _batch_random_valid(accounts: dict[str, UserAccount], client: AsyncJso
         return
     batch_txn, wallet = built
     await submit_tx("Batch", batch_txn, client, wallet)
+    # ONLY_ONE and UNTIL_FAILURE skip inners by design, and each one skipped leaves a gap
+    # in the Sequences allocate() handed out: re-read the account next time.
+    packer().release(batch_txn.account)
 
 
 async def _batch_random_faulty(
@@ -151,10 +156,11 @@ async def _batch_random_faulty(
             return
         base, wallet = built
         await submit_fuzzed("Batch", base, client, wallet)
+        packer().release(base.account)
         return
 
     src_address, dst = sample(list(accounts), 2)
-    sequence = await get_next_valid_seq_number(src_address, client)
+    sequence, *inner_seqs = await packer().allocate(src_address, 5)
     src = accounts[src_address]
 
     # Mix valid + overdraw inner payments in ALL_OR_NOTHING → batch fails
@@ -162,9 +168,9 @@ async def _batch_random_faulty(
         Payment(
             amount=("1000000" if idx < 2 else "10000000000000"),
             destination=dst,
-            **{**_INNER_COMMON, "account": src.address, "sequence": sequence + idx + 1},
+            **{**_INNER_COMMON, "account": src.address, "sequence": seq},
         )
-        for idx in range(4)
+        for idx, seq in enumerate(inner_seqs)
     ]
 
     batch_txn = Batch(
@@ -172,5 +178,8 @@ async def _batch_random_faulty(
         flags=BatchFlag.TF_ALL_OR_NOTHING,
         raw_transactions=inner_txns,
         sequence=sequence,
+        fee=await batch_fee(inner_txns, client),
     )
     await submit_tx("Batch", batch_txn, client, src.wallet)
+    # ALL_OR_NOTHING with an overdraw: none of the inners' Sequences get used.
+    packer().release(src.address)
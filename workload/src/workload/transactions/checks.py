@@ -7,9 +7,11 @@ from xrpl.models.transactions import CheckCancel, CheckCash, CheckCreate
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import mirror
 from workload.fuzz import submit_fuzzed
 from workload.models import Check, UserAccount
 from workload.randoms import choice, randint
+from workload.schedule import CHECK_EXPIRED, schedule
 from workload.submit import submit_tx
 
 # ── CheckCreate ─────────────────────────────────────────────────────
@@ -151,13 +153,19 @@ def _check_cash_base(
     if not checks:
         return None
 
-    check = choice(checks)
+    # An expired check only cashes to tecEXPIRED.
+    expired = schedule().ready[CHECK_EXPIRED]
+    live = [c for c in checks if c.check_id not in expired] if expired else checks
+    if not live:
+        return None
+    check = choice(live)
     # Only the destination can cash a check.
     dst = accounts.get(check.destination)
     if not dst:
         return None
 
-    cash_amount = params.check_cash_amount(check.send_max)
+    # Cashing pulls from the check's creator, so its spendable XRP bounds the amount too.
+    cash_amount = mirror().solvent(check.creator, params.check_cash_amount(check.send_max))
 
     if choice([True, False]):
         txn = CheckCash(
@@ -250,10 +258,19 @@ def _check_cancel_base(
     accounts: dict[str, UserAccount],
     checks: list[Check],
 ) -> tuple[CheckCancel, Wallet] | None:
-    """Valid CheckCancel of a tracked check + wallet; shared by valid and fuzz."""
+    """Valid CheckCancel of a tracked check + wallet; shared by valid and fuzz. Half the
+    time an expired check, which anyone may cancel, when the ledger clock shows one."""
     if not checks:
         return None
 
+    expired = schedule().ready[CHECK_EXPIRED]
+    if expired and accounts and choice([True, False]):
+        check_id = expired.pick()
+        stale = next((c for c in checks if c.check_id == check_id), None)
+        if stale is not None:
+            anyone = choice(list(accounts.values()))
+            return CheckCancel(account=anyone.address, check_id=stale.check_id), anyone.wallet
+
     check = choice(checks)
     # Creator or destination can cancel.
     canceller_addr = choice([check.creator, check.destination])
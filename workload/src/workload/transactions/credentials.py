@@ -1,7 +1,5 @@
 """Credential transaction generators."""
 
-import time
-
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models.transactions import (
     CredentialAccept,
@@ -14,6 +12,7 @@ from workload import params
 from workload.fuzz import submit_fuzzed
 from workload.models import Credential, UserAccount
 from workload.randoms import choice, sample
+from workload.schedule import CREDENTIAL_EXPIRED, schedule
 from workload.submit import submit_tx
 
 # ── Create ───────────────────────────────────────────────────────────
@@ -39,7 +38,7 @@ def _credential_create_base(
         account=issuer.address,
         subject=subject_id,
         credential_type=params.credential_type(),
-        expiration=int(time.time()) + params.credential_expiration_offset(),
+        expiration=params._ripple_now() + params.credential_expiration_offset(),
         uri=params.credential_uri(),
     )
     return txn, issuer.wallet
@@ -187,9 +186,22 @@ async def credential_delete(
 def _credential_delete_base(
     accounts: dict[str, UserAccount], credentials: list[Credential]
 ) -> tuple[CredentialDelete, Wallet] | None:
-    """Valid CredentialDelete (issuer or subject deletes the credential) + wallet."""
+    """Valid CredentialDelete (issuer or subject deletes the credential) + wallet. An
+    expired credential, when the ledger clock shows one, may be deleted by anyone."""
     if not credentials:
         return None
+    expired_id = schedule().ready[CREDENTIAL_EXPIRED].pick()
+    if expired_id is not None and accounts and choice([True, False]):
+        stale = next((c for c in credentials if c.credential_id == expired_id), None)
+        if stale is not None:
+            anyone = choice(list(accounts.values()))
+            txn = CredentialDelete(
+                account=anyone.address,
+                subject=stale.subject,
+                issuer=stale.issuer,
+                credential_type=stale.credential_type,
+            )
+            return txn, anyone.wallet
     cred = choice(credentials)
     if cred.issuer in accounts:
         account = accounts[cred.issuer]
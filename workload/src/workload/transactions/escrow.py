@@ -10,8 +10,21 @@ from workload import params
 from workload.fuzz import submit_fuzzed
 from workload.models import Escrow, UserAccount
 from workload.randoms import choice, randint
+from workload.schedule import ESCROW_CANCEL, ESCROW_FINISH, schedule
 from workload.submit import submit_tx
 
+
+def _escrow_by_id(escrows: list[Escrow], escrow_id: str | None) -> Escrow | None:
+    if escrow_id is None:
+        return None
+    return next((e for e in escrows if e.escrow_id == escrow_id), None)
+
+
+def _due_escrow(escrows: list[Escrow], kind: str) -> Escrow | None:
+    """A tracked escrow the ledger clock says ``kind`` (finish/cancel) now succeeds on."""
+    return _escrow_by_id(escrows, schedule().ready[kind].pick())
+
+
 # ── EscrowCreate ────────────────────────────────────────────────────
 
 
@@ -178,11 +191,18 @@ def _escrow_finish_base(
     accounts: dict[str, UserAccount],
     escrows: list[Escrow],
 ) -> tuple[EscrowFinish, Wallet] | None:
-    """Valid EscrowFinish of a tracked escrow + wallet; shared by valid and fuzz."""
+    """Valid EscrowFinish of a tracked escrow + wallet; shared by valid and fuzz. Once the
+    ledger clock is running, only escrows past FinishAfter and not yet past CancelAfter."""
     if not escrows or not accounts:
         return None
 
-    escrow = choice(escrows)
+    if schedule().started:
+        due = _due_escrow(escrows, ESCROW_FINISH)
+        if due is None:
+            return None
+        escrow = due
+    else:
+        escrow = choice(escrows)
     # Anyone can finish an escrow.
     src = choice(list(accounts.values()))
 
@@ -223,6 +243,7 @@ async def _escrow_finish_faulty(
             "non_existent_sequence",
             "wrong_fulfillment",
             "wrong_owner",
+            "finish_too_early",
         ]
     )
     if mutation == "fuzz":
@@ -250,12 +271,25 @@ async def _escrow_finish_faulty(
             condition=cond,
             fulfillment=wrong_ful,
         )
-    else:  # wrong_owner
+    elif mutation == "wrong_owner":
         txn = EscrowFinish(
             account=src.address,
             owner=params.fake_account(),
             offer_sequence=randint(1, 100),
         )
+    else:  # finish_too_early
+        # The escrow whose FinishAfter passes next: still tecNO_PERMISSION, by one ledger.
+        upcoming = schedule().upcoming(ESCROW_FINISH)
+        escrow = _escrow_by_id(escrows, upcoming[1] if upcoming else None)
+        if escrow is None:
+            return
+        txn = EscrowFinish(
+            account=src.address,
+            owner=escrow.owner,
+            offer_sequence=escrow.sequence,
+            condition=escrow.condition,
+            fulfillment=escrow.fulfillment,
+        )
 
     await submit_tx("EscrowFinish", txn, client, src.wallet)
 
@@ -277,15 +311,21 @@ def _escrow_cancel_base(
     accounts: dict[str, UserAccount],
     escrows: list[Escrow],
 ) -> tuple[EscrowCancel, Wallet] | None:
-    """Valid EscrowCancel of a cancellable escrow + wallet; shared by valid and fuzz."""
+    """Valid EscrowCancel of a cancellable escrow + wallet; shared by valid and fuzz. Once
+    the ledger clock is running, only escrows whose CancelAfter has actually passed."""
     if not escrows or not accounts:
         return None
 
-    cancellable = [e for e in escrows if e.cancel_after is not None]
-    if not cancellable:
-        return None
-
-    escrow = choice(cancellable)
+    if schedule().started:
+        due = _due_escrow(escrows, ESCROW_CANCEL)
+        if due is None:
+            return None
+        escrow = due
+    else:
+        cancellable = [e for e in escrows if e.cancel_after is not None]
+        if not cancellable:
+            return None
+        escrow = choice(cancellable)
     # Anyone can cancel an expired escrow.
     src = choice(list(accounts.values()))
 
@@ -324,6 +364,7 @@ async def _escrow_cancel_faulty(
             "non_existent_sequence",
             "wrong_owner",
             "cancel_non_cancellable",
+            "cancel_too_early",
         ]
     )
     if mutation == "fuzz":
@@ -346,11 +387,22 @@ async def _escrow_cancel_faulty(
             owner=params.fake_account(),
             offer_sequence=randint(1, 100),
         )
-    else:  # cancel_non_cancellable
+    elif mutation == "cancel_non_cancellable":
         txn = EscrowCancel(
             account=src.address,
             owner=src.address,
             offer_sequence=randint(1, 100),
         )
+    else:  # cancel_too_early
+        # The escrow whose CancelAfter passes next, one ledger before it does.
+        upcoming = schedule().upcoming(ESCROW_CANCEL)
+        escrow = _escrow_by_id(escrows, upcoming[1] if upcoming else None)
+        if escrow is None:
+            return
+        txn = EscrowCancel(
+            account=src.address,
+            owner=escrow.owner,
+            offer_sequence=escrow.sequence,
+        )
 
     await submit_tx("EscrowCancel", txn, client, src.wallet)
@@ -1,8 +1,15 @@
 """Lending Protocol transaction generators (vault → broker → loan chain)."""
 
+import asyncio
+import time
+from collections.abc import Awaitable
+from decimal import Decimal
+
+import httpx
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.asyncio.transaction import autofill_and_sign
 from xrpl.asyncio.transaction import submit as xrpl_submit
+from xrpl.constants import XRPLException
 from xrpl.models.transactions import (
     LoanBrokerCoverDeposit,
     LoanBrokerCoverWithdraw,
@@ -14,16 +21,38 @@ from xrpl.models.transactions import (
     LoanSet,
 )
 from xrpl.models.transactions.loan_manage import LoanManageFlag
+from xrpl.models.transactions.loan_pay import LoanPayFlag
 from xrpl.transaction.counterparty_signer import sign_loan_set_by_counterparty
 from xrpl.wallet import Wallet
 
-from workload import params
+from workload import logging, params
 from workload.assertions import tx_submitted, tx_submitting
+from workload.balances import XRP, AssetKey, amount_for_key, asset_key, fmt
 from workload.fuzz import submit_fuzzed
+from workload.loans import (
+    CONCURRENCY,
+    DEFAULT,
+    DELETE,
+    IMPAIR,
+    ORIGINATED,
+    ORIGINATIONS,
+    PAY_LATE,
+    PAY_OFF,
+    PAY_PARTIAL,
+    TARGET_LOANS,
+    UNIMPAIR,
+    LoanEntry,
+    lifecycle,
+)
 from workload.models import Loan, LoanBroker, UserAccount, Vault
-from workload.randoms import choice, randint
+from workload.randoms import choice, randint, random, sample
+from workload.schedule import LOAN_DEFAULTABLE, schedule
 from workload.submit import submit_tx
 
+log = logging.getLogger(__name__)
+
+_LATE_HEADROOM = Decimal("1.25")
+
 # ── Loan Broker Set ──────────────────────────────────────────────────
 
 
@@ -422,25 +451,37 @@ async def _loan_set_valid(
     loans: list[Loan],
     client: AsyncJsonRpcClient,
 ) -> None:
+    await _loan_set_cosigned(accounts, loan_brokers, client)
+
+
+async def _loan_set_cosigned(
+    accounts: dict[str, UserAccount],
+    loan_brokers: list[LoanBroker],
+    client: AsyncJsonRpcClient,
+    payment_interval: int | None = None,
+    payment_total: int | None = None,
+    borrower_id: str | None = None,
+) -> dict | None:
     if not loan_brokers:
-        return
+        return None
     broker = choice(loan_brokers)
-    if broker.owner not in accounts:
-        return
+    if broker.owner not in accounts or broker.owner == borrower_id:
+        return None
     broker_wallet = accounts[broker.owner].wallet
-    other_accounts = [a for a in accounts if a != broker.owner]
-    if not other_accounts:
-        return
-    borrower_id = choice(other_accounts)
+    if borrower_id is None:
+        other_accounts = [a for a in accounts if a != broker.owner]
+        if not other_accounts:
+            return None
+        borrower_id = choice(other_accounts)
     borrower = accounts[borrower_id]
-    pi = params.loan_payment_interval()
+    pi = payment_interval or params.loan_payment_interval()
     txn = LoanSet(
         account=borrower.address,
         loan_broker_id=broker.loan_broker_id,
         counterparty=broker.owner,
         principal_requested=params.loan_principal(),
         interest_rate=params.loan_interest_rate(),
-        payment_total=params.loan_payment_total(),
+        payment_total=payment_total or params.loan_payment_total(),
         payment_interval=pi,
         grace_period=params.loan_grace_period(pi),
     )
@@ -449,7 +490,9 @@ async def _loan_set_valid(
     cosigned = sign_loan_set_by_counterparty(broker_wallet, signed)
     tx_submitting("LoanSet", cosigned.tx)
     response = await xrpl_submit(cosigned.tx, client)
-    tx_submitted("LoanSet", cosigned.tx, response.result)
+    result: dict = response.result
+    tx_submitted("LoanSet", cosigned.tx, result)
+    return result
 
 
 async def _loan_set_faulty(
@@ -614,6 +657,13 @@ def _loan_manage_base(
     if not loans or not loan_brokers:
         return None
     loan = choice(loans)
+    flag = _state_aware_manage_flag(loan)
+    # A loan past its due date plus grace period is the one a default succeeds on.
+    defaultable_id = schedule().ready[LOAN_DEFAULTABLE].pick()
+    if defaultable_id is not None and choice([True, False]):
+        overdue = next((ln for ln in loans if ln.loan_id == defaultable_id), None)
+        if overdue is not None and not overdue.is_defaulted:
+            loan, flag = overdue, LoanManageFlag.TF_LOAN_DEFAULT
     broker = next((b for b in loan_brokers if b.loan_broker_id == loan.loan_broker_id), None)
     if not broker or broker.owner not in accounts:
         return None
@@ -621,7 +671,7 @@ def _loan_manage_base(
     txn = LoanManage(
         account=owner.address,
         loan_id=loan.loan_id,
-        flags=_state_aware_manage_flag(loan),
+        flags=flag,
     )
     return txn, owner.wallet
 
@@ -779,3 +829,164 @@ async def _loan_pay_faulty(
             amount="0",
         )
         await submit_tx("LoanPay", txn, client, borrower.wallet)
+
+
+# ── Loan Lifecycle ───────────────────────────────────────────────────
+#
+# Not a transaction type of its own: each step submits the LoanSet / LoanPay / LoanManage /
+# LoanDelete that a handful of loans' plans call for next (see workload.loans), so the
+# loans run from origination to deletion instead of being hit by uncorrelated picks.
+
+
+async def loan_lifecycle(
+    accounts: dict[str, UserAccount],
+    loan_brokers: list[LoanBroker],
+    vaults: list[Vault],
+    client: AsyncJsonRpcClient,
+) -> None:
+    """One engine step: originate up to ``ORIGINATIONS`` loans while fewer than
+    ``TARGET_LOANS`` are live, then drive up to ``CONCURRENCY`` loans' next actions
+    concurrently. At most one tx per account per step, so concurrent autofills never race
+    for the same Sequence, and none for a loan whose last tx is still in flight."""
+    engine = lifecycle()
+    steps: list[Awaitable[None]] = []
+    busy: set[str] = set()
+    wanted = min(ORIGINATIONS, TARGET_LOANS - engine.active())
+    if wanted > 0 and loan_brokers:
+        # The broker isn't known until the pick, so every broker owner is kept free too.
+        owners = {b.owner for b in loan_brokers}
+        borrowers = [a for a in accounts if a not in owners]
+        for borrower in sample(borrowers, min(wanted, len(borrowers))):
+            steps.append(_lifecycle_originate(accounts, loan_brokers, borrower, client))
+            busy.add(borrower)
+        if steps:
+            busy.update(owners)
+    originating = len(steps)
+    for _ in range(CONCURRENCY * 2):
+        if len(steps) - originating >= CONCURRENCY:
+            break
+        entry = engine.pick()
+        if entry is None:
+            break
+        action = engine.next_action(entry)
+        if action is None:
+            continue
+        built = _lifecycle_tx(entry, action, accounts, loan_brokers, vaults)
+        if built is None or built[1].account in busy:
+            continue
+        name, txn, wallet = built
+        busy.add(txn.account)
+        engine.mark(entry.index)
+        steps.append(_lifecycle_submit(entry, action, name, txn, wallet, client))
+    await asyncio.gather(*steps)
+
+
+async def _lifecycle_originate(
+    accounts: dict[str, UserAccount],
+    loan_brokers: list[LoanBroker],
+    borrower: str,
+    client: AsyncJsonRpcClient,
+) -> None:
+    started = time.monotonic()
+    try:
+        result = await _loan_set_cosigned(
+            accounts,
+            loan_brokers,
+            client,
+            payment_interval=params.loan_lifecycle_interval(),
+            payment_total=params.loan_lifecycle_payment_total(),
+            borrower_id=borrower,
+        )
+    except (XRPLException, httpx.TimeoutException) as e:
+        # As in _lifecycle_submit: don't let a failed LoanSet fail the whole step.
+        outcome = type(e).__name__
+        log.warning("loan lifecycle originate: %s: %s", outcome, e)
+        lifecycle().record(ORIGINATED, "originate", outcome, time.monotonic() - started)
+        return
+    if result is not None:
+        lifecycle().record(
+            ORIGINATED, "originate", result.get("engine_result", ""), time.monotonic() - started
+        )
+
+
+def _lifecycle_asset(
+    loan_broker_id: str, loan_brokers: list[LoanBroker], vaults: list[Vault]
+) -> AssetKey:
+    broker = next((b for b in loan_brokers if b.loan_broker_id == loan_broker_id), None)
+    if broker is None:
+        return XRP
+    vault = next((v for v in vaults if v.vault_id == broker.vault_id), None)
+    return asset_key(vault.asset) if vault is not None and vault.asset is not None else XRP
+
+
+def _lifecycle_tx(
+    entry: LoanEntry,
+    action: str,
+    accounts: dict[str, UserAccount],
+    loan_brokers: list[LoanBroker],
+    vaults: list[Vault],
+) -> tuple[str, LoanPay | LoanManage | LoanDelete, Wallet] | None:
+    if action in (IMPAIR, UNIMPAIR, DEFAULT):
+        broker = next((b for b in loan_brokers if b.loan_broker_id == entry.broker_id), None)
+        if broker is None or broker.owner not in accounts:
+            return None
+        flag = {
+            IMPAIR: LoanManageFlag.TF_LOAN_IMPAIR,
+            UNIMPAIR: LoanManageFlag.TF_LOAN_UNIMPAIR,
+            DEFAULT: LoanManageFlag.TF_LOAN_DEFAULT,
+        }[action]
+        owner = accounts[broker.owner]
+        manage = LoanManage(account=owner.address, loan_id=entry.index, flags=flag)
+        return "LoanManage", manage, owner.wallet
+    if entry.borrower not in accounts:
+        return None
+    borrower = accounts[entry.borrower]
+    if action == DELETE:
+        return (
+            "LoanDelete",
+            LoanDelete(account=borrower.address, loan_id=entry.index),
+            borrower.wallet,
+        )
+    flags = 0
+    due = entry.periodic_payment
+    if action == PAY_LATE:
+        # Late fee and late interest aren't in the entry; cover them with headroom.
+        due, flags = due * _LATE_HEADROOM, LoanPayFlag.TF_LOAN_LATE_PAYMENT
+    elif action == PAY_PARTIAL:
+        due *= Decimal(str(random() or 0.5))
+    elif action == PAY_OFF:
+        due, flags = entry.total_outstanding, LoanPayFlag.TF_LOAN_FULL_PAYMENT
+    key = _lifecycle_asset(entry.broker_id, loan_brokers, vaults)
+    amount = amount_for_key(key, fmt(key, due, up=action != PAY_PARTIAL)) if due > 0 else None
+    txn = LoanPay(
+        account=borrower.address,
+        loan_id=entry.index,
+        amount=amount or params.loan_pay_amount(),
+        flags=flags,
+    )
+    return "LoanPay", txn, borrower.wallet
+
+
+async def _lifecycle_submit(
+    entry: LoanEntry,
+    action: str,
+    name: str,
+    txn: LoanPay | LoanManage | LoanDelete,
+    wallet: Wallet,
+    client: AsyncJsonRpcClient,
+) -> None:
+    stage = entry.stage
+    started = time.monotonic()
+    try:
+        result = await submit_tx(name, txn, client, wallet)
+        outcome = result.get("engine_result", "")
+    except (XRPLException, httpx.TimeoutException) as e:
+        # Uncaught, this would escape gather and fail the whole step's request; record
+        # the outcome instead.
+        outcome = type(e).__name__
+        log.warning("loan lifecycle %s/%s: %s: %s", stage, action, outcome, e)
+    if outcome not in ("tesSUCCESS", "terQUEUED"):
+        # No Loan meta is coming for this one (a tec leaves the entry as it was), so
+        # don't hold the loan for PENDING_SECS.
+        lifecycle().settle(entry.index)
+    lifecycle().record(stage, action, outcome, time.monotonic() - started)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.models import IssuedCurrencyAmount as IOUAmount
 from xrpl.models.amounts import MPTAmount
 from xrpl.models.transactions import OfferCreate, Payment
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import XRP, AssetKey, amount_for_key, fmt
+from workload.books import books
 from workload.fuzz import submit_fuzzed
 from workload.models import MPTokenIssuance, UserAccount
 from workload.randoms import choice, randint, random, sample
@@ -81,13 +84,31 @@ def _offer_mpt_base(
     xrp = params.offer_xrp_drops()
     if random() < 0.4 and mpt.issuer in accounts:
         issuer = accounts[mpt.issuer]
-        base = OfferCreate(account=issuer.address, taker_gets=mpt_amt, taker_pays=xrp)
+        gets, pays = _book_sized(issuer.address, mpt.mpt_issuance_id, XRP, mpt_amt, xrp)
+        base = OfferCreate(account=issuer.address, taker_gets=gets, taker_pays=pays)
         return base, issuer.wallet
     acct = accounts[choice(list(accounts))]
-    base = OfferCreate(account=acct.address, taker_gets=xrp, taker_pays=mpt_amt)
+    gets, pays = _book_sized(acct.address, XRP, mpt.mpt_issuance_id, xrp, mpt_amt)
+    base = OfferCreate(account=acct.address, taker_gets=gets, taker_pays=pays)
     return base, acct.wallet
 
 
+def _book_sized(
+    account: str,
+    gk: AssetKey,
+    pk: AssetKey,
+    gets: MPTAmount | str,
+    pays: MPTAmount | str,
+) -> tuple[IOUAmount | MPTAmount | str, IOUAmount | MPTAmount | str]:
+    """(taker_gets, taker_pays) sized against the mirrored opposite book, which the issuer's
+    sells and everyone else's buys fill for each other; the drawn pair when it's empty."""
+    quoted = books().quote(account, gk, pk)
+    if quoted is None:
+        return gets, pays
+    give, want = quoted
+    return amount_for_key(gk, fmt(gk, give, up=True)), amount_for_key(pk, fmt(pk, want))
+
+
 async def _offer_create_mpt_valid(
     accounts: dict[str, UserAccount],
     mpt_issuances: list[MPTokenIssuance],
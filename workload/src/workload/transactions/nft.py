@@ -1,6 +1,11 @@
 """NFToken transaction generators for the antithesis workload."""
 
+import asyncio
+import time
+
+import httpx
 from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.constants import XRPLException
 from xrpl.models.transactions import (
     NFTokenAcceptOffer,
     NFTokenBurn,
@@ -11,12 +16,13 @@ from xrpl.models.transactions import (
     NFTokenMintFlag,
     NFTokenModify,
 )
-from xrpl.models.transactions.transaction import Memo
+from xrpl.models.transactions.transaction import Memo, Transaction
 from xrpl.wallet import Wallet
 
 from workload import logging, params
 from workload.fuzz import submit_fuzzed
-from workload.models import NFT, NFTOffer, UserAccount
+from workload.models import NFTOffer, NFTSet, UserAccount
+from workload.nftpages import FILL, nft_pages
 from workload.randoms import choice, random
 from workload.submit import submit_raw, submit_tx
 
@@ -27,7 +33,7 @@ log = logging.getLogger(__name__)
 
 
 async def nftoken_mint(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if params.should_send_faulty():
         return await _nftoken_mint_faulty(accounts, nfts, client)
@@ -56,7 +62,7 @@ def _nftoken_mint_base(
 
 
 async def _nftoken_mint_valid(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     built = _nftoken_mint_base(accounts)
     if built is None:
@@ -66,7 +72,7 @@ async def _nftoken_mint_valid(
 
 
 async def _nftoken_mint_faulty(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if len(accounts) < 2:
         return
@@ -96,7 +102,7 @@ async def _nftoken_mint_faulty(
 
 
 async def nftoken_burn(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if not nfts:
         return
@@ -106,10 +112,10 @@ async def nftoken_burn(
 
 
 def _nftoken_burn_base(
-    accounts: dict[str, UserAccount], nfts: list[NFT]
+    accounts: dict[str, UserAccount], nfts: NFTSet
 ) -> tuple[NFTokenBurn, Wallet] | None:
     """Valid NFTokenBurn of an owned NFT + wallet; shared by valid and fuzz."""
-    nft = choice(nfts)
+    nft = nfts.pick()
     if nft.owner not in accounts:
         return None
     owner = accounts[nft.owner]
@@ -118,7 +124,7 @@ def _nftoken_burn_base(
 
 
 async def _nftoken_burn_valid(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     built = _nftoken_burn_base(accounts, nfts)
     if built is None:
@@ -128,7 +134,7 @@ async def _nftoken_burn_valid(
 
 
 async def _nftoken_burn_faulty(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if not accounts:
         return
@@ -150,7 +156,7 @@ async def _nftoken_burn_faulty(
         return
 
     # non_owner: burn a tracked NFT the submitter doesn't own → tecNO_PERMISSION.
-    nft = choice(nfts)
+    nft = nfts.pick()
     non_owners = [a for a in accounts.values() if a.address != nft.owner]
     if not non_owners:
         return
@@ -163,7 +169,7 @@ async def _nftoken_burn_faulty(
 
 
 async def nftoken_modify(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if not nfts:
         return
@@ -173,10 +179,10 @@ async def nftoken_modify(
 
 
 def _nftoken_modify_base(
-    accounts: dict[str, UserAccount], nfts: list[NFT]
+    accounts: dict[str, UserAccount], nfts: NFTSet
 ) -> tuple[NFTokenModify, Wallet] | None:
     """Valid NFTokenModify of an owned NFT + wallet; shared by valid and fuzz."""
-    nft = choice(nfts)
+    nft = nfts.pick()
     if nft.owner not in accounts:
         return None
     owner = accounts[nft.owner]
@@ -189,7 +195,7 @@ def _nftoken_modify_base(
 
 
 async def _nftoken_modify_valid(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     built = _nftoken_modify_base(accounts, nfts)
     if built is None:
@@ -199,7 +205,7 @@ async def _nftoken_modify_valid(
 
 
 async def _nftoken_modify_faulty(
-    accounts: dict[str, UserAccount], nfts: list[NFT], client: AsyncJsonRpcClient
+    accounts: dict[str, UserAccount], nfts: NFTSet, client: AsyncJsonRpcClient
 ) -> None:
     if not accounts:
         return
@@ -238,7 +244,7 @@ async def _nftoken_modify_faulty(
         return
 
     # non_owner: modify a tracked NFT the submitter doesn't own → tecNO_PERMISSION.
-    nft = choice(nfts)
+    nft = nfts.pick()
     non_owners = [a for a in accounts.values() if a.address != nft.owner]
     if not non_owners:
         return
@@ -256,7 +262,7 @@ async def _nftoken_modify_faulty(
 
 async def nftoken_create_offer(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -268,10 +274,10 @@ async def nftoken_create_offer(
 
 
 def _nftoken_create_offer_base(
-    accounts: dict[str, UserAccount], nfts: list[NFT]
+    accounts: dict[str, UserAccount], nfts: NFTSet
 ) -> tuple[NFTokenCreateOffer, Wallet] | None:
     """Valid NFTokenCreateOffer (sell or buy) + wallet; shared by valid and fuzz."""
-    nft = choice(nfts)
+    nft = nfts.pick()
     if nft.owner not in accounts:
         return None
     owner = accounts[nft.owner]
@@ -298,7 +304,7 @@ def _nftoken_create_offer_base(
 
 async def _nftoken_create_offer_valid(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -311,7 +317,7 @@ async def _nftoken_create_offer_valid(
 
 async def _nftoken_create_offer_faulty(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -340,7 +346,7 @@ async def _nftoken_create_offer_faulty(
         return
 
     # sell_not_owned: sell offer on a tracked NFT the submitter doesn't own → tecNO_PERMISSION.
-    nft = choice(nfts)
+    nft = nfts.pick()
     non_owners = [a for a in accounts.values() if a.address != nft.owner]
     if not non_owners:
         return
@@ -420,7 +426,7 @@ async def _nftoken_cancel_offer_faulty(
 
 async def nftoken_accept_offer(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -432,7 +438,7 @@ async def nftoken_accept_offer(
 
 
 def _nftoken_accept_offer_base(
-    accounts: dict[str, UserAccount], nfts: list[NFT], nft_offers: list[NFTOffer]
+    accounts: dict[str, UserAccount], nfts: NFTSet, nft_offers: list[NFTOffer]
 ) -> tuple[NFTokenAcceptOffer, Wallet] | None:
     """Valid NFTokenAcceptOffer (counterparty of a tracked offer) + wallet."""
     offer = choice(nft_offers)
@@ -446,7 +452,7 @@ def _nftoken_accept_offer_base(
             nftoken_sell_offer=offer.offer_id,
         )
         return txn, buyer.wallet
-    nft = next((n for n in nfts if n.nftoken_id == offer.nftoken_id), None)
+    nft = nfts.get(offer.nftoken_id)
     if not nft or nft.owner not in accounts:
         return None
     owner = accounts[nft.owner]
@@ -459,7 +465,7 @@ def _nftoken_accept_offer_base(
 
 async def _nftoken_accept_offer_valid(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -472,7 +478,7 @@ async def _nftoken_accept_offer_valid(
 
 async def _nftoken_accept_offer_faulty(
     accounts: dict[str, UserAccount],
-    nfts: list[NFT],
+    nfts: NFTSet,
     nft_offers: list[NFTOffer],
     client: AsyncJsonRpcClient,
 ) -> None:
@@ -514,3 +520,82 @@ async def _nftoken_accept_offer_faulty(
             nftoken_buy_offer=offer.offer_id,
         )
     await submit_tx("NFTokenAcceptOffer", txn, client, creator.wallet)
+
+
+# ── Page Density ─────────────────────────────────────────────────────
+#
+# Not a transaction type of its own: each step has every density-mode owner (see
+# workload.nftpages) mint, burn, offer away or accept a token, so a few accounts' NFTokenPages
+# fill past page boundaries and empty back out instead of every account holding one or two.
+
+
+async def nft_density(accounts: dict[str, UserAccount], client: AsyncJsonRpcClient) -> None:
+    """One step of the page-density mode: one tx per density-mode owner, concurrently."""
+    pages = nft_pages()
+    owners = pages.dense_owners(accounts)
+    filling = [o for o in owners if pages.phase(o) == FILL]
+    steps = []
+    for owner in owners:
+        built = _density_tx(accounts[owner], filling)
+        if built is None:
+            continue
+        action, key, txn, wallet = built
+        if key:
+            pages.mark(key)
+        steps.append(_density_submit(action, key, txn, wallet, client))
+    await asyncio.gather(*steps)
+
+
+def _density_tx(
+    acct: UserAccount, filling: list[str]
+) -> tuple[str, str, Transaction, Wallet] | None:
+    """(action, token or offer id it spends, tx, wallet) for ``acct``'s next density step;
+    None when it has nothing to do. A mint spends nothing, so its id is empty."""
+    pages = nft_pages()
+    inbound = pages.acceptable(acct.address)
+    if inbound:
+        # A token a draining owner handed over: taking it fills this owner's pages too.
+        offer_id = choice(inbound)
+        txn: Transaction = NFTokenAcceptOffer(account=acct.address, nftoken_sell_offer=offer_id)
+        return "accept", offer_id, txn, acct.wallet
+    if acct.address in filling:
+        txn = NFTokenMint(
+            account=acct.address,
+            nftoken_taxon=params.nft_taxon(),
+            flags=NFTokenMintFlag.TF_TRANSFERABLE,
+        )
+        return "mint", "", txn, acct.wallet
+    tokens = pages.sparsest(acct.address)
+    if not tokens:
+        return None
+    nftoken_id = choice(tokens)
+    receivers = [o for o in filling if o != acct.address]
+    if receivers and random() < 0.5:
+        txn = NFTokenCreateOffer(
+            account=acct.address,
+            nftoken_id=nftoken_id,
+            amount="0",
+            destination=choice(receivers),
+            flags=NFTokenCreateOfferFlag.TF_SELL_NFTOKEN,
+        )
+        return "transfer", nftoken_id, txn, acct.wallet
+    txn = NFTokenBurn(account=acct.address, nftoken_id=nftoken_id)
+    return "burn", nftoken_id, txn, acct.wallet
+
+
+async def _density_submit(
+    action: str, key: str, txn: Transaction, wallet: Wallet, client: AsyncJsonRpcClient
+) -> None:
+    started = time.monotonic()
+    try:
+        result = await submit_tx(txn.transaction_type.value, txn, client, wallet)
+        outcome = result.get("engine_result", "")
+    except (XRPLException, httpx.TimeoutException) as e:
+        # Uncaught, this would escape gather and fail the whole step's request; record
+        # the outcome instead.
+        outcome = type(e).__name__
+        log.warning("nft density %s: %s: %s", action, outcome, e)
+    if outcome not in ("tesSUCCESS", "terQUEUED"):
+        # No meta will release it (a tec leaves the token and offer where they were).
+        nft_pages().settle(key)
+    nft_pages().record(action, outcome, time.monotonic() - started)
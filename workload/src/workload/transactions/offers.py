@@ -5,12 +5,15 @@ from __future__ import annotations
 import xrpl.models
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models import IssuedCurrencyAmount as IOUAmount
+from xrpl.models.amounts import MPTAmount
 from xrpl.models.currencies import IssuedCurrency, MPTCurrency
 from xrpl.models.transactions import OfferCancel, OfferCreate
 from xrpl.models.transactions.offer_create import OfferCreateFlag
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import amount_for_key, asset_key, fmt
+from workload.books import books
 from workload.fuzz import submit_fuzzed
 from workload.models import AMM, TrustLine, UserAccount
 from workload.randoms import choice, randint, random, sample
@@ -53,8 +56,10 @@ def _iou_amount(asset: IssuedCurrency, value: str) -> IOUAmount:
 
 def _make_offer_amounts(
     amm: AMM,
-) -> tuple[str | IOUAmount, str | IOUAmount] | None:
-    """Build (taker_gets, taker_pays) from an AMM pair, or None if assets insufficient."""
+    account: str | None = None,
+) -> tuple[str | IOUAmount | MPTAmount, str | IOUAmount | MPTAmount] | None:
+    """Build (taker_gets, taker_pays) from an AMM pair, or None if assets insufficient.
+    With an ``account`` and a mirrored opposite book, sized against that book instead."""
     if len(amm.assets) < 2:
         return None
     a1, a2 = amm.assets[0], amm.assets[1]
@@ -64,6 +69,17 @@ def _make_offer_amounts(
     else:
         get_asset, pay_asset = a2, a1
 
+    if account is not None:
+        gk, pk = asset_key(get_asset), asset_key(pay_asset)
+        quoted = books().quote(account, gk, pk)
+        if quoted is not None:
+            give, want = quoted
+            # Give rounded up, want rounded down: rounding never spoils the priced quality.
+            return (
+                amount_for_key(gk, fmt(gk, give, up=True)),
+                amount_for_key(pk, fmt(pk, want)),
+            )
+
     # Offers are non-MPT: the non-XRP leg is always an issued currency.
     # Small amounts raise the chance of filling.
     if isinstance(get_asset, IssuedCurrency):
@@ -115,7 +131,7 @@ def _offer_create_base(
     src = _find_account_for_amm(accounts, trust_lines, amm)
     if not src:
         return None
-    pair = _make_offer_amounts(amm)
+    pair = _make_offer_amounts(amm, src.address)
     if not pair:
         return None
     taker_gets, taker_pays = pair
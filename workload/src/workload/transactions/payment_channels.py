@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections.abc import Awaitable
+
+import httpx
 from xrpl.asyncio.clients import AsyncJsonRpcClient
+from xrpl.constants import XRPLException
 from xrpl.models.transactions import (
     PaymentChannelClaim,
     PaymentChannelCreate,
     PaymentChannelFund,
 )
+from xrpl.models.transactions.transaction import Transaction
 from xrpl.wallet import Wallet
 
-from workload import params
+from workload import logging, params
+from workload.channels import CHANNELS, channels
 from workload.fuzz import submit_fuzzed
 from workload.models import PaymentChannel, UserAccount
 from workload.randoms import choice, randint
+from workload.schedule import CHANNEL_EXPIRED, schedule
 from workload.submit import submit_tx
 
+log = logging.getLogger(__name__)
+
 # ── PaymentChannelCreate ────────────────────────────────────────────
 
 
@@ -255,6 +266,10 @@ def _channel_claim_base(
     if not payment_channels:
         return None
     channel = choice(payment_channels)
+    # Past Expiration/CancelAfter any claim closes the channel: aim there half the time.
+    expired_id = schedule().ready[CHANNEL_EXPIRED].pick()
+    if expired_id is not None and choice([True, False]):
+        channel = next((c for c in payment_channels if c.channel_id == expired_id), channel)
     # Source or destination can submit a claim.
     claimer_addr = choice([channel.source, channel.destination])
     claimer = accounts.get(claimer_addr)
@@ -324,3 +339,71 @@ async def _channel_claim_faulty(
         )
 
     await submit_tx("PaymentChannelClaim", txn, client, src.wallet)
+
+
+# ── Claim Stream ────────────────────────────────────────────────────
+#
+# Not a transaction type of its own: each step streams pre-signed claims from channel
+# sources to destinations off-ledger (see workload.channels) and submits the occasional
+# redemption, top-up or new channel that the stream calls for.
+
+
+async def channel_stream(accounts: dict[str, UserAccount], client: AsyncJsonRpcClient) -> None:
+    """One engine step over up to ``CHANNEL_STREAM_CHANNELS`` channels, at most one tx per
+    account, so concurrent autofills never race for the same Sequence."""
+    engine = channels()
+    steps: list[Awaitable[None]] = []
+    busy: set[str] = set()
+    if len(engine.live(accounts)) < CHANNELS:
+        built = _channel_create_base(accounts)
+        if built is not None:
+            txn, wallet = built
+            busy.add(txn.account)
+            steps.append(_stream_submit("create", txn, wallet, client))
+    for entry in engine.streaming(accounts, CHANNELS):
+        source, destination = accounts[entry.source], accounts[entry.destination]
+        engine.presign(entry, source)
+        engine.stream(entry)
+        if entry.exhausted and source.address not in busy:
+            busy.add(source.address)
+            fund = PaymentChannelFund(
+                account=source.address,
+                channel=entry.index,
+                amount=params.channel_fund_amount(),
+            )
+            steps.append(_stream_submit("fund", fund, source.wallet, client))
+            continue
+        # Checked first: redemption() restarts the arrival count, which must only happen
+        # when the claim really goes out.
+        if destination.address in busy:
+            continue
+        picked = engine.redemption(entry)
+        if picked is None:
+            continue
+        kind, claim = picked
+        busy.add(destination.address)
+        redeem = PaymentChannelClaim(
+            account=destination.address,
+            channel=entry.index,
+            balance=str(claim.amount),
+            amount=str(claim.amount),
+            signature=claim.signature,
+            public_key=entry.public_key,
+        )
+        steps.append(_stream_submit(kind, redeem, destination.wallet, client))
+    await asyncio.gather(*steps)
+
+
+async def _stream_submit(
+    action: str, txn: Transaction, wallet: Wallet, client: AsyncJsonRpcClient
+) -> None:
+    started = time.monotonic()
+    try:
+        result = await submit_tx(txn.transaction_type.value, txn, client, wallet)
+        outcome = result.get("engine_result", "")
+    except (XRPLException, httpx.TimeoutException) as e:
+        # Uncaught, this would escape gather and fail the whole step's request; record
+        # the outcome instead.
+        outcome = type(e).__name__
+        log.warning("channel stream %s: %s: %s", action, outcome, e)
+    channels().record(action, outcome, time.monotonic() - started)
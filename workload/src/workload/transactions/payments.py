@@ -1,17 +1,26 @@
 """Payment transaction generators."""
 
+from decimal import Decimal
+
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models import IssuedCurrencyAmount as IOUAmount
 from xrpl.models.amounts import MPTAmount
-from xrpl.models.transactions import Payment
+from xrpl.models.path import PathStep
+from xrpl.models.transactions import Payment, PaymentFlag
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import XRP, AssetKey, amount_for_key, fmt, ledger_asset_key, mirror
 from workload.fuzz import submit_fuzzed
 from workload.models import MPTokenIssuance, TrustLine, UserAccount
-from workload.randoms import choice, randint, sample
+from workload.paths import path_cache
+from workload.randoms import choice, randint, random, sample
 from workload.submit import submit_tx
 
+# Accounts sampled per path payment to find a holder of the source asset and a receiver of
+# the destination one.
+_PATH_CANDIDATES = 32
+
 
 async def payment_random(
     accounts: dict[str, UserAccount],
@@ -29,7 +38,8 @@ def _payment_random_base(
     trust_lines: list[TrustLine],
     mpt_issuances: list[MPTokenIssuance],
 ) -> tuple[Payment, Wallet] | None:
-    """Valid Payment (XRP/IOU/MPT) + wallet; shared by valid and fuzz."""
+    """Valid Payment (XRP/IOU/MPT) + wallet; shared by valid and fuzz. The amount is kept
+    within what the mirror says ``src`` can spend."""
     if len(accounts) < 2:
         return None
     src_address, dst = sample(list(accounts), 2)
@@ -43,13 +53,15 @@ def _payment_random_base(
     asset_type = choice(options)
 
     if asset_type == "iou":
-        amount = _iou_amount(trust_lines)
+        amount = _iou_amount(trust_lines, src.address)
     elif asset_type == "mpt":
         amount = _mpt_amount(mpt_issuances)
     else:
         amount = params.payment_amount()
 
-    txn = Payment(account=src.address, amount=amount, destination=dst)
+    txn = Payment(
+        account=src.address, amount=mirror().solvent(src.address, amount), destination=dst
+    )
     return txn, src.wallet
 
 
@@ -66,7 +78,12 @@ async def _payment_random_valid(
     await submit_tx("Payment", txn, client, wallet)
 
 
-def _iou_amount(trust_lines: list[TrustLine]) -> IOUAmount:
+def _iou_amount(trust_lines: list[TrustLine], holder: str | None = None) -> IOUAmount:
+    """Random trust line's IOU; one ``holder`` actually holds, when the mirror knows any."""
+    held = mirror().holdings(holder) if holder else []
+    if held:
+        currency, issuer = choice(held)
+        return IOUAmount(currency=currency, issuer=issuer, value=params.iou_amount())
     tl = choice(trust_lines)
     issuer = choice([tl.account_a, tl.account_b])
     return IOUAmount(
@@ -127,3 +144,96 @@ async def _payment_random_faulty(
         )
 
     await submit_tx("Payment", txn, client, src.wallet)
+
+
+# ── Path payments ────────────────────────────────────────────────────
+#
+# Cross-currency payments with explicit Paths (see workload.paths), so the payment engine
+# builds multi-hop strands through books and AMM pools instead of a direct transfer.
+
+
+async def payment_path(accounts: dict[str, UserAccount], client: AsyncJsonRpcClient) -> None:
+    if params.should_send_faulty():
+        return await _payment_path_faulty(accounts, client)
+    return await _payment_path_valid(accounts, client)
+
+
+async def _payment_path_base(
+    accounts: dict[str, UserAccount], client: AsyncJsonRpcClient
+) -> tuple[Payment, Wallet] | None:
+    """Cross-currency Payment along cached paths + wallet; shared by valid and fuzz. The
+    sender holds the source asset and the receiver has a trust line for the delivered one,
+    per the balance mirror; SendMax is a slice of what the sender holds."""
+    picked = path_cache().pick_pair()
+    if picked is None or len(accounts) < 2:
+        return None
+    src_key, dst_key, local = picked
+    candidates = sample(list(accounts), min(_PATH_CANDIDATES, len(accounts)))
+    senders = [a for a in candidates if (mirror().available(a, src_key) or 0) > 0]
+    if not senders:
+        return None
+    src = choice(senders)
+    receivers = [a for a in candidates if a != src and _can_receive(a, dst_key)]
+    if not receivers:
+        return None
+    dst = choice(receivers)
+    value = params.offer_iou_value() if isinstance(dst_key, tuple) else params.offer_xrp_drops()
+    deliver = amount_for_key(dst_key, value)
+    found = await path_cache().lookup(src_key, dst_key, local, src, dst, deliver, client)
+    if found is None:
+        return None
+    held = mirror().available(src, src_key) or Decimal(0)
+    send_max = amount_for_key(src_key, fmt(src_key, held * Decimal(str(random() or 0.5))))
+    txn = Payment(
+        account=src,
+        destination=dst,
+        amount=deliver,
+        send_max=send_max,
+        paths=[[_path_step(s) for s in path] for path in found.paths],
+        flags=PaymentFlag.TF_PARTIAL_PAYMENT if random() < 0.3 else 0,
+    )
+    return txn, accounts[src].wallet
+
+
+def _path_step(step: dict[str, str]) -> PathStep:
+    return PathStep(
+        account=step.get("account"), currency=step.get("currency"), issuer=step.get("issuer")
+    )
+
+
+def _can_receive(address: str, key: AssetKey) -> bool:
+    return key == XRP or (isinstance(key, tuple) and mirror().iou(address, *key) is not None)
+
+
+async def _payment_path_valid(accounts: dict[str, UserAccount], client: AsyncJsonRpcClient) -> None:
+    built = await _payment_path_base(accounts, client)
+    if built is None:
+        return
+    txn, wallet = built
+    await submit_tx("PaymentPath", txn, client, wallet)
+
+
+async def _payment_path_faulty(
+    accounts: dict[str, UserAccount], client: AsyncJsonRpcClient
+) -> None:
+    built = await _payment_path_base(accounts, client)
+    if built is None:
+        return
+    base, wallet = built
+
+    mutation = choice(["dry_path", "short_send_max", "fuzz"])
+    if mutation == "fuzz":
+        await submit_fuzzed("PaymentPath", base, client, wallet)
+        return
+
+    if mutation == "dry_path":
+        # Route through an issuer nobody trusts -> tecPATH_DRY.
+        bogus = PathStep(currency="ZZZ", issuer=params.fake_account())
+        txn = base.__replace__(paths=[[bogus]])
+    else:  # short_send_max
+        # One unit of the source asset can't buy the full amount -> tecPATH_PARTIAL.
+        assert base.send_max is not None
+        raw = base.send_max if isinstance(base.send_max, str) else base.send_max.to_dict()
+        key = ledger_asset_key(raw)
+        txn = base.__replace__(send_max=amount_for_key(key, fmt(key, Decimal(0))), flags=0)
+    await submit_tx("PaymentPath", txn, client, wallet)
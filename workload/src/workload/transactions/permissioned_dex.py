@@ -6,12 +6,15 @@ from collections.abc import Callable
 
 from xrpl.asyncio.clients import AsyncJsonRpcClient
 from xrpl.models import IssuedCurrencyAmount as IOUAmount
+from xrpl.models.amounts import MPTAmount
 from xrpl.models.currencies import IssuedCurrency
 from xrpl.models.transactions import OfferCreate, Payment
 from xrpl.models.transactions.offer_create import OfferCreateFlag
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import XRP, AssetKey, amount_for_key, asset_key, fmt, mirror
+from workload.books import books
 from workload.fuzz import submit_fuzzed
 from workload.models import AMM, Credential, PermissionedDomain, UserAccount
 from workload.randoms import choice, random, sample
@@ -121,13 +124,25 @@ def _domain_offer_base(
         return None
     domain, members = picked
     member = accounts[choice(members)]
-    # Empty domain book, so the offer rests cleanly.
+    taker_gets: str | IOUAmount | MPTAmount = params.offer_xrp_drops()
+    taker_pays: str | IOUAmount | MPTAmount = IOUAmount(
+        currency=iou.currency, issuer=iou.issuer, value=params.offer_iou_value()
+    )
+    # Members bid XRP for the IOU, so the domain book rests them cleanly. A member holding
+    # the IOU sometimes takes the other side instead, sized against the mirrored bids.
+    gk: AssetKey = XRP
+    pk: AssetKey = asset_key(iou)
+    if random() < 0.5 and (mirror().available(member.address, pk) or 0) > 0:
+        gk, pk = pk, gk
+    quoted = books().quote(member.address, gk, pk, domain.domain_id)
+    if quoted is not None:
+        give, want = quoted
+        taker_gets = amount_for_key(gk, fmt(gk, give, up=True))
+        taker_pays = amount_for_key(pk, fmt(pk, want))
     base = OfferCreate(
         account=member.address,
-        taker_gets=params.offer_xrp_drops(),
-        taker_pays=IOUAmount(
-            currency=iou.currency, issuer=iou.issuer, value=params.offer_iou_value()
-        ),
+        taker_gets=taker_gets,
+        taker_pays=taker_pays,
         domain_id=domain.domain_id,
         flags=_domain_offer_flags(hybrid),
     )
@@ -17,6 +17,7 @@ from xrpl.models.transactions import (
 from xrpl.wallet import Wallet
 
 from workload import params
+from workload.balances import mirror
 from workload.fuzz import submit_fuzzed
 from workload.models import MPTokenIssuance, TrustLine, UserAccount, Vault
 from workload.randoms import choice, randint, random
@@ -173,7 +174,7 @@ def _vault_deposit_base(
     txn = VaultDeposit(
         account=depositor.address,
         vault_id=vault.vault_id,
-        amount=_amount_for_asset(vault.asset),
+        amount=mirror().solvent(depositor.address, _amount_for_asset(vault.asset)),
     )
     return txn, depositor.wallet
 
@@ -0,0 +1,74 @@
+"""Compact seed storage and lazy wallet derivation for the workload's account population.
+
+``Wallet.from_seed`` is pure-Python EC math, milliseconds per call: deriving every wallet in
+``accounts.json`` up front costs minutes at 100k accounts and hours at a million, mostly for
+wallets a run never signs with. Instead the seeds sit in one fixed-width byte buffer addressed
+by row, each ``UserAccount`` keeps only its address and row, and a wallet is derived the first
+time its account signs, then kept in an LRU of hot wallets.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from xrpl.constants import CryptoAlgorithm
+from xrpl.wallet import Wallet
+
+WALLET_CACHE = int(os.environ.get("WALLET_CACHE", "4096"))
+
+# Base58 family seeds are 29 chars (secp256k1) or 31 (ed25519, "sEd..."); shorter ones are
+# space-padded to this width.
+_SEED_WIDTH = 31
+
+
+class SeedTable:
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self.algorithm = CryptoAlgorithm.SECP256K1
+
+    def __len__(self) -> int:
+        return len(self._buf) // _SEED_WIDTH
+
+    def append(self, seed: str) -> int:
+        """Store ``seed``; returns its row."""
+        raw = seed.encode("ascii")
+        if len(raw) > _SEED_WIDTH:
+            raise ValueError(f"seed longer than {_SEED_WIDTH} chars")
+        row = len(self)
+        self._buf += raw.ljust(_SEED_WIDTH)
+        return row
+
+    def seed(self, row: int) -> str:
+        start = row * _SEED_WIDTH
+        return self._buf[start : start + _SEED_WIDTH].rstrip().decode("ascii")
+
+
+_table = SeedTable()
+
+
+def seeds() -> SeedTable:
+    return _table
+
+
+@functools.lru_cache(maxsize=WALLET_CACHE)
+def wallet_at(row: int) -> Wallet:
+    return Wallet.from_seed(_table.seed(row), algorithm=_table.algorithm)
+
+
+def read_accounts(path: Path) -> Iterator[tuple[str, str]]:
+    """``(address, seed)`` pairs from an accounts file: the JSON array prepare-workload ships,
+    or one ``{"address", "seed"}`` object per line when the name ends in ``.ndjson`` (streamed,
+    for the large synthetic populations)."""
+    if path.suffix == ".ndjson":
+        with path.open() as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    yield entry["address"], entry["seed"]
+        return
+    for entry in json.loads(path.read_text()):
+        yield entry["address"], entry["seed"]
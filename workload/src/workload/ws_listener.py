@@ -13,7 +13,14 @@ from xrpl.asyncio.clients import AsyncWebsocketClient
 from xrpl.models import StreamParameter, Subscribe, TransactionFlag
 
 from workload import logging
+from workload.ammstate import pools
 from workload.assertions import assert_ticket_used, tx_result
+from workload.balances import mirror
+from workload.books import books
+from workload.channels import channels
+from workload.loans import lifecycle
+from workload.nftpages import nft_pages
+from workload.schedule import schedule
 from workload.transactions import STATE_UPDATERS
 
 log = logging.getLogger(__name__)
@@ -76,6 +83,24 @@ def _handle_validated_tx(workload: Workload, msg: dict) -> None:
     tx_hash = msg.get("hash", "")
     account = tx.get("Account", "")
 
+    # Any validated tx can move a workload account's balances (a payment in, an offer
+    # crossed), so the mirror sees them all; it ignores accounts the workload doesn't own.
+    # Each mirror is guarded on its own: one that chokes on an unexpected node must not
+    # leave the others a tx behind, or stop the result and state updates below.
+    for name, apply in (
+        ("balances", mirror().apply),
+        ("pools", pools().apply),
+        ("books", books().apply),
+        ("schedule", schedule().apply),
+        ("lifecycle", lifecycle().apply),
+        ("nft_pages", nft_pages().apply),
+        ("channels", channels().apply),
+    ):
+        try:
+            apply(meta)
+        except Exception as e:
+            log.error("WS: %s mirror update failed for %s %s: %s", name, tx_type, tx_hash, e)
+
     if account not in workload.accounts:
         return
 
@@ -130,6 +155,10 @@ def _handle_validated_tx(workload: Workload, msg: dict) -> None:
     ):
         tx_result("PaymentMPT", result)
 
+    # Path payments: explicit Paths feed PaymentPath, whatever assets they carry.
+    if tx_type == "Payment" and tx.get("Paths"):
+        tx_result("PaymentPath", result)
+
     # Sponsorship (XLS-68): synthetic buckets on top of the two real types.
     if tx_type == "SponsorshipSet" and tx.get("Flags", 0) & _TF_SPONSORSHIP_DELETE_OBJECT:
         tx_result("SponsorshipSetDelete", result)
@@ -152,10 +181,16 @@ async def start_ws_listener(workload: Workload, ws_url: str) -> None:
     while True:
         try:
             async with AsyncWebsocketClient(ws_url) as ws:
-                await ws.send(Subscribe(streams=[StreamParameter.TRANSACTIONS]))
+                await ws.send(
+                    Subscribe(streams=[StreamParameter.TRANSACTIONS, StreamParameter.LEDGER])
+                )
                 async for msg in ws:
                     if msg.get("type") == "transaction" and msg.get("validated"):
                         _handle_validated_tx(workload, msg)
+                    elif msg.get("type") == "ledgerClosed":
+                        mirror().on_ledger_closed(msg)
+                        schedule().advance(int(msg.get("ledger_time", 0)))
+                        lifecycle().advance()
         except Exception as e:
             log.warning("WS listener disconnected: %s, reconnecting in 2s...", e)
             await asyncio.sleep(2)